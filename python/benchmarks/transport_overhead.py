@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Transport overhead benchmark
+
+Measures the client-side cost per request of the RequestsTransport and
+Urllib3Transport against a local keep-alive HTTP server, next to the
+InMemoryTransport, which shows the cost of the client core alone.
+
+Usage:
+    python benchmarks/transport_overhead.py [--requests N] [--rounds N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rocketreach.sdk.http import (  # noqa: E402
+    HttpClient,
+    InMemoryTransport,
+    RequestsTransport,
+    Response,
+    Urllib3Transport,
+)
+
+
+BODY = b'{"id":1,"name":"John Doe","status":"complete","current_employer":"Example"}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer every request with the same small JSON profile."""
+    
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.do_GET()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(client: HttpClient, requests: int, rounds: int) -> float:
+    """
+    Time lookups and searches through a client.
+    
+    Returns:
+        Median microseconds per request over the rounds
+    """
+    for _ in range(50):
+        client.get("/person/lookup", params={"id": 1})
+    
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for i in range(requests):
+            if i % 2:
+                client.post("/person/search", {"query": {"name": ["John Doe"]}, "page_size": 10})
+            else:
+                client.get("/person/lookup", params={"id": i, "lookup_type": "standard"})
+        timings.append((time.perf_counter() - started) / requests * 1e6)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='requests per round')
+    parser.add_argument('--rounds', type=int, default=5, help='rounds per transport')
+    args = parser.parse_args()
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    transports = [
+        ('InMemoryTransport (core only)', lambda: InMemoryTransport(lambda request: Response(200, {}, BODY))),
+        ('RequestsTransport', RequestsTransport),
+        ('Urllib3Transport', Urllib3Transport),
+    ]
+    
+    results = {}
+    for name, factory in transports:
+        with HttpClient(base_url, "benchmark-key", transport=factory()) as client:
+            results[name] = measure(client, args.requests, args.rounds)
+            stats = client.transport.connection_stats if not isinstance(client.transport, InMemoryTransport) else None
+        reuse = f"  reuse {stats.reuse_ratio:.1%}" if stats else ""
+        print(f"{name:32} {results[name]:8.1f} us/request{reuse}")
+    
+    server.shutdown()
+    server.server_close()
+    
+    saved = results['RequestsTransport'] - results['Urllib3Transport']
+    print(f"\nUrllib3Transport saves {saved:.1f} us/request "
+          f"({saved / results['RequestsTransport']:.0%} of the requests path)")
+
+
+if __name__ == '__main__':
+    main()
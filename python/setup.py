@@ -55,6 +55,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-mock>=3.10.0",
+            "pytest-asyncio>=0.21.0",
             "black>=23.0.0",
             "isort>=5.12.0",
             "mypy>=1.0.0",
@@ -64,6 +65,14 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-mock>=3.10.0",
+            "pytest-asyncio>=0.21.0",
+        ],
+        "http2": [
+            "httpx[http2]>=0.27.1",
+        ],
+        "compression": [
+            "brotli>=1.0.9",
+            "zstandard>=0.18.0",
         ],
     },
     entry_points={
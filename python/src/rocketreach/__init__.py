@@ -8,6 +8,6 @@ __version__ = "1.0.0"
 __author__ = "RocketReach SDK Team"
 __email__ = "sdk@rocketreach.co"
 
-from .sdk import RocketReachClient
+from .sdk import RocketReachClient, AsyncRocketReachClient
 
-__all__ = ["RocketReachClient"]
+__all__ = ["RocketReachClient", "AsyncRocketReachClient"]
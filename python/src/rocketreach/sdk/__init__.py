@@ -5,12 +5,16 @@ This module contains the main client and core functionality for the RocketReach
 """
 
 from .client import RocketReachClient
+from .async_client import AsyncRocketReachClient
+from .bulk import BulkExecutor, BulkResult
 from .exceptions import (
     RocketReachException,
     ApiException,
     InvalidApiKeyException,
     RateLimitException,
     NetworkException,
+    CircuitOpenException,
+    DeadlineExceededException,
 )
 from .models import (
     SearchQuery,
@@ -22,11 +26,16 @@ from .models import (
 
 __all__ = [
     "RocketReachClient",
+    "AsyncRocketReachClient",
+    "BulkExecutor",
+    "BulkResult",
     "RocketReachException",
     "ApiException",
     "InvalidApiKeyException",
     "RateLimitException",
     "NetworkException",
+    "CircuitOpenException",
+    "DeadlineExceededException",
     "SearchQuery",
     "LookupQuery",
     "SearchResponse",
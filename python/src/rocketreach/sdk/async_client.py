@@ -0,0 +1,184 @@
+"""
+Async RocketReach Client
+
+Asyncio client class for interacting with the RocketReach API.
+"""
+
+from typing import Optional, Dict, Any
+from .exceptions import InvalidApiKeyException
+from .endpoints import AsyncPeopleSearch, AsyncPersonLookup, AsyncPersonEnrich
+from .http import AsyncHttpClient, CompressionStats, CacheStats
+
+
+class AsyncRocketReachClient:
+    """
+    Asyncio client for interacting with the RocketReach API.
+    
+    Offers the same fluent interface as RocketReachClient, but executing a
+    query returns a coroutine, so one event loop can keep many requests in
+    flight over a shared connection pool.
+    
+    Args:
+        api_key (str): Your RocketReach API key
+        base_url (str, optional): Base URL for the API. Defaults to production URL.
+        timeout (int, optional): Request timeout in seconds. Defaults to 30.
+        retry_attempts (int, optional): Number of retry attempts for failed requests. Defaults to 3.
+        retry_delay (float, optional): Delay between retry attempts in seconds. Defaults to 1.0.
+        http2 (bool, optional): Send requests over multiplexed HTTP/2 connections.
+            Defaults to False.
+        **http_options: Additional settings passed to AsyncHttpClient (see AsyncHttpClient).
+        
+    Example:
+        >>> async with AsyncRocketReachClient("your-api-key") as client:
+        ...     results = await client.people_search().name(["John Doe"]).search()
+        ...     person = await client.person_lookup().name("John Doe").lookup()
+    """
+    
+    DEFAULT_BASE_URL = "https://api.rocketreach.co/api/v2"
+    DEFAULT_TIMEOUT = 30
+    DEFAULT_RETRY_ATTEMPTS = 3
+    DEFAULT_RETRY_DELAY = 1.0
+    
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        http2: bool = False,
+        **http_options: Any,
+    ):
+        if not api_key or not api_key.strip():
+            raise InvalidApiKeyException("API key cannot be empty")
+        
+        self._api_key = api_key.strip()
+        self._base_url = base_url or self.DEFAULT_BASE_URL
+        self._timeout = timeout
+        self._retry_attempts = retry_attempts
+        self._retry_delay = retry_delay
+        
+        # Initialize HTTP client
+        self._http_client = AsyncHttpClient(
+            base_url=self._base_url,
+            api_key=self._api_key,
+            timeout=self._timeout,
+            retry_attempts=self._retry_attempts,
+            retry_delay=self._retry_delay,
+            http2=http2,
+            **http_options,
+        )
+    
+    @property
+    def api_key(self) -> str:
+        """Get the API key."""
+        return self._api_key
+    
+    @property
+    def base_url(self) -> str:
+        """Get the base URL."""
+        return self._base_url
+    
+    @property
+    def timeout(self) -> int:
+        """Get the request timeout."""
+        return self._timeout
+    
+    @property
+    def retry_attempts(self) -> int:
+        """Get the number of retry attempts."""
+        return self._retry_attempts
+    
+    @property
+    def retry_delay(self) -> float:
+        """Get the retry delay."""
+        return self._retry_delay
+    
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """Get the response body sizes received and decoded by the underlying HTTP client."""
+        return self._http_client.compression_stats
+    
+    @property
+    def coalesced_requests(self) -> int:
+        """Get the number of lookups and enrichments that joined an identical call in flight."""
+        return self._http_client.single_flight.coalesced
+    
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Get the hit, miss and eviction counters of the response cache, or None without a cache."""
+        return self._http_client.cache_stats
+    
+    def people_search(self) -> AsyncPeopleSearch:
+        """
+        Create a new People Search request builder.
+        
+        Every call returns an independent builder with its own query, so
+        threads sharing one client cannot change each other's requests.
+        
+        Returns:
+            AsyncPeopleSearch: A fresh people search endpoint client
+        """
+        return AsyncPeopleSearch(self._http_client)
+    
+    def person_lookup(self) -> AsyncPersonLookup:
+        """
+        Create a new Person Lookup request builder with an empty query.
+        
+        Returns:
+            AsyncPersonLookup: A fresh person lookup endpoint client
+        """
+        return AsyncPersonLookup(self._http_client)
+    
+    def person_enrich(self) -> AsyncPersonEnrich:
+        """
+        Create a new Person Enrich request builder with an empty query.
+        
+        Returns:
+            AsyncPersonEnrich: A fresh person enrich endpoint client
+        """
+        return AsyncPersonEnrich(self._http_client)
+    
+    async def get_account_info(self) -> Dict[str, Any]:
+        """
+        Get account information and usage statistics.
+        
+        Returns:
+            Dict[str, Any]: Account information including credits, usage, etc.
+            
+        Raises:
+            ApiException: If the API request fails
+        """
+        return await self._http_client.get("/account")
+    
+    async def get_health_status(self) -> Dict[str, Any]:
+        """
+        Check the health status of the API.
+        
+        Returns:
+            Dict[str, Any]: Health status information
+            
+        Raises:
+            ApiException: If the API request fails
+        """
+        return await self._http_client.get("/health")
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http_client.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    def __repr__(self) -> str:
+        """String representation of the client."""
+        return f"AsyncRocketReachClient(api_key='{self._api_key[:8]}...', base_url='{self._base_url}')"
+    
+    def __str__(self) -> str:
+        """String representation of the client."""
+        return self.__repr__()
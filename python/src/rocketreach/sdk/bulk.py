@@ -0,0 +1,160 @@
+"""
+Bulk Execution
+
+Runs many API calls on a thread pool without parking threads on rate limits.
+"""
+
+import heapq
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+from .exceptions import RateLimitException
+from .http import defer_rate_limits
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+@dataclass
+class BulkResult(Generic[T, R]):
+    """
+    Outcome of one item of a bulk run.
+    
+    Exactly one of ``value`` and ``error`` is set.
+    """
+    
+    item: T
+    value: Optional[R] = None
+    error: Optional[BaseException] = None
+    requeues: int = 0
+    
+    @property
+    def ok(self) -> bool:
+        """Check if the call succeeded."""
+        return self.error is None
+
+
+class BulkExecutor:
+    """
+    Thread pool for bulk API workloads.
+    
+    Calls run with rate limit waits deferred: a call that receives a 429 is
+    put back on a queue with a due time taken from its Retry-After, and
+    dispatch pauses for every worker until then, so no request is sent into
+    the throttle window. A call held back by a client-side rate limiter is
+    requeued the same way, pausing dispatch until the limiter has a token,
+    without counting as a requeue. Workers with nothing ready wait on a
+    condition until the pause ends, so no thread is held inside an HTTP call
+    stack while throttled.
+    
+    Args:
+        max_workers: Number of worker threads
+        max_requeues: Number of times an item may be deferred by a 429
+            before its RateLimitException is reported as the result
+        default_retry_after: Deferral in seconds when the 429 has no Retry-After
+        clock: Monotonic clock, overridable for testing
+        
+    Example:
+        >>> executor = BulkExecutor(max_workers=16)
+        >>> results = executor.map(fetch_person, person_ids)
+        >>> people = [result.value for result in results if result.ok]
+    """
+    
+    def __init__(
+        self,
+        max_workers: int = 8,
+        max_requeues: int = 5,
+        default_retry_after: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        self.max_workers = max_workers
+        self.max_requeues = max_requeues
+        self.default_retry_after = default_retry_after
+        self._clock = clock
+    
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> List[BulkResult]:
+        """
+        Call ``func`` for every item.
+        
+        Args:
+            func: Function making the API call for one item
+            items: Items to process
+            
+        Returns:
+            One BulkResult per item, in input order
+        """
+        results = [BulkResult(item) for item in items]
+        if not results:
+            return results
+        
+        # Queue entries are (due_time, sequence, index); the sequence keeps
+        # the heap stable for items that are due at the same time.
+        queue: List[Tuple[float, int, int]] = [(0.0, index, index) for index in range(len(results))]
+        # Nothing is dispatched before paused_until, the end of the last
+        # throttle window seen by any worker.
+        state = {'sequence': len(results), 'remaining': len(results), 'paused_until': 0.0}
+        condition = threading.Condition()
+        
+        def next_index() -> Optional[int]:
+            with condition:
+                while True:
+                    if state['remaining'] == 0:
+                        return None
+                    if queue:
+                        wait = max(queue[0][0], state['paused_until']) - self._clock()
+                        if wait <= 0:
+                            return heapq.heappop(queue)[2]
+                        condition.wait(wait)
+                    else:
+                        condition.wait()
+        
+        def worker() -> None:
+            while True:
+                index = next_index()
+                if index is None:
+                    return
+                
+                result = results[index]
+                deferred_for = None
+                try:
+                    with defer_rate_limits():
+                        result.value = func(result.item)
+                except RateLimitException as e:
+                    # Client-side limiter waits carry no status code; they
+                    # are not a verdict from the server and are always retried
+                    if e.status_code is None:
+                        deferred_for = e.retry_after
+                    elif result.requeues < self.max_requeues:
+                        result.requeues += 1
+                        deferred_for = e.retry_after if e.retry_after is not None else self.default_retry_after
+                    else:
+                        result.error = e
+                except BaseException as e:
+                    # Exceptions outside Exception, such as SystemExit, are
+                    # results too; a dead worker would leave map() waiting
+                    result.error = e
+                finally:
+                    with condition:
+                        if deferred_for is not None:
+                            due = self._clock() + deferred_for
+                            state['paused_until'] = max(state['paused_until'], due)
+                            heapq.heappush(queue, (due, state['sequence'], index))
+                            state['sequence'] += 1
+                        else:
+                            state['remaining'] -= 1
+                        condition.notify_all()
+        
+        threads = [
+            threading.Thread(target=worker, name=f"rocketreach-bulk-{number}", daemon=True)
+            for number in range(min(self.max_workers, len(results)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        return results
@@ -8,7 +8,7 @@ from typing import Optional, Dict, Any
 import requests
 from .exceptions import InvalidApiKeyException, ApiException
 from .endpoints import PeopleSearch, PersonLookup, PersonEnrich
-from .http import HttpClient
+from .http import HttpClient, Http2Client, ConnectionStats, CompressionStats, CacheStats
 
 
 class RocketReachClient:
@@ -24,6 +24,9 @@ class RocketReachClient:
         timeout (int, optional): Request timeout in seconds. Defaults to 30.
         retry_attempts (int, optional): Number of retry attempts for failed requests. Defaults to 3.
         retry_delay (float, optional): Delay between retry attempts in seconds. Defaults to 1.0.
+        http2 (bool, optional): Send requests over multiplexed HTTP/2 connections
+            (see Http2Client). Defaults to False.
+        **http_options: Additional settings passed to HttpClient (see HttpClient).
     
     Example:
         >>> client = RocketReachClient("your-api-key")
@@ -44,6 +47,8 @@ class RocketReachClient:
         timeout: int = DEFAULT_TIMEOUT,
         retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        http2: bool = False,
+        **http_options: Any,
     ):
         if not api_key or not api_key.strip():
             raise InvalidApiKeyException("API key cannot be empty")
@@ -55,18 +60,15 @@ class RocketReachClient:
         self._retry_delay = retry_delay
         
         # Initialize HTTP client
-        self._http_client = HttpClient(
+        http_client_class = Http2Client if http2 else HttpClient
+        self._http_client = http_client_class(
             base_url=self._base_url,
             api_key=self._api_key,
             timeout=self._timeout,
             retry_attempts=self._retry_attempts,
             retry_delay=self._retry_delay,
+            **http_options,
         )
-        
-        # Initialize endpoint clients
-        self._people_search = PeopleSearch(self._http_client)
-        self._person_lookup = PersonLookup(self._http_client)
-        self._person_enrich = PersonEnrich(self._http_client)
     
     @property
     def api_key(self) -> str:
@@ -93,32 +95,55 @@ class RocketReachClient:
         """Get the retry delay."""
         return self._retry_delay
     
+    @property
+    def connection_stats(self) -> Optional[ConnectionStats]:
+        """Get the connection reuse counters of the underlying HTTP client, or None over HTTP/2."""
+        return self._http_client.connection_stats
+    
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """Get the response body sizes received and decoded by the underlying HTTP client."""
+        return self._http_client.compression_stats
+    
+    @property
+    def coalesced_requests(self) -> int:
+        """Get the number of lookups and enrichments that joined an identical call in flight."""
+        return self._http_client.single_flight.coalesced
+    
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Get the hit, miss and eviction counters of the response cache, or None without a cache."""
+        return self._http_client.cache_stats
+    
     def people_search(self) -> PeopleSearch:
         """
-        Get the People Search endpoint client.
+        Create a new People Search request builder.
+        
+        Every call returns an independent builder with its own query, so
+        threads sharing one client cannot change each other's requests.
         
         Returns:
-            PeopleSearch: The people search endpoint client
+            PeopleSearch: A fresh people search endpoint client
         """
-        return self._people_search
+        return PeopleSearch(self._http_client)
     
     def person_lookup(self) -> PersonLookup:
         """
-        Get the Person Lookup endpoint client.
+        Create a new Person Lookup request builder with an empty query.
         
         Returns:
-            PersonLookup: The person lookup endpoint client
+            PersonLookup: A fresh person lookup endpoint client
         """
-        return self._person_lookup
+        return PersonLookup(self._http_client)
     
     def person_enrich(self) -> PersonEnrich:
         """
-        Get the Person Enrich endpoint client.
+        Create a new Person Enrich request builder with an empty query.
         
         Returns:
-            PersonEnrich: The person enrich endpoint client
+            PersonEnrich: A fresh person enrich endpoint client
         """
-        return self._person_enrich
+        return PersonEnrich(self._http_client)
     
     def get_account_info(self) -> Dict[str, Any]:
         """
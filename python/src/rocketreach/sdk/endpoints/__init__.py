@@ -4,12 +4,15 @@ API Endpoints
 Endpoint classes for different RocketReach API operations.
 """
 
-from .people_search import PeopleSearch
-from .person_lookup import PersonLookup
-from .person_enrich import PersonEnrich
+from .people_search import PeopleSearch, AsyncPeopleSearch
+from .person_lookup import PersonLookup, AsyncPersonLookup
+from .person_enrich import PersonEnrich, AsyncPersonEnrich
 
 __all__ = [
     "PeopleSearch",
     "PersonLookup", 
     "PersonEnrich",
+    "AsyncPeopleSearch",
+    "AsyncPersonLookup",
+    "AsyncPersonEnrich",
 ]
@@ -4,9 +4,14 @@ People Search Endpoint
 Handles people search operations.
 """
 
-from typing import List, Optional, Union, Dict, Any
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, List, Optional, Union
 from ..models import SearchQuery, SearchResponse
-from ..http import HttpClient
+from ..http import HttpClient, AsyncHttpClient
 
 
 class PeopleSearch:
@@ -242,33 +247,171 @@ class PeopleSearch:
         self._query.set_order_by(order_by)
         return self
     
-    def search(self) -> SearchResponse:
+    def search(self, deadline: Optional[float] = None) -> SearchResponse:
         """
         Execute the search with the current query parameters.
         
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
         Returns:
             SearchResponse containing the search results
             
         Raises:
             ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
+        """
+        response_data = self._http_client.post('/person/search', data=self._build_payload(), idempotent=True, deadline=deadline)
+        return SearchResponse(response_data)
+    
+    def iter_pages(
+        self,
+        max_results: Optional[int] = None,
+        deadline: Optional[float] = None,
+        prefetch: int = 0,
+    ) -> Iterator[SearchResponse]:
+        """
+        Fetch the result pages one after another, starting at the query page.
+        
+        The next page is only requested once the caller asks for it, and the
+        previous page is released before, so at most one page is held at a
+        time. The query itself is not changed.
+        
+        With ``prefetch``, once the first page reports the total, up to that
+        many of the following pages are fetched concurrently while the
+        caller works through the current one. Pages are still yielded in
+        order, and at most ``prefetch`` of them are held ahead.
+        
+        Args:
+            max_results: Stop once this many profiles have been fetched.
+                The last page is not truncated. Defaults to all pages.
+            deadline: Seconds each page request may take across all retries.
+                Defaults to the client deadline.
+            prefetch: Number of pages to fetch ahead concurrently, 0 to
+                fetch one page at a time
+            
+        Yields:
+            SearchResponse of each page
+            
+        Raises:
+            ApiException: If an API request fails
+            DeadlineExceededException: If the deadline of a page runs out
+        """
+        page: Optional[int] = self._query.page
+        fetched = 0
+        while page is not None and (max_results is None or fetched < max_results):
+            response = self._fetch_page(page, deadline)
+            fetched += response.count
+            page = _next_page(page, response)
+            pages = _prefetch_range(page, response, self._query.page_size, max_results, fetched) if prefetch > 0 else None
+            yield response
+            del response
+            if pages is not None:
+                remaining = max_results - fetched if max_results is not None else None
+                yield from self._iter_prefetched_pages(pages, remaining, prefetch, deadline)
+                return
+    
+    def _fetch_page(self, page: int, deadline: Optional[float]) -> SearchResponse:
+        """Fetch one result page."""
+        return SearchResponse(
+            self._http_client.post('/person/search', data=self._build_payload(page), idempotent=True, deadline=deadline)
+        )
+    
+    def _iter_prefetched_pages(
+        self,
+        pages: range,
+        remaining: Optional[int],
+        prefetch: int,
+        deadline: Optional[float],
+    ) -> Iterator[SearchResponse]:
+        """Fetch pages from a thread pool, keeping up to ``prefetch`` requests ahead, and yield them in order."""
+        pending = iter(pages)
+        window: Deque[Future] = deque()
+        # Not a with block: stopping early must not wait for the requests in flight
+        pool = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix='rocketreach-prefetch')
+        try:
+            for page in islice(pending, prefetch):
+                window.append(pool.submit(self._fetch_page, page, deadline))
+            while window:
+                response = window.popleft().result()
+                for page in islice(pending, 1):
+                    window.append(pool.submit(self._fetch_page, page, deadline))
+                if response.is_empty:
+                    return
+                last = not response.has_next_page
+                if remaining is not None:
+                    remaining -= response.count
+                    last = last or remaining <= 0
+                yield response
+                del response
+                if last:
+                    return
+        finally:
+            for future in window:
+                future.cancel()
+            pool.shutdown(wait=False)
+    
+    def iter_profiles(
+        self,
+        max_results: Optional[int] = None,
+        deadline: Optional[float] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the profiles of all result pages.
+        
+        Pages are fetched lazily by iter_pages(), one at a time unless
+        ``prefetch`` is set.
+        
+        Args:
+            max_results: Maximum number of profiles to yield. Defaults to all.
+            deadline: Seconds each page request may take across all retries.
+                Defaults to the client deadline.
+            prefetch: Number of pages to fetch ahead concurrently, 0 to
+                fetch one page at a time
+            
+        Yields:
+            Each profile in result order
+            
+        Raises:
+            ApiException: If an API request fails
+            DeadlineExceededException: If the deadline of a page runs out
+        """
+        remaining = max_results
+        for response in self.iter_pages(max_results, deadline, prefetch):
+            profiles = response.profiles if remaining is None else response.profiles[:remaining]
+            del response
+            for profile in profiles:
+                yield profile
+            if remaining is not None:
+                remaining -= len(profiles)
+            del profiles
+    
+    def _build_payload(self, page: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build the request body for the current query parameters.
+        
+        Args:
+            page: Page to request instead of the query page
+            
+        Returns:
+            Dict containing the search request body
         """
         query_data = self._query.to_dict()
         
         # Extract pagination and ordering parameters from query
-        page = query_data.pop('page', 1)
+        query_page = query_data.pop('page', 1)
         page_size = query_data.pop('page_size', 10)
         order_by = query_data.pop('order_by', 'relevance')
         
         # Create payload with query object and top-level pagination/ordering
-        payload = {
+        return {
             "query": query_data,
-            "page": page,
+            "page": query_page if page is None else page,
             "page_size": page_size,
             "order_by": order_by
         }
-        
-        response_data = self._http_client.post('/person/search', data=payload)
-        return SearchResponse(response_data)
     
     def reset(self) -> 'PeopleSearch':
         """
@@ -279,3 +422,204 @@ class PeopleSearch:
         """
         self._query = SearchQuery()
         return self
+
+
+class AsyncPeopleSearch(PeopleSearch):
+    """
+    Asyncio People Search endpoint client.
+    
+    Shares the fluent filter methods of PeopleSearch; only the search
+    itself is a coroutine.
+    """
+    
+    def __init__(self, http_client: AsyncHttpClient):
+        super().__init__(http_client)
+    
+    async def search(self, deadline: Optional[float] = None) -> SearchResponse:
+        """
+        Execute the search with the current query parameters.
+        
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            SearchResponse containing the search results
+            
+        Raises:
+            ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
+        """
+        response_data = await self._http_client.post('/person/search', data=self._build_payload(), idempotent=True, deadline=deadline)
+        return SearchResponse(response_data)
+    
+    async def iter_pages(
+        self,
+        max_results: Optional[int] = None,
+        deadline: Optional[float] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[SearchResponse]:
+        """
+        Fetch the result pages one after another, starting at the query page.
+        
+        The next page is only requested once the caller asks for it, and the
+        previous page is released before, so at most one page is held at a
+        time. The query itself is not changed.
+        
+        With ``prefetch``, once the first page reports the total, up to that
+        many of the following pages are fetched concurrently while the
+        caller works through the current one. Pages are still yielded in
+        order, and at most ``prefetch`` of them are held ahead.
+        
+        Args:
+            max_results: Stop once this many profiles have been fetched.
+                The last page is not truncated. Defaults to all pages.
+            deadline: Seconds each page request may take across all retries.
+                Defaults to the client deadline.
+            prefetch: Number of pages to fetch ahead concurrently, 0 to
+                fetch one page at a time
+            
+        Yields:
+            SearchResponse of each page
+            
+        Raises:
+            ApiException: If an API request fails
+            DeadlineExceededException: If the deadline of a page runs out
+        """
+        page: Optional[int] = self._query.page
+        fetched = 0
+        while page is not None and (max_results is None or fetched < max_results):
+            response = await self._fetch_page(page, deadline)
+            fetched += response.count
+            page = _next_page(page, response)
+            pages = _prefetch_range(page, response, self._query.page_size, max_results, fetched) if prefetch > 0 else None
+            yield response
+            del response
+            if pages is not None:
+                remaining = max_results - fetched if max_results is not None else None
+                async for response in self._iter_prefetched_pages(pages, remaining, prefetch, deadline):
+                    yield response
+                return
+    
+    async def _fetch_page(self, page: int, deadline: Optional[float]) -> SearchResponse:
+        """Fetch one result page."""
+        return SearchResponse(
+            await self._http_client.post('/person/search', data=self._build_payload(page), idempotent=True, deadline=deadline)
+        )
+    
+    async def _iter_prefetched_pages(
+        self,
+        pages: range,
+        remaining: Optional[int],
+        prefetch: int,
+        deadline: Optional[float],
+    ) -> AsyncIterator[SearchResponse]:
+        """Fetch pages in tasks, keeping up to ``prefetch`` requests ahead, and yield them in order."""
+        pending = iter(pages)
+        window: Deque[asyncio.Future] = deque()
+        try:
+            for page in islice(pending, prefetch):
+                window.append(asyncio.ensure_future(self._fetch_page(page, deadline)))
+            while window:
+                response = await window.popleft()
+                for page in islice(pending, 1):
+                    window.append(asyncio.ensure_future(self._fetch_page(page, deadline)))
+                if response.is_empty:
+                    return
+                last = not response.has_next_page
+                if remaining is not None:
+                    remaining -= response.count
+                    last = last or remaining <= 0
+                yield response
+                del response
+                if last:
+                    return
+        finally:
+            for task in window:
+                if not task.cancel() and not task.cancelled():
+                    task.exception()
+    
+    async def iter_profiles(
+        self,
+        max_results: Optional[int] = None,
+        deadline: Optional[float] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the profiles of all result pages.
+        
+        Pages are fetched lazily by iter_pages(), one at a time unless
+        ``prefetch`` is set.
+        
+        Args:
+            max_results: Maximum number of profiles to yield. Defaults to all.
+            deadline: Seconds each page request may take across all retries.
+                Defaults to the client deadline.
+            prefetch: Number of pages to fetch ahead concurrently, 0 to
+                fetch one page at a time
+            
+        Yields:
+            Each profile in result order
+            
+        Raises:
+            ApiException: If an API request fails
+            DeadlineExceededException: If the deadline of a page runs out
+        """
+        remaining = max_results
+        async for response in self.iter_pages(max_results, deadline, prefetch):
+            profiles = response.profiles if remaining is None else response.profiles[:remaining]
+            del response
+            for profile in profiles:
+                yield profile
+            if remaining is not None:
+                remaining -= len(profiles)
+            del profiles
+
+
+def _prefetch_range(
+    next_page: Optional[int],
+    response: SearchResponse,
+    page_size: int,
+    max_results: Optional[int],
+    fetched: int,
+) -> Optional[range]:
+    """
+    Get the pages left to fetch, as far as the first response tells.
+    
+    Args:
+        next_page: Page following the response, or None after the last one
+        response: The first page response
+        page_size: Profiles per page
+        max_results: Profiles wanted in total, or None for all
+        fetched: Profiles fetched so far
+        
+    Returns:
+        The remaining pages, or None if there are none or the response does
+        not report a total
+    """
+    if next_page is None or response.total <= 0 or page_size <= 0:
+        return None
+    last_page = math.ceil(response.total / page_size)
+    if max_results is not None:
+        last_page = min(last_page, next_page - 1 + math.ceil((max_results - fetched) / page_size))
+    if last_page < next_page:
+        return None
+    return range(next_page, last_page + 1)
+
+
+def _next_page(page: int, response: SearchResponse) -> Optional[int]:
+    """
+    Get the page to request after a response.
+    
+    Args:
+        page: Page the response answered
+        response: The page response
+        
+    Returns:
+        The next page, or None after the last page, an empty page or a
+        pagination that does not move forward
+    """
+    next_page = response.next_page
+    if response.is_empty or next_page is None or next_page <= page:
+        return None
+    return next_page
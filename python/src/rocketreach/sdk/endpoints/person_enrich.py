@@ -6,7 +6,8 @@ Handles person enrichment operations.
 
 from typing import Optional, Union, Dict, Any
 from ..models import LookupQuery, EnrichResponse
-from ..http import HttpClient
+from ..http import HttpClient, AsyncHttpClient
+from ..http.cache import lookup_through, async_lookup_through
 
 
 class PersonEnrich:
@@ -112,18 +113,27 @@ class PersonEnrich:
         self._query.set_npi_number(npi)
         return self
     
-    def enrich(self) -> EnrichResponse:
+    def enrich(self, deadline: Optional[float] = None) -> EnrichResponse:
         """
         Execute the enrichment with the current query parameters.
         
+        Concurrent enrichments of equivalent queries (see LookupQuery.fingerprint())
+        share a single API call, and completed results are answered from the
+        client cache if one is set. Queries that found no match fail again
+        from the negative cache, if one is set, without another API call.
+        
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
         Returns:
             EnrichResponse containing the enriched person and company data
             
         Raises:
             ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
         """
-        params = self._query.to_dict()
-        response_data = self._http_client.get('/profile-company/lookup', params=params)
+        response_data = lookup_through(self._http_client, '/profile-company/lookup', self._query, deadline)
         return EnrichResponse(response_data)
     
     def reset(self) -> 'PersonEnrich':
@@ -135,3 +145,38 @@ class PersonEnrich:
         """
         self._query = LookupQuery()
         return self
+
+
+class AsyncPersonEnrich(PersonEnrich):
+    """
+    Asyncio Person Enrich endpoint client.
+    
+    Shares the fluent identifier methods of PersonEnrich; only the enrichment
+    itself is a coroutine.
+    """
+    
+    def __init__(self, http_client: AsyncHttpClient):
+        super().__init__(http_client)
+    
+    async def enrich(self, deadline: Optional[float] = None) -> EnrichResponse:
+        """
+        Execute the enrichment with the current query parameters.
+        
+        Concurrent enrichments of equivalent queries (see LookupQuery.fingerprint())
+        share a single API call, and completed results are answered from the
+        client cache if one is set. Queries that found no match fail again
+        from the negative cache, if one is set, without another API call.
+        
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            EnrichResponse containing the enriched person and company data
+            
+        Raises:
+            ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
+        """
+        response_data = await async_lookup_through(self._http_client, '/profile-company/lookup', self._query, deadline)
+        return EnrichResponse(response_data)
@@ -6,7 +6,8 @@ Handles person lookup operations.
 
 from typing import Optional, Union, Dict, Any
 from ..models import LookupQuery, PersonResponse
-from ..http import HttpClient
+from ..http import HttpClient, AsyncHttpClient
+from ..http.cache import lookup_through, async_lookup_through
 
 
 class PersonLookup:
@@ -112,18 +113,27 @@ class PersonLookup:
         self._query.set_npi_number(npi)
         return self
     
-    def lookup(self) -> PersonResponse:
+    def lookup(self, deadline: Optional[float] = None) -> PersonResponse:
         """
         Execute the lookup with the current query parameters.
         
+        Concurrent lookups of equivalent queries (see LookupQuery.fingerprint())
+        share a single API call, and completed results are answered from the
+        client cache if one is set. Queries that found no match fail again
+        from the negative cache, if one is set, without another API call.
+        
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
         Returns:
             PersonResponse containing the person data
             
         Raises:
             ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
         """
-        params = self._query.to_dict()
-        response_data = self._http_client.get('/person/lookup', params=params)
+        response_data = lookup_through(self._http_client, '/person/lookup', self._query, deadline)
         return PersonResponse(response_data)
     
     def reset(self) -> 'PersonLookup':
@@ -135,3 +145,38 @@ class PersonLookup:
         """
         self._query = LookupQuery()
         return self
+
+
+class AsyncPersonLookup(PersonLookup):
+    """
+    Asyncio Person Lookup endpoint client.
+    
+    Shares the fluent identifier methods of PersonLookup; only the lookup
+    itself is a coroutine.
+    """
+    
+    def __init__(self, http_client: AsyncHttpClient):
+        super().__init__(http_client)
+    
+    async def lookup(self, deadline: Optional[float] = None) -> PersonResponse:
+        """
+        Execute the lookup with the current query parameters.
+        
+        Concurrent lookups of equivalent queries (see LookupQuery.fingerprint())
+        share a single API call, and completed results are answered from the
+        client cache if one is set. Queries that found no match fail again
+        from the negative cache, if one is set, without another API call.
+        
+        Args:
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            PersonResponse containing the person data
+            
+        Raises:
+            ApiException: If the API request fails
+            DeadlineExceededException: If the deadline runs out
+        """
+        response_data = await async_lookup_through(self._http_client, '/person/lookup', self._query, deadline)
+        return PersonResponse(response_data)
@@ -5,7 +5,7 @@ Custom exceptions for the RocketReach SDK.
 """
 
 from .base import RocketReachException, ApiException
-from .api import InvalidApiKeyException, RateLimitException, NetworkException
+from .api import InvalidApiKeyException, RateLimitException, NetworkException, CircuitOpenException, DeadlineExceededException
 
 __all__ = [
     "RocketReachException",
@@ -13,4 +13,6 @@ __all__ = [
     "InvalidApiKeyException",
     "RateLimitException",
     "NetworkException",
+    "CircuitOpenException",
+    "DeadlineExceededException",
 ]
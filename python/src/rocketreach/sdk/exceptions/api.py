@@ -71,3 +71,55 @@ class NetworkException(ApiException):
         **kwargs
     ):
         super().__init__(message, status_code, response_text, details, *args, **kwargs)
+
+
+class CircuitOpenException(NetworkException):
+    """
+    Exception raised when a request is rejected by an open circuit breaker.
+    """
+    
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        retry_after: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs
+    ):
+        super().__init__(message, None, None, details, *args, **kwargs)
+        self.retry_after = retry_after
+    
+    def __str__(self) -> str:
+        """String representation of the exception."""
+        parts = [self.message]
+        
+        if self.retry_after is not None:
+            parts.append(f"Retry after: {self.retry_after:.1f} seconds")
+        
+        return " | ".join(parts)
+
+
+class DeadlineExceededException(NetworkException):
+    """
+    Exception raised when a call runs out of its end-to-end deadline.
+    """
+    
+    def __init__(
+        self,
+        message: str = "Deadline exceeded",
+        deadline: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None,
+        *args,
+        **kwargs
+    ):
+        super().__init__(message, None, None, details, *args, **kwargs)
+        self.deadline = deadline
+    
+    def __str__(self) -> str:
+        """String representation of the exception."""
+        parts = [self.message]
+        
+        if self.deadline is not None:
+            parts.append(f"Deadline: {self.deadline} seconds")
+        
+        return " | ".join(parts)
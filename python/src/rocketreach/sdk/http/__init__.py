@@ -1,9 +1,77 @@
 """
 HTTP Client Module
 
-This module contains the HTTP client for making API requests.
+This module contains the HTTP clients for making API requests.
 """
 
-from .client import HttpClient
+from .base import BaseHttpClient
+from .client import HttpClient, defer_rate_limits
+from .async_client import AsyncHttpClient
+from .http2 import Http2Client
+from .rate_limit import RateLimiter, TokenBucket, SqliteRateLimiter, QuotaPacer, RateLimitState
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker
+from .retry import RetryBudget
+from .deadline import Deadline
+from .hedging import HedgingPolicy
+from .single_flight import SingleFlight, AsyncSingleFlight, request_key, query_key
+from .cache import ResponseCache, MemoryCache, SqliteCache, TieredCache, CacheStats
+from .pool import ConnectionStats, PooledHTTPAdapter
+from .compression import CompressionStats
+from .transport import (
+    Request,
+    Response,
+    Transport,
+    AsyncTransport,
+    TransportError,
+    TransportTimeout,
+    TransportConnectionError,
+    InMemoryTransport,
+    AsyncInMemoryTransport,
+)
+from .requests_transport import RequestsTransport
+from .urllib3_transport import Urllib3Transport
+from .httpx_transport import HttpxTransport, AsyncHttpxTransport
 
-__all__ = ["HttpClient"]
+__all__ = [
+    "BaseHttpClient",
+    "HttpClient",
+    "defer_rate_limits",
+    "AsyncHttpClient",
+    "Http2Client",
+    "RateLimiter",
+    "TokenBucket",
+    "SqliteRateLimiter",
+    "QuotaPacer",
+    "RateLimitState",
+    "AdaptiveConcurrencyLimiter",
+    "CircuitBreaker",
+    "RetryBudget",
+    "Deadline",
+    "HedgingPolicy",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "request_key",
+    "query_key",
+    "ResponseCache",
+    "MemoryCache",
+    "SqliteCache",
+    "TieredCache",
+    "CacheStats",
+    "ConnectionStats",
+    "PooledHTTPAdapter",
+    "CompressionStats",
+    "Request",
+    "Response",
+    "Transport",
+    "AsyncTransport",
+    "TransportError",
+    "TransportTimeout",
+    "TransportConnectionError",
+    "InMemoryTransport",
+    "AsyncInMemoryTransport",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "HttpxTransport",
+    "AsyncHttpxTransport",
+]
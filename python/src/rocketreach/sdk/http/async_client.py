@@ -0,0 +1,340 @@
+"""
+Async HTTP Client
+
+Handles asyncio HTTP requests to the RocketReach API with retry logic and error handling.
+"""
+
+import asyncio
+from dataclasses import replace
+from typing import Dict, Any, Optional
+from ..exceptions import DeadlineExceededException
+from .base import BaseHttpClient, RequestFlow, Sleep
+from .concurrency import AdaptiveConcurrencyLimiter
+from .deadline import Deadline
+from .hedging import HedgingPolicy
+from .single_flight import AsyncSingleFlight
+from .transport import AsyncTransport, Request, Response, TransportError
+from .httpx_transport import AsyncHttpxTransport
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """
+    Asyncio HTTP client for making requests to the RocketReach API.
+    
+    Mirrors HttpClient on top of httpx, so that many requests can be kept
+    in flight from a single event loop. Retries and rate limit waits use
+    asyncio.sleep and never block the loop. Additional keyword options
+    are documented on BaseHttpClient.
+    
+    Args:
+        http2: Whether to offer HTTP/2, which multiplexes concurrent requests
+            over one connection. Needs the ``h2`` package; without it the
+            client warns and uses HTTP/1.1.
+        transport: Transport to send requests with. Defaults to an
+            AsyncHttpxTransport.
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        http2: bool = False,
+        transport: Optional[AsyncTransport] = None,
+        **options: Any,
+    ):
+        super().__init__(base_url, api_key, timeout, retry_attempts, retry_delay, **options)
+        
+        # Create transport for connection pooling
+        if transport is None:
+            transport = AsyncHttpxTransport(http2=http2)
+        self.transport = transport
+        self.transport.headers.update(self._default_headers())
+        self.single_flight = AsyncSingleFlight(self.coalesce_requests)
+    
+    @property
+    def session(self) -> Any:
+        """Get the session of the underlying HTTP library, if the transport has one."""
+        return getattr(self.transport, 'session', None)
+    
+    @property
+    def http2(self) -> bool:
+        """Check whether the transport offers HTTP/2."""
+        return getattr(self.transport, 'http2', False)
+    
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a GET request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        return await self._make_request('GET', endpoint, params=params, deadline=deadline)
+    
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a POST request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            idempotent: Whether the request is safe to repeat, which allows
+                retrying it after a transient server error
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        return await self._make_request('POST', endpoint, json=data, idempotent=idempotent, deadline=deadline)
+    
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make a PUT request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        return await self._make_request('PUT', endpoint, json=data, deadline=deadline)
+    
+    async def delete(self, endpoint: str, deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Make a DELETE request to the API.
+        
+        Args:
+            endpoint: API endpoint path
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        return await self._make_request('DELETE', endpoint, deadline=deadline)
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request with retry logic.
+        
+        The retry, rate limit and deadline handling is documented on
+        BaseHttpClient._request_flow().
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            json: JSON body data
+            idempotent: Whether the request is safe to repeat. Defaults to
+                True for GET, HEAD, OPTIONS, PUT and DELETE.
+            deadline: Seconds the call may take across all retries
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        flow = self._request_flow(method, endpoint, params, json, idempotent, deadline)
+        return await self._drive(flow)
+    
+    async def _drive(self, flow: RequestFlow) -> Dict[str, Any]:
+        """
+        Perform the actions of a request flow until it returns.
+        
+        Args:
+            flow: Generator returned by _request_flow()
+            
+        Returns:
+            The value returned by the flow
+        """
+        result = None
+        error = None
+        # Close the flow on any exit, so an interrupted call releases what
+        # it holds, such as the half-open trial of a circuit breaker
+        try:
+            while True:
+                try:
+                    action = flow.throw(error) if error is not None else flow.send(result)
+                except StopIteration as stop:
+                    return stop.value
+                
+                result = error = None
+                try:
+                    if isinstance(action, Sleep):
+                        await asyncio.sleep(action.delay)
+                    else:
+                        result = await self._send(action.request, action.deadline)
+                except (TransportError, DeadlineExceededException) as e:
+                    error = e
+        finally:
+            flow.close()
+    
+    async def _send(self, request: Request, deadline: Deadline) -> Response:
+        """
+        Send a single request, holding a concurrency slot while it is in flight.
+        
+        Args:
+            request: The request to send
+            deadline: Deadline of the call
+            
+        Returns:
+            The HTTP response
+            
+        Raises:
+            DeadlineExceededException: If the deadline passes before the request is sent
+            TransportError: If the transport fails to complete the request
+        """
+        limiter = self.concurrency_limiter
+        started_at = None
+        if limiter is not None:
+            while started_at is None:
+                deadline.ensure()
+                started_at = await limiter.acquire_async(deadline.remaining())
+        outcome = AdaptiveConcurrencyLimiter.DROPPED
+        try:
+            response = await self._dispatch(replace(request, timeout=self._request_timeout(deadline)))
+            outcome = self._concurrency_outcome(response.status_code)
+            return response
+        finally:
+            if limiter is not None:
+                limiter.release(started_at, outcome)
+    
+    async def _dispatch(self, request: Request) -> Response:
+        """
+        Send a request through the transport, hedging it if the policy applies.
+        
+        The losing copy of a hedged request is cancelled as soon as the
+        first response arrives.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The first successful response
+            
+        Raises:
+            TransportError: If every copy of the request failed
+        """
+        hedging = self.hedging
+        if hedging is None or not hedging.applies_to(request):
+            return await self.transport.send(request)
+        
+        hedging.record_request()
+        primary = asyncio.ensure_future(self._timed_send(request, hedging))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging.delay())
+            if not done:
+                admitted, started_at = self._admit_hedge(hedging)
+                if admitted:
+                    hedge = asyncio.ensure_future(self._timed_send(request, hedging))
+                    hedge.add_done_callback(lambda task: self._finish_hedge(started_at, task))
+                    tasks.append(hedge)
+            
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    try:
+                        response = task.result()
+                    except TransportError as e:
+                        error = error or e
+                        continue
+                    if task is not primary:
+                        hedging.record_hedge_win()
+                    return response
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    async def _timed_send(self, request: Request, hedging: HedgingPolicy) -> Response:
+        """Send a request, recording its latency with the hedging policy."""
+        started = hedging.clock()
+        try:
+            response = await self.transport.send(request)
+        except asyncio.CancelledError:
+            # A cancelled loser took at least this long; keep the tail visible
+            hedging.record_latency(hedging.clock() - started)
+            raise
+        hedging.record_latency(hedging.clock() - started)
+        return response
+    
+    async def close(self) -> None:
+        """Close the transport and the rate limiter opened by the client."""
+        await self.transport.close()
+        self._close_rate_limiter()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
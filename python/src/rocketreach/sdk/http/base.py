@@ -0,0 +1,540 @@
+"""
+HTTP Client Base
+
+Sans-IO core shared by the sync and async HTTP clients: request
+construction, response classification, retries and error handling.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Generator, Optional, Sequence, Tuple, Union
+from urllib.parse import urljoin
+from ..exceptions import (
+    ApiException,
+    RateLimitException,
+    CircuitOpenException,
+    DeadlineExceededException,
+    NetworkException,
+)
+from .rate_limit import RateLimiter, TokenBucket, SqliteRateLimiter, QuotaPacer, RateLimitState
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker
+from .retry import RetryBudget, full_jitter_backoff
+from .deadline import Deadline
+from .hedging import HedgingPolicy
+from .cache import CacheStats, ResponseCache
+from .codec import dumps, loads
+from .compression import CompressionMeter, CompressionStats, accept_encoding_header, negotiate_encodings
+from .transport import Request, Response, TransportError, TransportTimeout, TransportConnectionError
+
+
+@dataclass(frozen=True)
+class Send:
+    """Action asking the driver to send a request and resume the flow with the Response."""
+    
+    request: Request
+    deadline: Deadline
+
+
+@dataclass(frozen=True)
+class Sleep:
+    """Action asking the driver to wait before resuming the flow."""
+    
+    delay: float
+
+
+RequestFlow = Generator[Union[Send, Sleep], Optional[Response], Dict[str, Any]]
+
+
+class BaseHttpClient:
+    """
+    Base class for the RocketReach HTTP clients.
+    
+    Holds the connection settings and the whole request handling logic as a
+    sans-IO flow: _request_flow() is a generator that yields Send and Sleep
+    actions and never touches the network or the clock itself. The blocking
+    and the asyncio clients only drive the flow, performing each action
+    with their transport and sleep function, so they behave identically
+    whatever transport is plugged in.
+    """
+    
+    USER_AGENT = 'RocketReach-Python-SDK/1.0.0'
+    DEFAULT_RETRY_AFTER = 60
+    RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+    MIN_ATTEMPT_TIMEOUT = 0.001
+    DEFERRED_WAIT_THRESHOLD = 0.05
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_budget: Optional[RetryBudget] = None,
+        deadline: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        rate_limit_store: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        pace_from_headers: bool = True,
+        circuit_breaker_threshold: Optional[int] = None,
+        circuit_breaker_timeout: float = 30.0,
+        circuit_breaker_probe: Optional[str] = None,
+        on_circuit_state_change: Optional[Callable[[str, str, str], None]] = None,
+        accept_encoding: Union[bool, Sequence[str]] = True,
+        hedging: Optional[HedgingPolicy] = None,
+        coalesce_requests: bool = True,
+        cache: Optional[ResponseCache] = None,
+        negative_cache: Optional[ResponseCache] = None,
+        negative_ttl: Optional[float] = 3600.0,
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget()
+        self.deadline = deadline
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        
+        # A SQLite limiter opened from rate_limit_store belongs to the client,
+        # which closes its connection in close()
+        self._owned_rate_limiter: Optional[SqliteRateLimiter] = None
+        if rate_limiter is None and rate_limit is not None:
+            if rate_limit_store is not None:
+                rate_limiter = SqliteRateLimiter(rate_limit_store, api_key, rate_limit, rate_limit_burst)
+                self._owned_rate_limiter = rate_limiter
+            else:
+                rate_limiter = TokenBucket.shared(api_key, rate_limit, rate_limit_burst)
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.pace_from_headers = pace_from_headers
+        self.quota_pacer = QuotaPacer()
+        
+        self.circuit_breaker_threshold = circuit_breaker_threshold
+        self.circuit_breaker_timeout = circuit_breaker_timeout
+        self.circuit_breaker_probe = circuit_breaker_probe
+        self.on_circuit_state_change = on_circuit_state_change
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        self._circuit_breakers_lock = threading.Lock()
+        
+        self.accept_encoding = negotiate_encodings(accept_encoding)
+        self.compression_meter = CompressionMeter()
+        self.hedging = hedging
+        self.coalesce_requests = coalesce_requests
+        self.cache = cache
+        self.negative_cache = negative_cache
+        self.negative_ttl = negative_ttl
+    
+    @property
+    def rate_limit_state(self) -> Optional[RateLimitState]:
+        """Get the quota last reported by the API, if it sends rate limit headers."""
+        return self.quota_pacer.state
+    
+    @property
+    def circuit_breakers(self) -> Dict[str, CircuitBreaker]:
+        """Get the circuit breakers created so far, keyed by URL."""
+        return dict(self._circuit_breakers)
+    
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """Get the response body sizes received and decoded so far."""
+        return self.compression_meter.stats
+    
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Get the counters of the response cache, or None without a cache."""
+        return self.cache.stats if self.cache is not None else None
+    
+    def _request_flow(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        deadline: Optional[float] = None,
+        defer_rate_limits: bool = False,
+    ) -> RequestFlow:
+        """
+        Run one API call, yielding the I/O it needs as actions.
+        
+        Network errors are retried, as are 502, 503 and 504 responses to
+        idempotent requests, with full-jitter exponential backoff and within
+        the retry budget. With a deadline, every wait and attempt timeout is
+        cut to the time left, and no wait is started that would outlast it.
+        
+        The driver resumes the flow with the Response of every Send, or
+        throws the TransportError or DeadlineExceededException that sending
+        raised into it.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            json: JSON body data
+            idempotent: Whether the request is safe to repeat. Defaults to
+                True for GET, HEAD, OPTIONS, PUT and DELETE.
+            deadline: Seconds the call may take across all retries
+            defer_rate_limits: Raise RateLimitException on a 429, or when the
+                client-side rate limiters ask for a wait longer than
+                DEFERRED_WAIT_THRESHOLD, instead of waiting
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            ApiException: If the API returns an error
+            RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
+            NetworkException: If there's a network error
+        """
+        request = Request(method, self._build_url(endpoint), params, self._encode_body(json))
+        breaker = self._circuit_breaker(request.url)
+        if idempotent is None:
+            idempotent = method in self.IDEMPOTENT_METHODS
+        self.retry_budget.record_request()
+        call_deadline = self._start_deadline(deadline)
+        
+        last_exception = None
+        
+        for attempt in range(self.retry_attempts + 1):
+            # Pass the circuit breaker first, so an open circuit fails fast
+            # without waiting for or using up a rate limit token
+            call_deadline.ensure(cause=last_exception)
+            trial = (yield from self._enter_circuit(breaker, call_deadline)) if breaker is not None else False
+            
+            # Wait for the client-side rate limiter before sending anything
+            try:
+                delay = self._rate_limit_delay()
+                if delay > self.DEFERRED_WAIT_THRESHOLD and defer_rate_limits:
+                    self._release_rate_limit()
+                    raise RateLimitException("Client-side rate limit reached", None, None, delay)
+                if delay > 0:
+                    self._ensure_reserved(call_deadline, delay, last_exception)
+                    yield Sleep(delay)
+                self._ensure_reserved(call_deadline, 0.0, last_exception)
+            except BaseException:
+                if trial:
+                    breaker.abandon_trial()
+                raise
+            
+            try:
+                try:
+                    response = yield Send(request, call_deadline)
+                except TransportError:
+                    raise
+                except BaseException:
+                    # A deadline, cancellation or close() leaves no outcome
+                    if trial:
+                        breaker.abandon_trial()
+                    raise
+                self.compression_meter.record(response)
+                self.quota_pacer.update(response.headers)
+                self._record_circuit_response(breaker, response.status_code)
+                
+                # Handle rate limiting
+                if response.status_code == 429:
+                    retry_after = self._retry_after(response)
+                    if attempt < self.retry_attempts and not defer_rate_limits:
+                        call_deadline.ensure(retry_after, self._rate_limit_exception(response, retry_after))
+                        yield Sleep(retry_after)
+                        continue
+                    else:
+                        raise self._rate_limit_exception(response, retry_after)
+                
+                # Retry transient server errors
+                if self._is_retryable_status(response.status_code, idempotent) and self._can_retry(attempt):
+                    delay = self._backoff_delay(attempt)
+                    call_deadline.ensure(delay, self._error_exception(response))
+                    yield Sleep(delay)
+                    continue
+                
+                # Handle other HTTP errors
+                if response.status_code >= 400:
+                    self._handle_error_response(response)
+                
+                return self._decode_response(response)
+                
+            except TransportTimeout:
+                last_exception = NetworkException("Request timeout")
+            except TransportConnectionError:
+                last_exception = NetworkException("Connection error")
+            except TransportError as e:
+                last_exception = NetworkException(f"Request failed: {str(e)}")
+            
+            if breaker is not None:
+                breaker.record_failure()
+            
+            # Stop once the attempts or the retry budget are used up
+            if not self._can_retry(attempt):
+                break
+            delay = self._backoff_delay(attempt)
+            call_deadline.ensure(delay, last_exception)
+            yield Sleep(delay)
+        
+        # If we've exhausted all retry attempts, raise the last exception
+        if last_exception:
+            raise last_exception
+        
+        # This should never be reached, but just in case
+        raise NetworkException("Request failed after all retry attempts")
+    
+    def _enter_circuit(self, breaker: CircuitBreaker, deadline: Deadline) -> Generator[Send, Response, bool]:
+        """
+        Pass the circuit breaker, probing the API first if this is the half-open trial.
+        
+        Args:
+            breaker: The circuit breaker guarding the request URL
+            deadline: Deadline of the call
+            
+        Returns:
+            True if the request itself is the half-open trial
+            
+        Raises:
+            CircuitOpenException: If the circuit is open or the probe fails
+        """
+        if not breaker.before_request():
+            return False
+        if self.circuit_breaker_probe is None:
+            return True
+        
+        try:
+            response = yield Send(Request('GET', self._build_url(self.circuit_breaker_probe)), deadline)
+        except TransportError:
+            raise self._probe_failed(breaker)
+        except BaseException:
+            breaker.abandon_trial()
+            raise
+        
+        if response.status_code >= 500:
+            raise self._probe_failed(breaker)
+        breaker.record_success()
+        return False
+    
+    def _circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker guarding a URL, if circuit breaking is enabled."""
+        if self.circuit_breaker_threshold is None:
+            return None
+        
+        with self._circuit_breakers_lock:
+            breaker = self._circuit_breakers.get(url)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    name=url,
+                    failure_threshold=self.circuit_breaker_threshold,
+                    reset_timeout=self.circuit_breaker_timeout,
+                    on_state_change=self.on_circuit_state_change,
+                )
+                self._circuit_breakers[url] = breaker
+            return breaker
+    
+    def _record_circuit_response(self, breaker: Optional[CircuitBreaker], status_code: int) -> None:
+        """Report a response status to the circuit breaker."""
+        if breaker is None:
+            return
+        if status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    
+    def _probe_failed(self, breaker: CircuitBreaker) -> CircuitOpenException:
+        """Record a failed health probe and build the exception to raise."""
+        breaker.record_failure()
+        return CircuitOpenException(f"Health probe failed for {breaker.name}", breaker.reset_timeout)
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Get the headers sent with every request."""
+        return {
+            'Api-Key': self.api_key,
+            'Content-Type': 'application/json',
+            'User-Agent': self.USER_AGENT,
+            'Accept-Encoding': accept_encoding_header(self.accept_encoding),
+        }
+    
+    def _build_url(self, endpoint: str) -> str:
+        """Build the absolute URL for an endpoint path."""
+        return urljoin(self.base_url, endpoint.lstrip('/'))
+    
+    def _start_deadline(self, deadline: Optional[float]) -> Deadline:
+        """Start the deadline of a call, falling back to the client default."""
+        return Deadline(deadline if deadline is not None else self.deadline)
+    
+    def _request_timeout(self, deadline: Deadline) -> Union[float, Tuple[float, float]]:
+        """
+        Get the timeout of one attempt, clamped to the time left before the deadline.
+        
+        Returns:
+            A single timeout, or a (connect, read) pair when they differ
+        """
+        connect = self.connect_timeout if self.connect_timeout is not None else self.timeout
+        read = self.read_timeout if self.read_timeout is not None else self.timeout
+        # Keep a positive floor: the transports reject a zero timeout, and an
+        # attempt that starts right at the deadline simply times out
+        remaining = deadline.remaining()
+        if remaining is not None:
+            connect = max(self.MIN_ATTEMPT_TIMEOUT, min(connect, remaining))
+            read = max(self.MIN_ATTEMPT_TIMEOUT, min(read, remaining))
+        if connect == read:
+            return connect
+        return (connect, read)
+    
+    def _rate_limit_delay(self) -> float:
+        """Reserve a request from the rate limiters and get the wait before sending it."""
+        delay = 0.0
+        if self.rate_limiter is not None:
+            delay = self.rate_limiter.reserve()
+        if self.pace_from_headers:
+            delay = max(delay, self.quota_pacer.reserve())
+        return delay
+    
+    def _release_rate_limit(self) -> None:
+        """Give back a reservation made by _rate_limit_delay() for a request that is not sent."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.release()
+        if self.pace_from_headers:
+            self.quota_pacer.release()
+    
+    def _ensure_reserved(self, deadline: Deadline, delay: float, cause: Optional[BaseException]) -> None:
+        """
+        Check the deadline leaves room for a wait, giving back the rate limit reservation if not.
+        
+        Raises:
+            DeadlineExceededException: If the wait would end at or past the deadline
+        """
+        try:
+            deadline.ensure(delay, cause)
+        except DeadlineExceededException:
+            self._release_rate_limit()
+            raise
+    
+    def _close_rate_limiter(self) -> None:
+        """Close the rate limiter if the client opened it itself."""
+        if self._owned_rate_limiter is not None:
+            self._owned_rate_limiter.close()
+    
+    def _admit_hedge(self, hedging: HedgingPolicy) -> Tuple[bool, Optional[float]]:
+        """
+        Reserve the rate limiters and a concurrency slot for a hedge and take it from the budget.
+        
+        A hedge is only worth sending right away, so it is denied rather
+        than delayed when a rate limiter asks for a wait or no concurrency
+        slot is free.
+        
+        Args:
+            hedging: The hedging policy
+            
+        Returns:
+            Whether the hedge may be sent, and the concurrency slot start
+            time to pass to _finish_hedge()
+        """
+        if self._rate_limit_delay() > 0:
+            self._release_rate_limit()
+            hedging.record_denied()
+            return False, None
+        
+        limiter = self.concurrency_limiter
+        started_at = None
+        if limiter is not None:
+            started_at = limiter.try_acquire()
+            if started_at is None:
+                self._release_rate_limit()
+                hedging.record_denied()
+                return False, None
+        
+        if not hedging.try_hedge():
+            self._release_rate_limit()
+            if limiter is not None:
+                limiter.cancel()
+            return False, None
+        return True, started_at
+    
+    def _finish_hedge(self, started_at: Optional[float], future: Any) -> None:
+        """Free the concurrency slot of a finished hedge, leaving the limit alone if it was cancelled."""
+        if started_at is None:
+            return
+        limiter = self.concurrency_limiter
+        if future.cancelled():
+            limiter.cancel()
+        elif future.exception() is not None:
+            limiter.release(started_at, AdaptiveConcurrencyLimiter.DROPPED)
+        else:
+            limiter.release(started_at, self._concurrency_outcome(future.result().status_code))
+    
+    def _concurrency_outcome(self, status_code: int) -> str:
+        """Classify a response status for the concurrency limiter."""
+        if status_code == 429:
+            return AdaptiveConcurrencyLimiter.THROTTLED
+        if status_code >= 500:
+            return AdaptiveConcurrencyLimiter.DROPPED
+        return AdaptiveConcurrencyLimiter.SUCCESS
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get the delay before retrying after a failed attempt."""
+        return full_jitter_backoff(self.retry_delay, attempt, self.retry_max_delay)
+    
+    def _can_retry(self, attempt: int) -> bool:
+        """Check whether another attempt is allowed, spending from the retry budget."""
+        return attempt < self.retry_attempts and self.retry_budget.try_spend()
+    
+    def _is_retryable_status(self, status_code: int, idempotent: bool) -> bool:
+        """Check whether a response status is a transient error worth retrying."""
+        return idempotent and status_code in self.RETRYABLE_STATUS_CODES
+    
+    def _retry_after(self, response: Response) -> int:
+        """Get the Retry-After value of a rate limited response."""
+        return int(response.headers.get('Retry-After', self.DEFAULT_RETRY_AFTER))
+    
+    def _rate_limit_exception(self, response: Response, retry_after: int) -> RateLimitException:
+        """Build the exception raised when the rate limit is exceeded."""
+        return RateLimitException(
+            "Rate limit exceeded",
+            response.status_code,
+            response.text,
+            retry_after
+        )
+    
+    def _encode_body(self, data: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Encode a JSON request body, if there is one."""
+        return dumps(data) if data is not None else None
+    
+    def _decode_response(self, response: Response) -> Dict[str, Any]:
+        """Decode the JSON body of a successful response from its raw bytes."""
+        return loads(response.content)
+    
+    def _handle_error_response(self, response: Response) -> None:
+        """
+        Handle error responses from the API.
+        
+        Args:
+            response: The HTTP response object
+            
+        Raises:
+            ApiException: For API errors
+        """
+        raise self._error_exception(response)
+    
+    def _error_exception(self, response: Response) -> ApiException:
+        """Build the exception describing an error response."""
+        try:
+            error_data = response.json()
+            message = error_data.get('message', 'Unknown error')
+            details = error_data.get('details', {})
+        except ValueError:
+            message = response.text or 'Unknown error'
+            details = {}
+        
+        return ApiException(
+            message,
+            response.status_code,
+            response.text,
+            details
+        )
@@ -0,0 +1,898 @@
+"""
+Response Cache
+
+Caches lookup and enrichment responses so repeated queries for the same
+person do not spend API credits again, in memory, in a SQLite file
+shared between processes and runs, or in both.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+from ..exceptions import ApiException
+from .codec import dumps, loads
+from .deadline import Deadline
+from ..models import LookupQuery
+from .single_flight import query_key
+
+PENDING_STATUSES = frozenset({'searching', 'waiting', 'progress'})
+NOT_FOUND = 404
+
+
+def is_final(data: Dict[str, Any]) -> bool:
+    """
+    Check whether a response is final and may be cached.
+    
+    The API answers ``searching`` while it is still gathering a person's
+    details; caching such an answer would keep serving the partial data
+    after the search has completed.
+    
+    Args:
+        data: Decoded lookup or enrichment response
+        
+    Returns:
+        False if the response or its person is still being searched
+    """
+    if not isinstance(data, dict):
+        return False
+    person = data.get('person')
+    statuses = [data.get('status'), person.get('status') if isinstance(person, dict) else None]
+    return not any(status in PENDING_STATUSES for status in statuses)
+
+
+def person_key(endpoint: str, data: Dict[str, Any]) -> Optional[str]:
+    """
+    Build the key of a lookup by id of the person in a response.
+    
+    A response fetched by name or email is also cached under this key, so
+    a later lookup of the same person by id is answered from the cache.
+    
+    Args:
+        endpoint: API endpoint path the response came from
+        data: Decoded lookup or enrichment response
+        
+    Returns:
+        The key, or None if the response has no person id
+    """
+    person_id = data.get('id')
+    if person_id is None and isinstance(data.get('person'), dict):
+        person_id = data['person'].get('id')
+    if person_id is None:
+        return None
+    return query_key(endpoint, LookupQuery(id=person_id))
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a response cache.
+    
+    ``evictions`` counts entries dropped to make room and ``expirations``
+    entries dropped because their TTL ran out.
+    """
+    
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of reads answered from the cache."""
+        reads = self.hits + self.misses
+        if reads == 0:
+            return 0.0
+        return self.hits / reads
+
+
+class ResponseCache:
+    """
+    Store of decoded API responses keyed by query_key().
+    
+    Implementations return a fresh copy of the response on every read, so
+    callers may modify what they get without changing the cached entry.
+    Reads with ``stale_ok`` also return entries past their TTL that have
+    not been dropped yet.
+    """
+    
+    stale_ok = False
+    
+    def get(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """
+        Read a cached response.
+        
+        Args:
+            key: Key of the request
+            stale_ok: Whether to return an expired entry. Defaults to the
+                cache setting.
+            
+        Returns:
+            The response, or None if it is not cached or has expired
+        """
+        raise NotImplementedError
+    
+    def read(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Read a cached response and whether it should be revalidated.
+        
+        Only caches with a soft TTL, such as TieredCache, ask for
+        revalidation; they also implement revalidate() and
+        async_revalidate().
+        
+        Args:
+            key: Key of the request
+            stale_ok: Whether to return an expired entry. Defaults to the
+                cache setting.
+            
+        Returns:
+            The response and whether to refresh it, or None if it is not cached
+        """
+        data = self.get(key, stale_ok)
+        return (data, False) if data is not None else None
+    
+    def set(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Cache a response.
+        
+        Args:
+            key: Key of the request
+            data: Decoded response
+            ttl: Seconds the entry stays valid. Defaults to the cache TTL.
+        """
+        raise NotImplementedError
+    
+    def delete(self, key: str) -> None:
+        """Drop a cached response."""
+        raise NotImplementedError
+    
+    def clear(self) -> None:
+        """Drop every cached response."""
+        raise NotImplementedError
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Get the counters of the cache."""
+        raise NotImplementedError
+    
+    def close(self) -> None:
+        """Release the resources held by the cache."""
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU cache with a TTL.
+    
+    Responses are kept encoded, which bounds their memory by ``max_bytes``
+    and hands every reader its own copy. When either limit is exceeded the
+    least recently used entries are evicted; expired entries are dropped
+    when they are read or reached by an eviction.
+    
+    Args:
+        max_entries: Maximum number of cached responses
+        max_bytes: Maximum total size of the encoded responses, or None for
+            no size limit
+        ttl: Seconds a response stays valid
+        stale_ok: Whether reads return expired entries instead of dropping them
+        clock: Monotonic clock, overridable for testing
+        
+    Example:
+        >>> client = RocketReachClient("your-api-key", cache=MemoryCache(max_entries=10000, ttl=86400))
+        >>> person = client.person_lookup().id(12345).lookup()
+        >>> client.cache_stats.hits
+        0
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: float = 3600.0,
+        stale_ok: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ok = stale_ok
+        self.clock = clock
+        
+        self._entries: 'OrderedDict[str, Tuple[float, bytes]]' = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Read a cached response and mark it as recently used."""
+        if stale_ok is None:
+            stale_ok = self.stale_ok
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and not stale_ok and entry[0] <= self.clock():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return loads(entry[1])
+    
+    def set(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache a response, evicting entries beyond the limits. Responses larger than ``max_bytes`` are not cached."""
+        content = dumps(data)
+        expires_at = self.clock() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and len(content) > self.max_bytes:
+                return
+            self._entries[key] = (expires_at, content)
+            self._size += len(content)
+            self._evict()
+    
+    def delete(self, key: str) -> None:
+        """Drop a cached response."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+    
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Get the counters of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+    
+    def _remove(self, key: str) -> None:
+        """Drop an entry; the caller holds the lock."""
+        _, content = self._entries.pop(key)
+        self._size -= len(content)
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries until both limits hold; the caller holds the lock."""
+        now = self.clock()
+        while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._size > self.max_bytes):
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            self._remove(key)
+            if expires_at <= now:
+                self._expirations += 1
+            else:
+                self._evictions += 1
+
+
+class SqliteCache(ResponseCache):
+    """
+    Response cache in a local SQLite file shared between processes and runs.
+    
+    The database runs in WAL mode, so processes pointing at the same file
+    read concurrently while one of them writes. Entries carry an absolute
+    expiry time on the wall clock shared by all processes. When
+    ``max_entries`` or ``max_bytes`` is exceeded, expired entries are
+    evicted first and then the least recently read ones. Read times are
+    only recorded to within ``ACCESS_RESOLUTION`` of the TTL, so most hits
+    are plain reads and do not queue for the database write lock.
+    Expired entries are otherwise kept until compact() is called, so
+    ``stale_ok`` reads can still serve responses that were paid for but are
+    past their TTL.
+    
+    Args:
+        path: Path of the SQLite database file, created if missing. A
+            leading ``~`` is expanded to the home directory.
+        ttl: Seconds a response stays valid
+        max_entries: Maximum number of cached responses, or None for no limit
+        max_bytes: Maximum total size of the encoded responses, or None for
+            no size limit
+        stale_ok: Whether reads return expired entries that have not been
+            compacted away
+        timeout: Seconds to wait for the database lock
+        clock: Wall clock shared by all processes, overridable for testing
+        
+    Example:
+        >>> cache = SqliteCache("~/.cache/rocketreach.sqlite", ttl=30 * 86400, stale_ok=True)
+        >>> client = RocketReachClient("your-api-key", cache=cache)
+        >>> enriched = client.person_enrich().email("john@example.com").enrich()
+    """
+    
+    ACCESS_RESOLUTION = 0.1
+    
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 7 * 86400.0,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        stale_ok: bool = False,
+        timeout: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ok = stale_ok
+        self.clock = clock
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS response_cache_accessed_at ON response_cache (accessed_at)")
+    
+    def get(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Read a cached response, recording the read time if the stored one is out of date."""
+        if stale_ok is None:
+            stale_ok = self.stale_ok
+        now = self.clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expires_at, accessed_at FROM response_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or (not stale_ok and row[1] <= now):
+                self._misses += 1
+                return None
+            if now - row[2] >= self.ttl * self.ACCESS_RESOLUTION:
+                self._conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._hits += 1
+        return loads(row[0])
+    
+    def set(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache a response, evicting entries beyond the limits. Responses larger than ``max_bytes`` are not cached."""
+        content = dumps(data)
+        now = self.clock()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if self.max_bytes is not None and len(content) > self.max_bytes:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO response_cache (key, content, size, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, content, len(content), expires_at, now),
+                )
+                self._evict(now)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def delete(self, key: str) -> None:
+        """Drop a cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Get the counters of this cache object and the size of the shared file."""
+        with self._lock:
+            entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=entries,
+                size_bytes=size,
+            )
+    
+    def compact(self, stale_for: float = 0.0) -> int:
+        """
+        Drop expired entries and return their space to the file system.
+        
+        Args:
+            stale_for: Seconds past their TTL entries are kept for
+                ``stale_ok`` reads
+            
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            dropped = self._conn.execute(
+                "DELETE FROM response_cache WHERE expires_at <= ?",
+                (self.clock() - stale_for,),
+            ).rowcount
+            self._expirations += dropped
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.execute("VACUUM")
+        return dropped
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
+    def _evict(self, now: float) -> None:
+        """Drop expired, then least recently read entries until both limits hold; the caller holds the lock."""
+        if self.max_entries is None and self.max_bytes is None:
+            return
+        entries, size = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache").fetchone()
+        excess_entries = entries - self.max_entries if self.max_entries is not None else 0
+        excess_bytes = size - self.max_bytes if self.max_bytes is not None else 0
+        if excess_entries <= 0 and excess_bytes <= 0:
+            return
+        
+        victims = []
+        rows = self._conn.execute(
+            "SELECT key, size, expires_at FROM response_cache ORDER BY expires_at > ?, accessed_at",
+            (now,),
+        )
+        for key, entry_size, expires_at in rows:
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((key,))
+            excess_entries -= 1
+            excess_bytes -= entry_size
+            if expires_at <= now:
+                self._expirations += 1
+            else:
+                self._evictions += 1
+        rows.close()
+        self._conn.executemany("DELETE FROM response_cache WHERE key = ?", victims)
+
+
+class TieredCache(ResponseCache):
+    """
+    In-process cache in front of a shared persistent one, serving stale
+    entries while they are revalidated.
+    
+    Reads try ``l1`` first and fall back to ``l2``, copying what they find
+    into ``l1``. Writes go to both. An entry younger than ``soft_ttl`` is
+    fresh. An older one, up to ``hard_ttl``, is still returned at once, but
+    the endpoint refreshes it from the API in the background, so callers
+    never wait for the refresh. Only one refresh per key runs at a time;
+    a failed refresh leaves the stale entry in place.
+    
+    Entries are stored in both tiers together with the time they were
+    fetched, so the tiers should not be shared with other caches.
+    
+    Args:
+        l1: Fast in-process cache, usually a MemoryCache
+        l2: Persistent cache shared between processes, usually a SqliteCache
+        soft_ttl: Seconds after which an entry is revalidated
+        hard_ttl: Seconds after which an entry is no longer served
+        refresh_workers: Threads the blocking client refreshes entries with
+        clock: Wall clock shared by all processes, overridable for testing
+        
+    Example:
+        >>> cache = TieredCache(MemoryCache(max_entries=10000), SqliteCache("profiles.sqlite"))
+        >>> client = RocketReachClient("your-api-key", cache=cache)
+        >>> person = client.person_lookup().id(12345).lookup()
+    """
+    
+    def __init__(
+        self,
+        l1: ResponseCache,
+        l2: ResponseCache,
+        soft_ttl: float = 3600.0,
+        hard_ttl: float = 7 * 86400.0,
+        refresh_workers: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        if soft_ttl > hard_ttl:
+            raise ValueError("soft_ttl must not exceed hard_ttl")
+        
+        self.l1 = l1
+        self.l2 = l2
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.clock = clock
+        
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.revalidations = 0
+        self.revalidation_failures = 0
+        
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Future] = set()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='rocketreach-revalidate')
+        self._lock = threading.Lock()
+    
+    def read(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """Read a cached response and whether it is past the soft TTL."""
+        entry = self.l1.get(key, stale_ok)
+        tier = 'l1'
+        if entry is None:
+            entry = self.l2.get(key, stale_ok)
+            tier = 'l2'
+        age = self.clock() - entry['fetched_at'] if entry is not None else 0.0
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            if tier == 'l1':
+                self.l1_hits += 1
+            else:
+                self.l2_hits += 1
+            stale = age >= self.soft_ttl
+            if stale:
+                self.stale_hits += 1
+        if tier == 'l2' and age < self.hard_ttl:
+            self.l1.set(key, entry, ttl=self.hard_ttl - age)
+        return entry['response'], stale
+    
+    def get(self, key: str, stale_ok: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """Read a cached response, fresh or stale."""
+        entry = self.read(key, stale_ok)
+        return entry[0] if entry is not None else None
+    
+    def set(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Cache a response in both tiers. Defaults to the hard TTL."""
+        entry = {'fetched_at': self.clock(), 'response': data}
+        ttl = self.hard_ttl if ttl is None else ttl
+        self.l1.set(key, entry, ttl=ttl)
+        self.l2.set(key, entry, ttl=ttl)
+    
+    def delete(self, key: str) -> None:
+        """Drop a cached response from both tiers."""
+        self.l1.delete(key)
+        self.l2.delete(key)
+    
+    def clear(self) -> None:
+        """Drop every cached response from both tiers."""
+        self.l1.clear()
+        self.l2.clear()
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Get the hits of either tier and the size of the persistent tier."""
+        l2_stats = self.l2.stats
+        with self._lock:
+            return CacheStats(
+                hits=self.l1_hits + self.l2_hits,
+                misses=self.misses,
+                evictions=l2_stats.evictions,
+                expirations=l2_stats.expirations,
+                entries=l2_stats.entries,
+                size_bytes=l2_stats.size_bytes,
+            )
+    
+    def revalidate(self, key: str, refresh: Callable[[], None]) -> None:
+        """
+        Refresh an entry in a background thread.
+        
+        Args:
+            key: Key of the stale entry
+            refresh: Function fetching and caching the response again
+        """
+        if self._begin_refresh(key):
+            self._executor.submit(self._refresh, key, refresh)
+    
+    def async_revalidate(self, key: str, refresh: Callable[[], Awaitable[None]]) -> None:
+        """
+        Refresh an entry in a background task of the running event loop.
+        
+        Args:
+            key: Key of the stale entry
+            refresh: Coroutine function fetching and caching the response again
+        """
+        if self._begin_refresh(key):
+            task = asyncio.ensure_future(self._async_refresh(key, refresh))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    def close(self) -> None:
+        """Stop the refresh threads and close both tiers."""
+        self._executor.shutdown(wait=False)
+        for task in list(self._tasks):
+            task.cancel()
+        self.l1.close()
+        self.l2.close()
+    
+    def _begin_refresh(self, key: str) -> bool:
+        """Claim the refresh of a key, unless one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.revalidations += 1
+            return True
+    
+    def _end_refresh(self, key: str, failed: bool) -> None:
+        """Release the refresh of a key."""
+        with self._lock:
+            self._refreshing.discard(key)
+            if failed:
+                self.revalidation_failures += 1
+    
+    def _refresh(self, key: str, refresh: Callable[[], None]) -> None:
+        """Run a refresh, keeping the stale entry if it fails."""
+        failed = True
+        try:
+            refresh()
+            failed = False
+        except Exception:
+            pass
+        finally:
+            self._end_refresh(key, failed)
+    
+    async def _async_refresh(self, key: str, refresh: Callable[[], Awaitable[None]]) -> None:
+        """Run a refresh, keeping the stale entry if it fails."""
+        failed = True
+        try:
+            await refresh()
+            failed = False
+        except Exception:
+            pass
+        finally:
+            self._end_refresh(key, failed)
+
+
+def _store(cache: Optional[ResponseCache], endpoint: str, key: str, data: Dict[str, Any]) -> None:
+    """Cache a final response under its request key and the key of its person."""
+    if cache is None or not is_final(data):
+        return
+    cache.set(key, data)
+    alias = person_key(endpoint, data)
+    if alias is not None and alias != key:
+        cache.set(alias, data)
+
+
+def _check_not_found(negative_cache: Optional[ResponseCache], key: str) -> None:
+    """Raise the remembered error of a request that found no match."""
+    error = negative_cache.get(key) if negative_cache is not None else None
+    if error is not None:
+        raise ApiException(error['message'], error['status_code'], error['response_text'], error['details'])
+
+
+def _remember_not_found(
+    negative_cache: Optional[ResponseCache],
+    key: str,
+    error: ApiException,
+    ttl: Optional[float],
+) -> None:
+    """Remember a request that found no match."""
+    if negative_cache is not None and error.status_code == NOT_FOUND:
+        negative_cache.set(key, {
+            'message': error.message,
+            'status_code': error.status_code,
+            'response_text': error.response_text,
+            'details': error.details,
+        }, ttl=ttl)
+
+
+def read_through(
+    cache: Optional[ResponseCache],
+    endpoint: str,
+    key: str,
+    call: Callable[[], Dict[str, Any]],
+    negative_cache: Optional[ResponseCache] = None,
+    negative_ttl: Optional[float] = None,
+    refresh_call: Optional[Callable[[], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Answer a request from the cache, or make it and cache a final response.
+    
+    A cached response past its soft TTL is returned at once and refreshed
+    with the same call in the background. A request the API answered with
+    404 is remembered in ``negative_cache`` and fails again without a call
+    until that entry expires.
+    
+    Args:
+        cache: Cache to use, or None to always make the call
+        endpoint: API endpoint path of the request
+        key: Key of the request
+        call: Function making the API call
+        negative_cache: Cache of requests that found no match, or None
+        negative_ttl: Seconds a request that found no match is remembered.
+            Defaults to the TTL of ``negative_cache``.
+        refresh_call: Function making the API call of a background
+            refresh. Defaults to ``call``.
+        
+    Returns:
+        The cached or fetched response
+        
+    Raises:
+        ApiException: If the request failed or is known to find no match
+    """
+    entry = cache.read(key) if cache is not None else None
+    if entry is not None:
+        data, stale = entry
+        if stale:
+            refresh_call = refresh_call or call
+            cache.revalidate(key, lambda: _store(cache, endpoint, key, refresh_call()))
+        return data
+    
+    _check_not_found(negative_cache, key)
+    try:
+        data = call()
+    except ApiException as e:
+        _remember_not_found(negative_cache, key, e, negative_ttl)
+        raise
+    _store(cache, endpoint, key, data)
+    return data
+
+
+async def async_read_through(
+    cache: Optional[ResponseCache],
+    endpoint: str,
+    key: str,
+    call: Callable[[], Awaitable[Dict[str, Any]]],
+    negative_cache: Optional[ResponseCache] = None,
+    negative_ttl: Optional[float] = None,
+    refresh_call: Optional[Callable[[], Awaitable[Dict[str, Any]]]] = None,
+) -> Dict[str, Any]:
+    """
+    Answer a request from the cache, or make it and cache a final response.
+    
+    A cached response past its soft TTL is returned at once and refreshed
+    with the same call in a background task. A request the API answered
+    with 404 is remembered in ``negative_cache`` and fails again without a
+    call until that entry expires.
+    
+    Args:
+        cache: Cache to use, or None to always make the call
+        endpoint: API endpoint path of the request
+        key: Key of the request
+        call: Coroutine function making the API call
+        negative_cache: Cache of requests that found no match, or None
+        negative_ttl: Seconds a request that found no match is remembered.
+            Defaults to the TTL of ``negative_cache``.
+        refresh_call: Function making the API call of a background
+            refresh. Defaults to ``call``.
+        
+    Returns:
+        The cached or fetched response
+        
+    Raises:
+        ApiException: If the request failed or is known to find no match
+    """
+    entry = cache.read(key) if cache is not None else None
+    if entry is not None:
+        data, stale = entry
+        if stale:
+            refresh_call = refresh_call or call
+            
+            async def refresh() -> None:
+                _store(cache, endpoint, key, await refresh_call())
+            cache.async_revalidate(key, refresh)
+        return data
+    
+    _check_not_found(negative_cache, key)
+    try:
+        data = await call()
+    except ApiException as e:
+        _remember_not_found(negative_cache, key, e, negative_ttl)
+        raise
+    _store(cache, endpoint, key, data)
+    return data
+
+
+def lookup_through(http_client: Any, endpoint: str, query: LookupQuery, deadline: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Make a lookup GET through the caches and single-flight coalescing of a client.
+    
+    Concurrent lookups of equivalent queries share one API call, waited
+    for within the deadline of each caller.
+    
+    Args:
+        http_client: HttpClient making the call
+        endpoint: API endpoint path
+        query: Query to look up
+        deadline: Seconds the call may take across all retries.
+            Defaults to the client deadline.
+        
+    Returns:
+        The cached or fetched response
+        
+    Raises:
+        ApiException: If the request failed or is known to find no match
+        DeadlineExceededException: If the deadline runs out
+    """
+    params = query.to_dict()
+    key = query_key(endpoint, query)
+    call_deadline = Deadline(deadline if deadline is not None else http_client.deadline)
+    return read_through(
+        http_client.cache,
+        endpoint,
+        key,
+        lambda: http_client.single_flight.do(
+            key,
+            lambda: http_client.get(endpoint, params=params, deadline=deadline),
+            deadline=call_deadline,
+        ),
+        negative_cache=http_client.negative_cache,
+        negative_ttl=http_client.negative_ttl,
+        # A background refresh outlives the caller, so it runs under the
+        # client deadline, started when the refresh begins
+        refresh_call=lambda: http_client.single_flight.do(
+            key,
+            lambda: http_client.get(endpoint, params=params, deadline=None),
+            deadline=Deadline(http_client.deadline),
+        ),
+    )
+
+
+async def async_lookup_through(
+    http_client: Any,
+    endpoint: str,
+    query: LookupQuery,
+    deadline: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Make a lookup GET through the caches and single-flight coalescing of an async client.
+    
+    Args:
+        http_client: AsyncHttpClient making the call
+        endpoint: API endpoint path
+        query: Query to look up
+        deadline: Seconds the call may take across all retries.
+            Defaults to the client deadline.
+        
+    Returns:
+        The cached or fetched response
+        
+    Raises:
+        ApiException: If the request failed or is known to find no match
+        DeadlineExceededException: If the deadline runs out
+    """
+    params = query.to_dict()
+    key = query_key(endpoint, query)
+    call_deadline = Deadline(deadline if deadline is not None else http_client.deadline)
+    return await async_read_through(
+        http_client.cache,
+        endpoint,
+        key,
+        lambda: http_client.single_flight.do(
+            key,
+            lambda: http_client.get(endpoint, params=params, deadline=deadline),
+            deadline=call_deadline,
+        ),
+        negative_cache=http_client.negative_cache,
+        negative_ttl=http_client.negative_ttl,
+        # A background refresh outlives the caller, so it runs under the
+        # client deadline, started when the refresh begins
+        refresh_call=lambda: http_client.single_flight.do(
+            key,
+            lambda: http_client.get(endpoint, params=params, deadline=None),
+            deadline=Deadline(http_client.deadline),
+        ),
+    )
@@ -0,0 +1,147 @@
+"""
+Circuit Breaker
+
+Fails requests fast while the API host is down.
+"""
+
+import threading
+import time
+from typing import Callable, Optional, Tuple
+from ..exceptions import CircuitOpenException
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one API host and endpoint.
+    
+    The breaker opens after ``failure_threshold`` consecutive network or 5xx
+    failures and rejects requests with CircuitOpenException for
+    ``reset_timeout`` seconds. It then turns half-open and lets a single
+    trial request through: success closes it again, failure reopens it for
+    another ``reset_timeout``.
+    
+    Args:
+        name: Name passed to the state change callback, usually the URL
+        failure_threshold: Consecutive failures that open the breaker
+        reset_timeout: Seconds the breaker stays open before a trial request
+        on_state_change: Called with (name, old_state, new_state) on every
+            transition
+        clock: Monotonic clock, overridable for testing
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(
+        self,
+        name: str = '',
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        on_state_change: Optional[Callable[[str, str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1")
+        
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """Get the current state of the breaker."""
+        with self._lock:
+            transition = self._update_state()
+        self._notify(transition)
+        return self._state
+    
+    @property
+    def failures(self) -> int:
+        """Get the number of consecutive failures."""
+        return self._failures
+    
+    def before_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+        
+        Returns:
+            True if the request is the half-open trial, False otherwise
+            
+        Raises:
+            CircuitOpenException: If the breaker rejects the request
+        """
+        with self._lock:
+            transition = self._update_state()
+            trial = False
+            rejection = None
+            
+            if self._state == self.OPEN:
+                retry_after = self._opened_at + self.reset_timeout - self._clock()
+                rejection = CircuitOpenException(f"Circuit breaker is open for {self.name}", max(0.0, retry_after))
+            elif self._state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    rejection = CircuitOpenException(f"Circuit breaker is half-open for {self.name}", 0.0)
+                else:
+                    self._trial_in_flight = True
+                    trial = True
+        
+        self._notify(transition)
+        if rejection is not None:
+            raise rejection
+        return trial
+    
+    def record_success(self) -> None:
+        """Record a request that reached a healthy host."""
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            transition = self._set_state(self.CLOSED)
+        self._notify(transition)
+    
+    def record_failure(self) -> None:
+        """Record a network or 5xx failure."""
+        with self._lock:
+            self._failures += 1
+            transition = None
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._trial_in_flight = False
+                transition = self._set_state(self.OPEN)
+        self._notify(transition)
+    
+    def abandon_trial(self) -> None:
+        """Give up the half-open trial without an outcome so another request can take it."""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def reset(self) -> None:
+        """Force the breaker closed."""
+        self.record_success()
+    
+    def _update_state(self) -> Optional[Tuple[str, str]]:
+        """Turn an expired open breaker half-open while holding the lock."""
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            return self._set_state(self.HALF_OPEN)
+        return None
+    
+    def _set_state(self, state: str) -> Optional[Tuple[str, str]]:
+        """Change state while holding the lock and return the transition, if any."""
+        if state == self._state:
+            return None
+        transition = (self._state, state)
+        self._state = state
+        return transition
+    
+    def _notify(self, transition: Optional[Tuple[str, str]]) -> None:
+        """Report a transition to the callback outside the lock."""
+        if transition is not None and self.on_state_change is not None:
+            self.on_state_change(self.name, transition[0], transition[1])
@@ -4,18 +4,70 @@ HTTP Client
 Handles HTTP requests to the RocketReach API with retry logic and error handling.
 """
 
+import threading
 import time
-import requests
-from typing import Dict, Any, Optional, Union
-from urllib.parse import urljoin
-from ..exceptions import ApiException, RateLimitException, NetworkException
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Dict, Any, Iterator, Optional
+from ..exceptions import DeadlineExceededException
+from .base import BaseHttpClient, RequestFlow, Sleep
+from .concurrency import AdaptiveConcurrencyLimiter
+from .deadline import Deadline
+from .hedging import HedgingPolicy
+from .single_flight import SingleFlight
+from .pool import ConnectionStats
+from .transport import Request, Response, Transport, TransportError
+from .requests_transport import RequestsTransport
 
 
-class HttpClient:
+_rate_limit_deferral = threading.local()
+
+
+@contextmanager
+def defer_rate_limits() -> Iterator[None]:
+    """
+    Raise RateLimitException instead of sleeping in the calling thread.
+    
+    Applies to 429 responses and to client-side rate limiter waits longer
+    than a few milliseconds. Used by bulk workers, which requeue throttled
+    work and move on rather than parking a pool thread for the whole wait.
+    """
+    previous = getattr(_rate_limit_deferral, 'enabled', False)
+    _rate_limit_deferral.enabled = True
+    try:
+        yield
+    finally:
+        _rate_limit_deferral.enabled = previous
+
+
+def rate_limits_deferred() -> bool:
+    """Check whether the calling thread defers rate limit waits."""
+    return getattr(_rate_limit_deferral, 'enabled', False)
+
+
+class HttpClient(BaseHttpClient):
     """
     HTTP client for making requests to the RocketReach API.
     
     Handles authentication, retries, rate limiting, and error responses.
+    Additional keyword options are documented on BaseHttpClient.
+    
+    Requests go through a pluggable transport, by default RequestsTransport.
+    Its connections are kept alive and pooled per host. Size
+    ``pool_maxsize`` to at least the number of threads sharing the client;
+    otherwise connections beyond the pool are closed after every request
+    and have to be re-established.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Whether threads wait for a pooled connection instead of
+            opening a throwaway one when the pool is exhausted
+        tcp_keepalive: Idle seconds before TCP keep-alive probes are sent on
+            pooled connections, or None for the operating system default
+        transport: Transport to send requests with. The pool settings only
+            apply to the default RequestsTransport.
     """
     
     def __init__(
@@ -25,28 +77,49 @@ class HttpClient:
         timeout: int = 30,
         retry_attempts: int = 3,
         retry_delay: float = 1.0,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+        transport: Optional[Transport] = None,
+        **options: Any,
     ):
-        self.base_url = base_url.rstrip('/')
-        self.api_key = api_key
-        self.timeout = timeout
-        self.retry_attempts = retry_attempts
-        self.retry_delay = retry_delay
+        super().__init__(base_url, api_key, timeout, retry_attempts, retry_delay, **options)
         
-        # Create session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Api-Key': api_key,
-            'Content-Type': 'application/json',
-            'User-Agent': 'RocketReach-Python-SDK/1.0.0',
-        })
+        # Create transport for connection pooling
+        if transport is None:
+            transport = RequestsTransport(pool_connections, pool_maxsize, pool_block, tcp_keepalive)
+        self.transport = transport
+        self.transport.headers.update(self._default_headers())
+        self.single_flight = SingleFlight(self.coalesce_requests)
+        self._hedge_pool: Optional[ThreadPoolExecutor] = None
+        self._hedge_threads: Optional[threading.BoundedSemaphore] = None
+        self._hedge_pool_lock = threading.Lock()
+    
+    @property
+    def session(self) -> Any:
+        """Get the session of the underlying HTTP library, if the transport has one."""
+        return getattr(self.transport, 'session', None)
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @property
+    def connection_stats(self) -> Optional[ConnectionStats]:
+        """Get the connection reuse counters, or None if the transport does not count them."""
+        return self.transport.connection_stats
+    
+    def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Make a GET request to the API.
         
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
             
         Returns:
             Dict containing the response data
@@ -54,17 +127,28 @@ class HttpClient:
         Raises:
             ApiException: If the API returns an error
             RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
             NetworkException: If there's a network error
         """
-        return self._make_request('GET', endpoint, params=params)
+        return self._make_request('GET', endpoint, params=params, deadline=deadline)
     
-    def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotent: bool = False,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Make a POST request to the API.
         
         Args:
             endpoint: API endpoint path
             data: Request body data
+            idempotent: Whether the request is safe to repeat, which allows
+                retrying it after a transient server error
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
             
         Returns:
             Dict containing the response data
@@ -72,17 +156,25 @@ class HttpClient:
         Raises:
             ApiException: If the API returns an error
             RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
             NetworkException: If there's a network error
         """
-        return self._make_request('POST', endpoint, json=data)
+        return self._make_request('POST', endpoint, json=data, idempotent=idempotent, deadline=deadline)
     
-    def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def put(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Make a PUT request to the API.
         
         Args:
             endpoint: API endpoint path
             data: Request body data
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
             
         Returns:
             Dict containing the response data
@@ -90,16 +182,19 @@ class HttpClient:
         Raises:
             ApiException: If the API returns an error
             RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
             NetworkException: If there's a network error
         """
-        return self._make_request('PUT', endpoint, json=data)
+        return self._make_request('PUT', endpoint, json=data, deadline=deadline)
     
-    def delete(self, endpoint: str) -> Dict[str, Any]:
+    def delete(self, endpoint: str, deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Make a DELETE request to the API.
         
         Args:
             endpoint: API endpoint path
+            deadline: Seconds the call may take across all retries.
+                Defaults to the client deadline.
             
         Returns:
             Dict containing the response data
@@ -107,9 +202,10 @@ class HttpClient:
         Raises:
             ApiException: If the API returns an error
             RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
             NetworkException: If there's a network error
         """
-        return self._make_request('DELETE', endpoint)
+        return self._make_request('DELETE', endpoint, deadline=deadline)
     
     def _make_request(
         self,
@@ -117,15 +213,23 @@ class HttpClient:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request with retry logic.
         
+        The retry, rate limit and deadline handling is documented on
+        BaseHttpClient._request_flow().
+        
         Args:
             method: HTTP method
             endpoint: API endpoint path
             params: Query parameters
             json: JSON body data
+            idempotent: Whether the request is safe to repeat. Defaults to
+                True for GET, HEAD, OPTIONS, PUT and DELETE.
+            deadline: Seconds the call may take across all retries
             
         Returns:
             Dict containing the response data
@@ -133,88 +237,170 @@ class HttpClient:
         Raises:
             ApiException: If the API returns an error
             RateLimitException: If rate limit is exceeded
+            DeadlineExceededException: If the deadline runs out
             NetworkException: If there's a network error
         """
-        url = urljoin(self.base_url, endpoint.lstrip('/'))
-        
-        last_exception = None
+        flow = self._request_flow(method, endpoint, params, json, idempotent, deadline, rate_limits_deferred())
+        return self._drive(flow)
+    
+    def _drive(self, flow: RequestFlow) -> Dict[str, Any]:
+        """
+        Perform the actions of a request flow until it returns.
         
-        for attempt in range(self.retry_attempts + 1):
-            try:
-                response = self.session.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=json,
-                    timeout=self.timeout,
-                )
+        Args:
+            flow: Generator returned by _request_flow()
+            
+        Returns:
+            The value returned by the flow
+        """
+        result = None
+        error = None
+        # Close the flow on any exit, so an interrupted call releases what
+        # it holds, such as the half-open trial of a circuit breaker
+        try:
+            while True:
+                try:
+                    action = flow.throw(error) if error is not None else flow.send(result)
+                except StopIteration as stop:
+                    return stop.value
                 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    if attempt < self.retry_attempts:
-                        time.sleep(retry_after)
-                        continue
+                result = error = None
+                try:
+                    if isinstance(action, Sleep):
+                        time.sleep(action.delay)
                     else:
-                        raise RateLimitException(
-                            "Rate limit exceeded",
-                            response.status_code,
-                            response.text,
-                            retry_after
-                        )
-                
-                # Handle other HTTP errors (201 is also success)
-                if not response.ok and response.status_code != 201:
-                    self._handle_error_response(response)
-                
-                return response.json()
-                
-            except requests.exceptions.Timeout:
-                last_exception = NetworkException("Request timeout")
-            except requests.exceptions.ConnectionError:
-                last_exception = NetworkException("Connection error")
-            except requests.exceptions.RequestException as e:
-                last_exception = NetworkException(f"Request failed: {str(e)}")
-            
-            # If this isn't the last attempt, wait before retrying
-            if attempt < self.retry_attempts:
-                time.sleep(self.retry_delay * (2 ** attempt))  # Exponential backoff
-        
-        # If we've exhausted all retry attempts, raise the last exception
-        if last_exception:
-            raise last_exception
-        
-        # This should never be reached, but just in case
-        raise NetworkException("Request failed after all retry attempts")
+                        result = self._send(action.request, action.deadline)
+                except (TransportError, DeadlineExceededException) as e:
+                    error = e
+        finally:
+            flow.close()
     
-    def _handle_error_response(self, response: requests.Response) -> None:
+    def _send(self, request: Request, deadline: Deadline) -> Response:
         """
-        Handle error responses from the API.
+        Send a single request, holding a concurrency slot while it is in flight.
         
         Args:
-            response: The HTTP response object
+            request: The request to send
+            deadline: Deadline of the call
+            
+        Returns:
+            The HTTP response
             
         Raises:
-            ApiException: For API errors
+            DeadlineExceededException: If the deadline passes before the request is sent
+            TransportError: If the transport fails to complete the request
         """
+        limiter = self.concurrency_limiter
+        started_at = None
+        if limiter is not None:
+            while started_at is None:
+                deadline.ensure()
+                started_at = limiter.acquire(deadline.remaining())
+        outcome = AdaptiveConcurrencyLimiter.DROPPED
         try:
-            error_data = response.json()
-            message = error_data.get('message', 'Unknown error')
-            details = error_data.get('details', {})
-        except ValueError:
-            message = response.text or 'Unknown error'
-            details = {}
+            response = self._dispatch(replace(request, timeout=self._request_timeout(deadline)))
+            outcome = self._concurrency_outcome(response.status_code)
+            return response
+        finally:
+            if limiter is not None:
+                limiter.release(started_at, outcome)
+    
+    def _dispatch(self, request: Request) -> Response:
+        """
+        Send a request through the transport, hedging it if the policy applies.
         
-        raise ApiException(
-            message,
-            response.status_code,
-            response.text,
-            details
-        )
+        Hedged requests are sent from a thread pool so that the calling
+        thread can return the first response. Copies are only handed to idle
+        pool threads and never queue there: with every thread busy the
+        request is sent on the calling thread without a hedge, so the pool
+        does not cap the throughput of the client. A losing request that has
+        already started runs to completion and its response is dropped.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The first successful response
+            
+        Raises:
+            TransportError: If every copy of the request failed
+        """
+        hedging = self.hedging
+        if hedging is None or not hedging.applies_to(request):
+            return self.transport.send(request)
+        
+        hedging.record_request()
+        pool = self._hedge_executor(hedging)
+        if not self._hedge_threads.acquire(blocking=False):
+            return self._timed_send(request, hedging)
+        primary = self._submit(pool, request, hedging)
+        futures = [primary]
+        done, _ = wait(futures, timeout=hedging.delay())
+        if not done:
+            hedge = self._send_hedge(pool, request, hedging)
+            if hedge is not None:
+                futures.append(hedge)
+        
+        pending = set(futures)
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except TransportError as e:
+                    error = error or e
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                if future is not primary:
+                    hedging.record_hedge_win()
+                return response
+        raise error
+    
+    def _send_hedge(self, pool: ThreadPoolExecutor, request: Request, hedging: HedgingPolicy) -> Optional[Future]:
+        """Send a hedge from the pool if a thread, the rate limiters and a concurrency slot are free."""
+        if not self._hedge_threads.acquire(blocking=False):
+            hedging.record_denied()
+            return None
+        admitted, started_at = self._admit_hedge(hedging)
+        if not admitted:
+            self._hedge_threads.release()
+            return None
+        hedge = self._submit(pool, request, hedging)
+        hedge.add_done_callback(lambda future: self._finish_hedge(started_at, future))
+        return hedge
+    
+    def _submit(self, pool: ThreadPoolExecutor, request: Request, hedging: HedgingPolicy) -> Future:
+        """Send a request on an idle pool thread already taken, freeing the thread when done."""
+        future = pool.submit(self._timed_send, request, hedging)
+        future.add_done_callback(lambda _: self._hedge_threads.release())
+        return future
+    
+    def _timed_send(self, request: Request, hedging: HedgingPolicy) -> Response:
+        """Send a request, recording its latency with the hedging policy."""
+        started = hedging.clock()
+        response = self.transport.send(request)
+        hedging.record_latency(hedging.clock() - started)
+        return response
+    
+    def _hedge_executor(self, hedging: HedgingPolicy) -> ThreadPoolExecutor:
+        """Get the thread pool hedged requests are sent from, creating it on first use."""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_threads = threading.BoundedSemaphore(hedging.max_workers)
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=hedging.max_workers,
+                    thread_name_prefix='rocketreach-hedge',
+                )
+            return self._hedge_pool
     
     def close(self) -> None:
-        """Close the HTTP session."""
-        self.session.close()
+        """Close the transport and the rate limiter opened by the client."""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.transport.close()
+        self._close_rate_limiter()
     
     def __enter__(self):
         """Context manager entry."""
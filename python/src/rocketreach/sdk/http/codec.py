@@ -0,0 +1,49 @@
+"""
+JSON Codec
+
+Encodes request bodies and decodes response bodies, using orjson when it
+is installed and the standard library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Encode a request body as compact UTF-8 JSON.
+    
+    Args:
+        data: JSON-serialisable data
+        
+    Returns:
+        The encoded body
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON response body.
+    
+    Args:
+        content: Raw response body
+        
+    Returns:
+        The decoded data
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
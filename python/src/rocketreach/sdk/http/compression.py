@@ -0,0 +1,293 @@
+"""
+Response Compression
+
+Accept-Encoding negotiation and measurement of compressed response
+bodies. gzip and deflate are always available; brotli (``br``) and
+zstandard (``zstd``) are offered when the brotli (or brotlicffi) and
+zstandard packages are installed. Bodies are decompressed incrementally
+while they are read, and their size on the wire is measured.
+"""
+
+import threading
+import warnings
+import zlib
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+from .transport import Response, TransportError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without zstandard
+    zstandard = None
+
+# Bytes read from the connection at a time while decoding a body
+CHUNK_SIZE = 64 * 1024
+
+# Encodings in order of preference: best ratio on JSON first
+PREFERRED_ENCODINGS = ('zstd', 'br', 'gzip', 'deflate')
+
+_DECODE_ERRORS: Tuple[type, ...] = (zlib.error,)
+if brotli is not None:
+    _DECODE_ERRORS += (brotli.error,)
+if zstandard is not None:
+    _DECODE_ERRORS += (zstandard.ZstdError,)
+
+
+def available_encodings() -> Tuple[str, ...]:
+    """
+    Get the content encodings that can be decoded, most preferred first.
+    
+    Returns:
+        Encoding names as used in Accept-Encoding
+    """
+    installed = {'zstd': zstandard is not None, 'br': brotli is not None}
+    return tuple(encoding for encoding in PREFERRED_ENCODINGS if installed.get(encoding, True))
+
+
+def negotiate_encodings(accept_encoding: Union[bool, Sequence[str]]) -> Tuple[str, ...]:
+    """
+    Decide which content encodings to offer.
+    
+    Encodings that were asked for but need a package that is not installed
+    are left out with a warning.
+    
+    Args:
+        accept_encoding: True to offer every available encoding, False for
+            uncompressed responses only, or the encodings to offer in order
+            of preference
+            
+    Returns:
+        The encodings to offer
+        
+    Raises:
+        ValueError: If an encoding is not supported at all
+    """
+    if accept_encoding is True:
+        return available_encodings()
+    if accept_encoding is False:
+        return ()
+    
+    requested = tuple(encoding.strip().lower() for encoding in accept_encoding)
+    unknown = [encoding for encoding in requested if encoding not in PREFERRED_ENCODINGS]
+    if unknown:
+        raise ValueError(f"Unsupported content encoding: {', '.join(unknown)}")
+    
+    available = available_encodings()
+    missing = [encoding for encoding in requested if encoding not in available]
+    if missing:
+        warnings.warn(
+            f"Content encoding {', '.join(missing)} needs an optional package "
+            f"(pip install rocketreach-sdk[compression]); not offering it",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+    return tuple(encoding for encoding in requested if encoding in available)
+
+
+def accept_encoding_header(encodings: Sequence[str]) -> str:
+    """
+    Build the Accept-Encoding header value for the offered encodings.
+    
+    Args:
+        encodings: Encodings to offer, most preferred first
+        
+    Returns:
+        The header value, ``identity`` if nothing is offered
+    """
+    return ', '.join(encodings) if encodings else 'identity'
+
+
+class _DeflateDecoder:
+    """Decoder for ``deflate``, which servers send both zlib-wrapped and raw."""
+    
+    def __init__(self):
+        self._decoder = zlib.decompressobj()
+        self._buffer: Optional[bytes] = b''
+    
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._buffer is None:
+            return self._decoder.decompress(chunk)
+        self._buffer += chunk
+        try:
+            data = self._decoder.decompress(chunk)
+        except zlib.error:
+            # Not zlib-wrapped: start over with a raw deflate stream
+            buffered, self._buffer = self._buffer, None
+            self._decoder = zlib.decompressobj(-zlib.MAX_WBITS)
+            return self._decoder.decompress(buffered)
+        if data:
+            self._buffer = None
+        return data
+    
+    def flush(self) -> bytes:
+        return self._decoder.flush()
+
+
+class _BrotliDecoder:
+    """Decoder for ``br``, accepting either brotli binding."""
+    
+    def __init__(self):
+        self._decoder = brotli.Decompressor()
+        self._decompress = getattr(self._decoder, 'process', None) or self._decoder.decompress
+    
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decompress(chunk)
+    
+    def flush(self) -> bytes:
+        return b''
+
+
+def _decoder(encoding: str) -> Any:
+    """Create an incremental decoder for one content encoding."""
+    if encoding in ('gzip', 'x-gzip'):
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if encoding == 'deflate':
+        return _DeflateDecoder()
+    if encoding == 'br' and brotli is not None:
+        return _BrotliDecoder()
+    if encoding == 'zstd' and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise TransportError(f"Unsupported Content-Encoding: {encoding}")
+
+
+class StreamDecoder:
+    """
+    Incremental decoder for a response body.
+    
+    Chunks are decoded as they are read, so the compressed body is never
+    held in memory alongside the decoded one. Stacked encodings such as
+    ``gzip, br`` are undone in reverse order.
+    
+    Args:
+        content_encoding: Value of the Content-Encoding response header
+    """
+    
+    def __init__(self, content_encoding: Optional[str]):
+        encodings = [encoding.strip().lower() for encoding in (content_encoding or '').split(',')]
+        self.encodings = [encoding for encoding in encodings if encoding and encoding != 'identity']
+        self._decoders = [_decoder(encoding) for encoding in reversed(self.encodings)]
+        self.wire_size = 0
+    
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Decode the next chunk of the body as received.
+        
+        Args:
+            chunk: Bytes read from the connection
+            
+        Returns:
+            The decoded bytes available so far
+            
+        Raises:
+            TransportError: If the body is not validly encoded
+        """
+        self.wire_size += len(chunk)
+        try:
+            for decoder in self._decoders:
+                chunk = decoder.decompress(chunk)
+        except _DECODE_ERRORS as e:
+            raise TransportError(f"Failed to decode {', '.join(self.encodings)} response body: {e}") from e
+        return chunk
+    
+    def finish(self) -> bytes:
+        """
+        Flush the decoders at the end of the body.
+        
+        Returns:
+            The remaining decoded bytes
+            
+        Raises:
+            TransportError: If the body is not validly encoded
+        """
+        data = b''
+        try:
+            for decoder in self._decoders:
+                data = (decoder.decompress(data) if data else b'') + decoder.flush()
+        except _DECODE_ERRORS as e:
+            raise TransportError(f"Failed to decode {', '.join(self.encodings)} response body: {e}") from e
+        return data
+
+
+def decode_body(chunks: Iterable[bytes], content_encoding: Optional[str]) -> Tuple[bytes, int]:
+    """
+    Decode a response body read in chunks.
+    
+    Args:
+        chunks: The body as received from the connection
+        content_encoding: Value of the Content-Encoding response header
+        
+    Returns:
+        The decoded body and the number of bytes received
+    """
+    decoder = StreamDecoder(content_encoding)
+    parts: List[bytes] = [decoder.feed(chunk) for chunk in chunks]
+    parts.append(decoder.finish())
+    return b''.join(parts), decoder.wire_size
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """
+    Response body sizes seen by an HTTP client.
+    
+    ``wire_bytes`` counts the bodies as received and ``decoded_bytes`` the
+    same bodies after decompression. Responses from transports that do not
+    report their wire size are not counted.
+    """
+    
+    responses: int = 0
+    compressed_responses: int = 0
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    
+    @property
+    def saved_bytes(self) -> int:
+        """Get the number of bytes compression kept off the wire."""
+        return max(0, self.decoded_bytes - self.wire_bytes)
+    
+    @property
+    def compression_ratio(self) -> float:
+        """Get the decoded size per byte received, 1.0 without compression."""
+        if self.wire_bytes == 0:
+            return 1.0
+        return self.decoded_bytes / self.wire_bytes
+
+
+class CompressionMeter:
+    """Thread-safe accumulator of CompressionStats."""
+    
+    def __init__(self):
+        self._stats = CompressionStats()
+        self._lock = threading.Lock()
+    
+    @property
+    def stats(self) -> CompressionStats:
+        """Get the totals so far."""
+        return self._stats
+    
+    def record(self, response: Response) -> None:
+        """
+        Count the body of a response.
+        
+        Args:
+            response: Response whose transport reported its wire size
+        """
+        if response.wire_size is None:
+            return
+        compressed = bool(response.headers.get('Content-Encoding'))
+        with self._lock:
+            stats = self._stats
+            self._stats = CompressionStats(
+                responses=stats.responses + 1,
+                compressed_responses=stats.compressed_responses + compressed,
+                wire_bytes=stats.wire_bytes + response.wire_size,
+                decoded_bytes=stats.decoded_bytes + len(response.content),
+            )
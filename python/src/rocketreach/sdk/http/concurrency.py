@@ -0,0 +1,222 @@
+"""
+Adaptive Concurrency
+
+AIMD controller for the number of requests kept in flight.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase/multiplicative-decrease limit on in-flight requests.
+    
+    Every healthy response raises the limit by ``increase / limit``, so the
+    limit grows by roughly ``increase`` per window of requests. A 429, a
+    network failure, a 5xx or a response slower than ``latency_tolerance``
+    times the smoothed latency cuts the limit by ``decrease_factor``. Only
+    requests started after the previous cut can trigger another one, so a
+    burst of throttled responses from the same window counts once.
+    
+    Args:
+        initial_limit: Starting number of requests allowed in flight
+        min_limit: Lower bound of the limit
+        max_limit: Upper bound of the limit
+        increase: Additive increase per window of successful requests
+        decrease_factor: Multiplier applied to the limit on congestion
+        latency_tolerance: Latency ratio over the smoothed latency that
+            counts as congestion, or None to ignore latency
+        clock: Monotonic clock, overridable for testing
+        
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=64)
+        >>> client = RocketReachClient("your-api-key", concurrency_limiter=limiter)
+        >>> limiter.limit
+        4
+    """
+    
+    SUCCESS = 'success'
+    THROTTLED = 'throttled'
+    DROPPED = 'dropped'
+    
+    LATENCY_SMOOTHING = 0.1
+    
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_tolerance: Optional[float] = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+        
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        
+        self._clock = clock
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._smoothed_latency: Optional[float] = None
+        self._last_decrease_at = float('-inf')
+        self._condition = threading.Condition()
+        # Coroutines waiting in acquire_async(), in arrival order, with the
+        # event loop each one runs on
+        self._async_waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+    
+    @property
+    def limit(self) -> int:
+        """Get the current number of requests allowed in flight."""
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests currently in flight."""
+        return self._in_flight
+    
+    @property
+    def smoothed_latency(self) -> Optional[float]:
+        """Get the smoothed latency of successful requests in seconds."""
+        return self._smoothed_latency
+    
+    def try_acquire(self) -> Optional[float]:
+        """
+        Take a slot if one is free.
+        
+        Returns:
+            The start time to pass to release(), or None if the limit is reached
+        """
+        with self._condition:
+            return self._take_slot()
+    
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Block until a slot is free and take it.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            The start time to pass to release(), or None on timeout
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._in_flight < self.limit, timeout):
+                return None
+            return self._take_slot()
+    
+    async def acquire_async(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Wait without blocking the event loop until a slot is free and take it.
+        
+        Waiting coroutines are queued in arrival order and handed a slot by
+        release() or cancel() as soon as one frees up.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+            
+        Returns:
+            The start time to pass to release(), or None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        with self._condition:
+            if not self._async_waiters:
+                started_at = self._take_slot()
+                if started_at is not None:
+                    return started_at
+            waiter = (loop, loop.create_future())
+            self._async_waiters.append(waiter)
+        
+        try:
+            return await asyncio.wait_for(waiter[1], timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # A slot handed over after the wait ended is freed by _deliver()
+            with self._condition:
+                if waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return None
+    
+    def release(self, started_at: float, outcome: str) -> None:
+        """
+        Free a slot and adjust the limit from the outcome of the request.
+        
+        Args:
+            started_at: Value returned when the slot was acquired
+            outcome: SUCCESS, THROTTLED or DROPPED
+        """
+        with self._condition:
+            self._in_flight -= 1
+            latency = self._clock() - started_at
+            
+            if outcome == self.SUCCESS and not self._is_slow(latency):
+                self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+            elif started_at >= self._last_decrease_at:
+                self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+                self._last_decrease_at = self._clock()
+            
+            if outcome == self.SUCCESS:
+                self._record_latency(latency)
+            
+            self._wake_async_waiters()
+            self._condition.notify_all()
+    
+    def cancel(self) -> None:
+        """Free a slot without adjusting the limit, for a request that was abandoned."""
+        with self._condition:
+            self._in_flight -= 1
+            self._wake_async_waiters()
+            self._condition.notify_all()
+    
+    def _take_slot(self) -> Optional[float]:
+        """Take a slot while holding the lock."""
+        if self._in_flight >= self.limit:
+            return None
+        self._in_flight += 1
+        return self._clock()
+    
+    def _wake_async_waiters(self) -> None:
+        """Hand the free slots to the longest waiting coroutines while holding the lock."""
+        while self._async_waiters and self._in_flight < self.limit:
+            loop, future = self._async_waiters.popleft()
+            if future.done():
+                continue
+            started_at = self._take_slot()
+            try:
+                loop.call_soon_threadsafe(self._deliver, future, started_at)
+            except RuntimeError:
+                # The loop of the waiter is closed
+                self._in_flight -= 1
+    
+    def _deliver(self, future: asyncio.Future, started_at: float) -> None:
+        """Resolve a waiting coroutine with its slot, on its event loop."""
+        if future.done():
+            # The wait timed out or was cancelled after the slot was taken
+            self.cancel()
+        else:
+            future.set_result(started_at)
+    
+    def _is_slow(self, latency: float) -> bool:
+        """Check whether a latency sample indicates congestion."""
+        if self.latency_tolerance is None or self._smoothed_latency is None:
+            return False
+        return latency > self._smoothed_latency * self.latency_tolerance
+    
+    def _record_latency(self, latency: float) -> None:
+        """Fold a latency sample into the smoothed latency."""
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += self.LATENCY_SMOOTHING * (latency - self._smoothed_latency)
@@ -0,0 +1,59 @@
+"""
+Deadlines
+
+End-to-end time budget of one API call across all of its attempts.
+"""
+
+import time
+from typing import Callable, Optional
+from ..exceptions import DeadlineExceededException
+
+
+class Deadline:
+    """
+    Time budget shared by every attempt, wait and backoff of one call.
+    
+    A deadline without a budget never expires, so the clients can thread
+    one through the retry loop unconditionally.
+    
+    Args:
+        budget: Number of seconds the call may take, or None for no deadline
+        clock: Monotonic clock, overridable for testing
+    """
+    
+    def __init__(self, budget: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if budget is not None and budget <= 0:
+            raise ValueError("Deadline must be greater than zero")
+        
+        self.budget = budget
+        self._clock = clock
+        self.expires_at = None if budget is None else clock() + budget
+    
+    def remaining(self) -> Optional[float]:
+        """Get the number of seconds left, or None if there is no deadline."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - self._clock())
+    
+    def clamp(self, timeout: float) -> float:
+        """Limit a timeout to the time left."""
+        remaining = self.remaining()
+        return timeout if remaining is None else min(timeout, remaining)
+    
+    def ensure(self, delay: float = 0.0, cause: Optional[BaseException] = None) -> None:
+        """
+        Check that the deadline leaves room for a wait.
+        
+        Args:
+            delay: Number of seconds the caller is about to wait
+            cause: Error that led to the wait, chained to the exception
+            
+        Raises:
+            DeadlineExceededException: If the wait would end at or past the deadline
+        """
+        if self.expires_at is None or self._clock() + delay < self.expires_at:
+            return
+        
+        exception = DeadlineExceededException(deadline=self.budget)
+        exception.__cause__ = cause
+        raise exception
@@ -0,0 +1,145 @@
+"""
+Request Hedging
+
+Adaptive hedging policy cutting the latency tail of idempotent requests.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, FrozenSet, Iterable
+from .retry import RetryBudget
+from .transport import Request
+
+
+class HedgingPolicy:
+    """
+    Sends a second copy of a slow request and keeps the first answer.
+    
+    When a request has not been answered after the ``percentile`` latency
+    of recent requests, an identical hedge is sent and whichever response
+    arrives first wins; the other request is cancelled. The asyncio client
+    aborts it, the blocking client drops it if it has not started yet and
+    otherwise discards its response. Every request deposits
+    ``max_extra_load`` into a RetryBudget and every hedge withdraws one,
+    so hedging adds at most that share of extra requests. A hedge is also
+    only sent if the client's rate limiters and concurrency limiter let it
+    go out at once; it never waits for them.
+    
+    Only methods in ``methods`` are hedged, by default GET, whose lookups
+    are safe to send twice.
+    
+    Args:
+        percentile: Latency percentile, between 0 and 1, after which a hedge
+            is sent
+        max_extra_load: Hedges allowed per request
+        min_delay: Lower bound of the hedge delay in seconds
+        initial_delay: Hedge delay used until ``min_samples`` latencies have
+            been recorded
+        window: Number of recent latencies the percentile is taken over
+        min_samples: Latencies needed before the percentile is used
+        max_workers: Threads the blocking client sends hedged requests with
+        methods: HTTP methods to hedge
+        clock: Monotonic clock, overridable for testing
+        
+    Example:
+        >>> client = RocketReachClient("your-api-key", hedging=HedgingPolicy(percentile=0.9))
+        >>> person = client.person_lookup().id(12345).lookup()
+    """
+    
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        max_extra_load: float = 0.1,
+        min_delay: float = 0.01,
+        initial_delay: float = 1.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 32,
+        methods: Iterable[str] = ('GET',),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < percentile < 1:
+            raise ValueError("Percentile must be between 0 and 1")
+        if window < 1 or min_samples < 1:
+            raise ValueError("Window and min_samples must be at least 1")
+        
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min(min_samples, window)
+        self.max_workers = max_workers
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+        self.clock = clock
+        self.budget = RetryBudget(ratio=max_extra_load, reserve=0, max_balance=10)
+        
+        self.requests = 0
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self._limits_denied = 0
+        
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    @property
+    def hedges_denied(self) -> int:
+        """Get the number of hedges the load cap or the client's limiters did not allow."""
+        return self.budget.retries_denied + self._limits_denied
+    
+    def applies_to(self, request: Request) -> bool:
+        """Check whether a request may be hedged."""
+        return request.method in self.methods
+    
+    def delay(self) -> float:
+        """
+        Get the time to wait for an answer before hedging.
+        
+        Returns:
+            The configured percentile of recent latencies in seconds
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, math.ceil(self.percentile * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+    
+    def record_request(self) -> None:
+        """Count a hedgeable request towards the hedge budget."""
+        with self._lock:
+            self.requests += 1
+        self.budget.record_request()
+    
+    def try_hedge(self) -> bool:
+        """
+        Take a hedge from the budget.
+        
+        Returns:
+            True if the hedge may be sent
+        """
+        if not self.budget.try_spend():
+            return False
+        with self._lock:
+            self.hedges_sent += 1
+        return True
+    
+    def record_denied(self) -> None:
+        """Count a hedge held back by the client's rate or concurrency limits."""
+        with self._lock:
+            self._limits_denied += 1
+    
+    def record_latency(self, seconds: float) -> None:
+        """
+        Record how long a request took.
+        
+        Args:
+            seconds: Time from sending the request to its response
+        """
+        with self._lock:
+            self._latencies.append(seconds)
+    
+    def record_hedge_win(self) -> None:
+        """Count a hedge that answered before the original request."""
+        with self._lock:
+            self.hedges_won += 1
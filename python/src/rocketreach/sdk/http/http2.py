@@ -0,0 +1,70 @@
+"""
+HTTP/2 Client
+
+Blocking HTTP client that multiplexes requests over HTTP/2 connections.
+"""
+
+import httpx
+from typing import Any, Optional
+from .client import HttpClient
+from .httpx_transport import HttpxTransport
+
+
+class Http2Client(HttpClient):
+    """
+    HTTP client sending requests over HTTP/2 with httpx.
+    
+    Concurrent requests from many threads share a few multiplexed TLS
+    connections instead of holding one pooled HTTP/1.1 connection each.
+    Servers that do not negotiate HTTP/2 are spoken to over HTTP/1.1, and
+    if the ``h2`` package is missing (``pip install rocketreach-sdk[http2]``)
+    the client warns and uses HTTP/1.1 throughout. Retries, rate limiting
+    and the other options behave exactly as in HttpClient.
+    
+    Args:
+        http2: Whether to offer HTTP/2 when connecting
+        max_connections: Maximum number of connections, or None for no limit
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept open
+        
+    Raises:
+        TypeError: If given the urllib3 pool options of HttpClient, which
+            httpx has no equivalent for
+    """
+    
+    POOL_OPTIONS = frozenset({'pool_connections', 'pool_maxsize', 'pool_block', 'tcp_keepalive'})
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        timeout: int = 30,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        http2: bool = True,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        **options: Any,
+    ):
+        unsupported = sorted(self.POOL_OPTIONS.intersection(options))
+        if unsupported:
+            raise TypeError(
+                f"{', '.join(unsupported)} not supported over HTTP/2; "
+                "use max_connections, max_keepalive_connections and keepalive_expiry"
+            )
+        
+        transport = HttpxTransport(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        super().__init__(base_url, api_key, timeout, retry_attempts, retry_delay, transport=transport, **options)
+    
+    @property
+    def http2(self) -> bool:
+        """Check whether HTTP/2 is offered when connecting."""
+        return self.transport.http2
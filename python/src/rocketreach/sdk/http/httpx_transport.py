@@ -0,0 +1,155 @@
+"""
+HTTPX Transports
+
+Blocking and asyncio transports backed by httpx, optionally over HTTP/2.
+"""
+
+import warnings
+import httpx
+from typing import MutableMapping, Optional
+from .transport import (
+    AsyncTransport,
+    Request,
+    Response,
+    Transport,
+    TransportConnectionError,
+    TransportError,
+    TransportTimeout,
+)
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package needed for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def negotiate_http2(requested: bool) -> bool:
+    """
+    Decide whether to offer HTTP/2, warning if it was requested but cannot be used.
+    
+    Args:
+        requested: Whether the caller asked for HTTP/2
+        
+    Returns:
+        True if HTTP/2 will be offered, False to use HTTP/1.1
+    """
+    if requested and not http2_available():
+        warnings.warn(
+            "HTTP/2 requires the h2 package (pip install rocketreach-sdk[http2]); falling back to HTTP/1.1",
+            RuntimeWarning,
+            stacklevel=4,
+        )
+        return False
+    return requested
+
+
+def _httpx_request_options(request: Request) -> dict:
+    """Translate a request into httpx keyword arguments."""
+    timeout = request.timeout
+    if isinstance(timeout, tuple):
+        timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+    return {
+        'method': request.method,
+        'url': request.url,
+        'params': request.params,
+        'content': request.body,
+        'timeout': timeout,
+    }
+
+
+class HttpxTransport(Transport):
+    """
+    Blocking transport backed by httpx.Client.
+    
+    With ``http2`` concurrent requests from many threads share a few
+    multiplexed connections. Servers that do not negotiate HTTP/2 are
+    spoken to over HTTP/1.1, and if the ``h2`` package is missing the
+    transport warns and uses HTTP/1.1 throughout. Compressed bodies are
+    decoded incrementally by httpx.
+    
+    Args:
+        http2: Whether to offer HTTP/2 when connecting
+        limits: Connection pool limits
+    """
+    
+    def __init__(self, http2: bool = False, limits: Optional[httpx.Limits] = None):
+        self.http2 = negotiate_http2(http2)
+        self.session = httpx.Client(http2=self.http2, limits=limits or httpx.Limits())
+    
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        """Get the headers sent with every request."""
+        return self.session.headers
+    
+    def send(self, request: Request) -> Response:
+        """
+        Send a request through the httpx client.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        try:
+            response = self.session.request(**_httpx_request_options(request))
+        except httpx.TimeoutException as e:
+            raise TransportTimeout(str(e)) from e
+        except httpx.NetworkError as e:
+            raise TransportConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        
+        return Response(response.status_code, response.headers, response.content, response.num_bytes_downloaded)
+    
+    def close(self) -> None:
+        """Close the httpx client."""
+        self.session.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """
+    Asyncio transport backed by httpx.AsyncClient.
+    
+    Args:
+        http2: Whether to offer HTTP/2 when connecting
+        limits: Connection pool limits
+    """
+    
+    def __init__(self, http2: bool = False, limits: Optional[httpx.Limits] = None):
+        self.http2 = negotiate_http2(http2)
+        self.session = httpx.AsyncClient(http2=self.http2, limits=limits or httpx.Limits())
+    
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        """Get the headers sent with every request."""
+        return self.session.headers
+    
+    async def send(self, request: Request) -> Response:
+        """
+        Send a request through the httpx client.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        try:
+            response = await self.session.request(**_httpx_request_options(request))
+        except httpx.TimeoutException as e:
+            raise TransportTimeout(str(e)) from e
+        except httpx.NetworkError as e:
+            raise TransportConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        
+        return Response(response.status_code, response.headers, response.content, response.num_bytes_downloaded)
+    
+    async def close(self) -> None:
+        """Close the httpx client."""
+        await self.session.aclose()
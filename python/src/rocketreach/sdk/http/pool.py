@@ -0,0 +1,144 @@
+"""
+Connection Pooling
+
+Connection pool sizing, TCP keep-alive and reuse statistics for the
+urllib3-based transports.
+"""
+
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    """
+    Connection reuse counters of an HTTP client.
+    
+    ``requests`` counts every request sent through the pools and
+    ``new_connections`` every connection opened, i.e. every TCP (and TLS)
+    handshake. The rest of the requests reused a kept-alive connection.
+    """
+    
+    requests: int = 0
+    new_connections: int = 0
+    
+    @property
+    def reused_connections(self) -> int:
+        """Get the number of requests sent on an existing connection."""
+        return max(0, self.requests - self.new_connections)
+    
+    @property
+    def reuse_ratio(self) -> float:
+        """Get the share of requests that skipped the handshake."""
+        if self.requests == 0:
+            return 0.0
+        return self.reused_connections / self.requests
+
+
+def keepalive_socket_options(idle: float, interval: Optional[float] = None) -> List[Tuple[int, int, int]]:
+    """
+    Build socket options enabling TCP keep-alive probes.
+    
+    Probes keep idle pooled connections from being silently dropped by NAT
+    gateways and load balancers. Options the platform does not support are
+    left out.
+    
+    Args:
+        idle: Seconds a connection is idle before the first probe
+        interval: Seconds between probes. Defaults to ``idle``.
+        
+    Returns:
+        Socket options for urllib3, including its defaults
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    
+    # Linux and Windows call the idle time TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    idle_option = getattr(socket, 'TCP_KEEPIDLE', None) or getattr(socket, 'TCP_KEEPALIVE', None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, max(1, int(idle))))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, max(1, int(interval or idle))))
+    return options
+
+
+class PoolManagerStats:
+    """
+    Connection reuse counters of all host pools of a urllib3 pool manager.
+    
+    Host pools evicted from the pool manager are closed and forgotten by
+    urllib3, so their counts are kept here when they are disposed of.
+    
+    Args:
+        poolmanager: Pool manager to count requests and connections of
+    """
+    
+    def __init__(self, poolmanager: Any):
+        self.poolmanager = poolmanager
+        self._retired_requests = 0
+        self._retired_connections = 0
+        self._lock = threading.Lock()
+        
+        pools = poolmanager.pools
+        dispose = pools.dispose_func
+        
+        def retire(pool: Any) -> None:
+            with self._lock:
+                self._retired_requests += pool.num_requests
+                self._retired_connections += pool.num_connections
+            if dispose is not None:
+                dispose(pool)
+        
+        pools.dispose_func = retire
+    
+    @property
+    def stats(self) -> ConnectionStats:
+        """Get the connection reuse counters of all host pools."""
+        pools = self.poolmanager.pools
+        live = [pool for pool in (pools.get(key) for key in pools.keys()) if pool is not None]
+        with self._lock:
+            return ConnectionStats(
+                requests=self._retired_requests + sum(pool.num_requests for pool in live),
+                new_connections=self._retired_connections + sum(pool.num_connections for pool in live),
+            )
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    Transport adapter with TCP keep-alive and connection reuse statistics.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host. Should
+            be at least the number of threads sharing the client.
+        pool_block: Whether to wait for a free connection when the pool is
+            exhausted instead of opening a throwaway one
+        tcp_keepalive: Idle seconds before TCP keep-alive probes, or None to
+            use the operating system defaults
+    """
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+    ):
+        self.tcp_keepalive = tcp_keepalive
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        """Create the pool manager, adding keep-alive socket options if configured."""
+        if self.tcp_keepalive is not None:
+            pool_kwargs.setdefault('socket_options', keepalive_socket_options(self.tcp_keepalive))
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self._pool_stats = PoolManagerStats(self.poolmanager)
+    
+    @property
+    def stats(self) -> ConnectionStats:
+        """Get the connection reuse counters of all host pools."""
+        return self._pool_stats.stats
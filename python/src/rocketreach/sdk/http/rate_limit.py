@@ -0,0 +1,459 @@
+"""
+Rate Limiting
+
+Client-side rate limiters that pace requests before they are sent.
+"""
+
+import hashlib
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+
+class RateLimiter:
+    """
+    Base class for client-side rate limiters.
+    
+    A rate limiter hands out permission to send requests. reserve() never
+    blocks; it books the tokens and returns how long the caller has to wait
+    before using them, so the same limiter can pace both threads and
+    coroutines.
+    """
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens for a request.
+        
+        Args:
+            tokens: Number of tokens to consume
+            
+        Returns:
+            Number of seconds to wait before sending the request
+        """
+        raise NotImplementedError
+    
+    def acquire(self, tokens: int = 1) -> None:
+        """
+        Block the calling thread until the tokens are available.
+        
+        Args:
+            tokens: Number of tokens to consume
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+    
+    def release(self, tokens: int = 1) -> None:
+        """
+        Give back tokens reserved for a request that is not going to be sent.
+        
+        Args:
+            tokens: Number of tokens to return
+        """
+
+
+class TokenBucket(RateLimiter):
+    """
+    Thread-safe in-process token bucket.
+    
+    The bucket refills at ``rate`` tokens per second up to ``burst`` tokens.
+    Reservations may drive the bucket negative, which queues callers in
+    arrival order instead of letting them race for the next token.
+    
+    Args:
+        rate: Sustained number of requests per second
+        burst: Maximum number of requests sent back to back. Defaults to
+            one second worth of tokens (at least 1).
+        clock: Monotonic clock, overridable for testing
+    """
+    
+    _shared: Dict[str, 'TokenBucket'] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero")
+        
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("Burst must be at least 1")
+        
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, key: str, rate: float, burst: Optional[int] = None) -> 'TokenBucket':
+        """
+        Get the process-wide bucket for a key, creating it if needed.
+        
+        All clients configured with the same API key draw from the same
+        bucket. The registry only holds a SHA-256 digest of the key.
+        
+        Args:
+            key: Key identifying the quota, usually the API key
+            rate: Sustained number of requests per second
+            burst: Maximum number of requests sent back to back
+            
+        Returns:
+            The shared TokenBucket
+            
+        Raises:
+            ValueError: If the key already has a bucket with another rate or burst
+        """
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        with cls._shared_lock:
+            bucket = cls._shared.get(digest)
+            if bucket is None:
+                bucket = cls(rate, burst)
+                cls._shared[digest] = bucket
+                return bucket
+        
+        expected_burst = burst if burst is not None else max(1, int(rate))
+        if bucket.rate != float(rate) or bucket.burst != expected_burst:
+            raise ValueError(
+                f"A rate limit of {bucket.rate}/s with burst {bucket.burst} is already shared "
+                f"by clients using this key; got {float(rate)}/s with burst {expected_burst}"
+            )
+        return bucket
+    
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Forget every process-wide bucket, so the next clients start new ones."""
+        with cls._shared_lock:
+            cls._shared.clear()
+    
+    @property
+    def available(self) -> float:
+        """Get the number of tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens for a request.
+        
+        Args:
+            tokens: Number of tokens to consume
+            
+        Returns:
+            Number of seconds to wait before sending the request
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+    
+    def release(self, tokens: int = 1) -> None:
+        """
+        Give back tokens reserved for a request that is not going to be sent.
+        
+        Args:
+            tokens: Number of tokens to return
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(float(self.burst), self._tokens + tokens)
+    
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+
+class SqliteRateLimiter(RateLimiter):
+    """
+    Token bucket shared between processes through a local SQLite file.
+    
+    Every process on the host that points at the same file draws from one
+    bucket, so a pool of workers using the same API key stays under the
+    plan limit together. Each reservation is a short ``BEGIN IMMEDIATE``
+    transaction, which SQLite serialises across processes with a file lock.
+    The API key is only stored as a SHA-256 digest.
+    
+    Args:
+        path: Path of the SQLite database file, created if missing
+        key: Key identifying the quota, usually the API key
+        rate: Sustained number of requests per second
+        burst: Maximum number of requests sent back to back. Defaults to
+            one second worth of tokens (at least 1).
+        timeout: Seconds to wait for the database lock
+        clock: Wall clock shared by all processes, overridable for testing
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        key: str,
+        rate: float,
+        burst: Optional[int] = None,
+        timeout: float = 10.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero")
+        
+        self.path = path
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError("Burst must be at least 1")
+        
+        self._key = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve tokens for a request.
+        
+        Args:
+            tokens: Number of tokens to consume
+            
+        Returns:
+            Number of seconds to wait before sending the request
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM rate_limit_buckets WHERE key = ?",
+                    (self._key,),
+                ).fetchone()
+                now = self._clock()
+                if row is None:
+                    available = float(self.burst)
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    available = min(float(self.burst), row[0] + elapsed * self.rate)
+                available -= tokens
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                    (self._key, available, now),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        
+        if available >= 0:
+            return 0.0
+        return -available / self.rate
+    
+    def release(self, tokens: int = 1) -> None:
+        """
+        Give back tokens reserved for a request that is not going to be sent.
+        
+        Args:
+            tokens: Number of tokens to return
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE rate_limit_buckets SET tokens = MIN(?, tokens + ?) WHERE key = ?",
+                (float(self.burst), tokens, self._key),
+            )
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass(frozen=True)
+class RateLimitState:
+    """
+    Quota reported by the API in rate limit response headers.
+    
+    Both the ``X-RateLimit-*`` and the IETF ``RateLimit-*`` header families
+    are understood. The reset header may hold either the number of seconds
+    left in the window or a Unix timestamp.
+    """
+    
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset_after: Optional[float] = None
+    observed_at: float = 0.0
+    
+    HEADER_PREFIXES = ('X-RateLimit-', 'RateLimit-')
+    EPOCH_THRESHOLD = 1e9
+    
+    @classmethod
+    def from_headers(
+        cls,
+        headers: Mapping[str, Any],
+        now: Optional[float] = None,
+        wall_now: Optional[float] = None,
+    ) -> Optional['RateLimitState']:
+        """
+        Parse the quota from response headers.
+        
+        Args:
+            headers: Response headers
+            now: Monotonic time of the observation
+            wall_now: Unix time of the observation, used for timestamp resets
+            
+        Returns:
+            The parsed state, or None if the response carries no quota headers
+        """
+        limit = cls._header_value(headers, 'Limit')
+        remaining = cls._header_value(headers, 'Remaining')
+        reset = cls._header_value(headers, 'Reset')
+        if limit is None and remaining is None and reset is None:
+            return None
+        
+        if reset is not None and reset > cls.EPOCH_THRESHOLD:
+            reset = max(0.0, reset - (time.time() if wall_now is None else wall_now))
+        
+        return cls(
+            limit=int(limit) if limit is not None else None,
+            remaining=int(remaining) if remaining is not None else None,
+            reset_after=reset,
+            observed_at=time.monotonic() if now is None else now,
+        )
+    
+    @classmethod
+    def _header_value(cls, headers: Mapping[str, Any], name: str) -> Optional[float]:
+        """Get a numeric quota header from the first header family holding a valid number."""
+        for prefix in cls.HEADER_PREFIXES:
+            value = headers.get(prefix + name)
+            if value is None:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+            if math.isfinite(number):
+                return number
+        return None
+    
+    @property
+    def reset_at(self) -> Optional[float]:
+        """Get the monotonic time at which the quota window resets."""
+        if self.reset_after is None:
+            return None
+        return self.observed_at + self.reset_after
+
+
+class QuotaPacer(RateLimiter):
+    """
+    Pacing engine driven by the quota the API reports.
+    
+    While more than ``threshold`` of the quota is left requests go out
+    unpaced. Below it, the remaining requests are spread evenly over the
+    time left in the window, and once the quota is used up requests wait
+    for the window to reset, so callers slow down before they get a 429.
+    
+    Args:
+        threshold: Fraction of the limit below which pacing starts
+        clock: Monotonic clock, overridable for testing
+    """
+    
+    def __init__(self, threshold: float = 0.2, clock: Callable[[], float] = time.monotonic):
+        self.threshold = threshold
+        self._clock = clock
+        self._state: Optional[RateLimitState] = None
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> Optional[RateLimitState]:
+        """Get the last observed quota state."""
+        return self._state
+    
+    def update(self, headers: Mapping[str, Any]) -> Optional[RateLimitState]:
+        """
+        Record the quota reported in response headers.
+        
+        Args:
+            headers: Response headers
+            
+        Returns:
+            The parsed state, or None if the response carries no quota headers
+        """
+        state = RateLimitState.from_headers(headers, now=self._clock())
+        if state is not None:
+            with self._lock:
+                self._state = state
+        return state
+    
+    def reserve(self, tokens: int = 1) -> float:
+        """
+        Reserve a send slot under the reported quota.
+        
+        Args:
+            tokens: Number of requests to send
+            
+        Returns:
+            Number of seconds to wait before sending the request
+        """
+        with self._lock:
+            state = self._state
+            now = self._clock()
+            if state is None or state.remaining is None or state.reset_at is None:
+                return 0.0
+            
+            time_left = state.reset_at - now
+            if time_left <= 0:
+                return 0.0
+            
+            if state.remaining <= 0:
+                return time_left
+            
+            interval = self._interval(now, tokens)
+            if interval is None:
+                return 0.0
+            
+            start = max(now, self._next_slot)
+            self._next_slot = start + interval
+            return start - now
+    
+    def release(self, tokens: int = 1) -> None:
+        """
+        Give back a send slot reserved for a request that is not going to be sent.
+        
+        Args:
+            tokens: Number of requests that were reserved
+        """
+        with self._lock:
+            now = self._clock()
+            interval = self._interval(now, tokens)
+            if interval is not None:
+                self._next_slot = max(now, self._next_slot - interval)
+    
+    def _interval(self, now: float, tokens: int) -> Optional[float]:
+        """Get the spacing of paced requests, or None while requests go out unpaced; the caller holds the lock."""
+        state = self._state
+        if state is None or state.remaining is None or state.reset_at is None:
+            return None
+        time_left = state.reset_at - now
+        if time_left <= 0 or state.remaining <= 0:
+            return None
+        if state.limit and state.remaining > state.limit * self.threshold:
+            return None
+        return time_left / state.remaining * tokens
@@ -0,0 +1,108 @@
+"""
+Requests Transport
+
+Transport sending requests through a pooled requests.Session.
+"""
+
+import requests
+from typing import MutableMapping, Optional, Tuple
+from urllib3.exceptions import HTTPError, ProtocolError, TimeoutError
+from urllib3.response import HTTPResponse
+from .compression import CHUNK_SIZE, decode_body
+from .pool import ConnectionStats, PooledHTTPAdapter
+from .transport import Request, Response, Transport, TransportConnectionError, TransportError, TransportTimeout
+
+
+def _read_body(response: requests.Response) -> Tuple[bytes, Optional[int]]:
+    """
+    Read and decode a streamed response body.
+    
+    The body is read undecoded from urllib3, so its size on the wire can be
+    measured, and decompressed chunk by chunk. Adapters that do not return
+    a urllib3 response are read through requests instead.
+    
+    Returns:
+        The decoded body and its size on the wire, if known
+    """
+    raw = response.raw
+    if not isinstance(raw, HTTPResponse):
+        return response.content, None
+    try:
+        chunks = raw.stream(CHUNK_SIZE, decode_content=False)
+        return decode_body(chunks, response.headers.get('Content-Encoding'))
+    finally:
+        raw.release_conn()
+
+
+class RequestsTransport(Transport):
+    """
+    Transport backed by requests.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Whether threads wait for a pooled connection instead of
+            opening a throwaway one when the pool is exhausted
+        tcp_keepalive: Idle seconds before TCP keep-alive probes are sent on
+            pooled connections, or None for the operating system default
+    """
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+    ):
+        self.session = requests.Session()
+        self.adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+    
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        """Get the headers sent with every request."""
+        return self.session.headers
+    
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Get the number of requests sent and connections opened so far."""
+        return self.adapter.stats
+    
+    def send(self, request: Request) -> Response:
+        """
+        Send a request through the session.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        try:
+            response = self.session.request(
+                method=request.method,
+                url=request.url,
+                params=request.params,
+                data=request.body,
+                timeout=request.timeout,
+                stream=True,
+            )
+            content, wire_size = _read_body(response)
+        except (requests.exceptions.Timeout, TimeoutError) as e:
+            raise TransportTimeout(str(e)) from e
+        except (requests.exceptions.ConnectionError, ProtocolError) as e:
+            raise TransportConnectionError(str(e)) from e
+        except (requests.exceptions.RequestException, HTTPError) as e:
+            raise TransportError(str(e)) from e
+        
+        return Response(response.status_code, response.headers, content, wire_size)
+    
+    def close(self) -> None:
+        """Close the session."""
+        self.session.close()
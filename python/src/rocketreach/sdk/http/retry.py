@@ -0,0 +1,88 @@
+"""
+Retry Policy
+
+Retry budget and backoff used by the HTTP clients.
+"""
+
+import random
+import threading
+from typing import Callable, Optional
+
+
+def full_jitter_backoff(
+    base_delay: float,
+    attempt: int,
+    max_delay: float,
+    rand: Optional[Callable[[float, float], float]] = None,
+) -> float:
+    """
+    Get a "full jitter" exponential backoff delay.
+    
+    The delay is drawn uniformly between zero and the exponential backoff
+    for the attempt, so clients that failed together do not retry together.
+    
+    Args:
+        base_delay: Delay of the first retry in seconds
+        attempt: Zero-based number of the failed attempt
+        max_delay: Upper bound of the delay in seconds
+        rand: Uniform random function. Defaults to random.uniform.
+        
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    rand = rand or random.uniform
+    return rand(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of the traffic sent.
+    
+    Every original request deposits ``ratio`` tokens and every retry
+    withdraws one, so during an incident retries add at most ``ratio``
+    extra load on top of the ``reserve`` that allows retries while traffic
+    is low.
+    
+    Args:
+        ratio: Retries allowed per original request
+        reserve: Tokens available before any traffic has been recorded
+        max_balance: Upper bound of the accumulated tokens
+    """
+    
+    def __init__(self, ratio: float = 0.2, reserve: int = 10, max_balance: int = 100):
+        if ratio < 0:
+            raise ValueError("Ratio must not be negative")
+        
+        self.ratio = ratio
+        self.max_balance = max(max_balance, reserve)
+        self.retries_allowed = 0
+        self.retries_denied = 0
+        
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+    
+    @property
+    def balance(self) -> float:
+        """Get the number of retries currently available."""
+        return self._balance
+    
+    def record_request(self) -> None:
+        """Deposit the share of an original request."""
+        with self._lock:
+            # Round away float drift so that e.g. ten deposits of 0.1 make one retry
+            self._balance = min(float(self.max_balance), round(self._balance + self.ratio, 9))
+    
+    def try_spend(self) -> bool:
+        """
+        Withdraw a retry if the budget allows it.
+        
+        Returns:
+            True if the retry may be sent
+        """
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                self.retries_allowed += 1
+                return True
+            self.retries_denied += 1
+            return False
@@ -0,0 +1,219 @@
+"""
+Single-Flight Coalescing
+
+Shares one API call between concurrent identical requests.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar, Union
+from ..exceptions import DeadlineExceededException
+from ..models import SearchQuery, LookupQuery
+from .deadline import Deadline
+
+T = TypeVar('T')
+
+
+def request_key(endpoint: str, params: Optional[Dict[str, Any]]) -> str:
+    """
+    Build the key identifying identical requests.
+    
+    Args:
+        endpoint: API endpoint path
+        params: Query parameters or body of the request
+        
+    Returns:
+        The endpoint and the parameters in canonical JSON form
+    """
+    return endpoint + ' ' + json.dumps(params or {}, sort_keys=True, separators=(',', ':'), default=str)
+
+
+def query_key(endpoint: str, query: Union[SearchQuery, LookupQuery]) -> str:
+    """
+    Build the key identifying requests for equivalent queries.
+    
+    Unlike request_key(), queries differing only in case, whitespace,
+    list order or LinkedIn URL form share a key.
+    
+    Args:
+        endpoint: API endpoint path
+        query: Query of the request
+        
+    Returns:
+        The endpoint and the fingerprint of the query
+    """
+    return endpoint + ' ' + query.fingerprint()
+
+
+class _Flight:
+    """A call in flight and the number of callers that joined it."""
+    
+    def __init__(self, future: Union[Future, asyncio.Future]):
+        self.future = future
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls from several threads.
+    
+    The first caller of a key runs the call; callers arriving with the same
+    key while it is in flight wait for it, up to their own deadline, and
+    receive a copy of its result, or the same exception. Nothing is
+    remembered once the call completes.
+    
+    Args:
+        enabled: Whether to coalesce at all. A disabled group runs every call.
+        
+    Example:
+        >>> group = SingleFlight()
+        >>> data = group.do(query_key('/person/lookup', query), lambda: client.get('/person/lookup', query.to_dict()))
+        >>> group.coalesced
+        0
+    """
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.calls = 0
+        self.coalesced = 0
+        
+        self._in_flight: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, call: Callable[[], T], deadline: Optional[Deadline] = None) -> T:
+        """
+        Run a call, or join the identical call already in flight.
+        
+        Args:
+            key: Key identifying identical calls
+            call: Function making the call
+            deadline: Deadline of the caller, bounding the wait for a call
+                already in flight
+            
+        Returns:
+            The result of the call, copied if other callers share it
+            
+        Raises:
+            DeadlineExceededException: If the deadline runs out while waiting
+                for the call in flight
+        """
+        if not self.enabled:
+            return call()
+        
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = _Flight(Future())
+                self.calls += 1
+                leader = True
+            else:
+                flight.followers += 1
+                self.coalesced += 1
+                leader = False
+        
+        future = flight.future
+        if not leader:
+            try:
+                result = future.result(timeout=deadline.remaining() if deadline is not None else None)
+            except FutureTimeoutError:
+                # Since Python 3.11 this is the builtin TimeoutError, which the
+                # call itself may have raised; only a wait cut short leaves
+                # the future pending
+                if not future.done():
+                    raise DeadlineExceededException(deadline=deadline.budget) from None
+                result = future.result()
+            return copy.deepcopy(result)
+        
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+        return copy.deepcopy(result) if flight.followers else result
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical calls from several coroutines.
+    
+    The call runs in its own task, so cancelling the coroutine that started
+    it does not cancel it for the other callers waiting on it. As with
+    SingleFlight, followers wait up to their own deadline and every caller
+    sharing a result receives its own copy.
+    
+    Args:
+        enabled: Whether to coalesce at all. A disabled group runs every call.
+    """
+    
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.calls = 0
+        self.coalesced = 0
+        
+        self._in_flight: Dict[Hashable, _Flight] = {}
+    
+    async def do(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        """
+        Run a call, or join the identical call already in flight.
+        
+        Args:
+            key: Key identifying identical calls
+            call: Coroutine function making the call
+            deadline: Deadline of the caller, bounding the wait for a call
+                already in flight
+            
+        Returns:
+            The result of the call, copied if other callers share it
+            
+        Raises:
+            DeadlineExceededException: If the deadline runs out while waiting
+                for the call in flight
+        """
+        if not self.enabled:
+            return await call()
+        
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            flight.followers += 1
+            self.coalesced += 1
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.shield(flight.future),
+                    deadline.remaining() if deadline is not None else None,
+                )
+            except asyncio.TimeoutError:
+                # As in SingleFlight.do(), the call may have raised TimeoutError
+                if not flight.future.done():
+                    raise DeadlineExceededException(deadline=deadline.budget) from None
+                result = flight.future.result()
+            return copy.deepcopy(result)
+        
+        task = asyncio.ensure_future(call())
+        flight = self._in_flight[key] = _Flight(task)
+        task.add_done_callback(lambda done: self._finish(key, done))
+        self.calls += 1
+        result = await asyncio.shield(task)
+        # Close the call to new followers before deciding whether to copy
+        self._finish(key, task)
+        return copy.deepcopy(result) if flight.followers else result
+    
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        """Forget a completed call and mark its exception as retrieved."""
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.future is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,187 @@
+"""
+Transports
+
+Sans-IO request and response types and the interface HTTP libraries are
+plugged in through.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Optional, Tuple, Union
+from .codec import dumps, loads
+from .pool import ConnectionStats
+
+
+class TransportError(Exception):
+    """Raised by a transport when a request could not be completed."""
+
+
+class TransportTimeout(TransportError):
+    """Raised by a transport when connecting or reading timed out."""
+
+
+class TransportConnectionError(TransportError):
+    """Raised by a transport when the connection failed."""
+
+
+@dataclass(frozen=True)
+class Request:
+    """
+    HTTP request as built by the client core.
+    
+    Headers sent with every request live on the transport, so a request
+    only carries what differs from call to call.
+    """
+    
+    method: str
+    url: str
+    params: Optional[Dict[str, Any]] = None
+    body: Optional[bytes] = None
+    timeout: Union[float, Tuple[float, float], None] = None
+
+
+@dataclass(frozen=True)
+class Response:
+    """
+    HTTP response as returned by a transport.
+    
+    ``content`` is the decoded body. ``wire_size`` is the size of the body
+    as received, before decompression, for transports that measure it.
+    """
+    
+    status_code: int
+    headers: Mapping[str, str] = field(default_factory=dict)
+    content: bytes = b''
+    wire_size: Optional[int] = None
+    
+    @classmethod
+    def from_json(
+        cls,
+        data: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> 'Response':
+        """
+        Build a response with a JSON body.
+        
+        Args:
+            data: JSON-serialisable body
+            status_code: HTTP status code
+            headers: Response headers
+            
+        Returns:
+            The response
+        """
+        return cls(status_code, dict(headers or {}), dumps(data))
+    
+    @property
+    def text(self) -> str:
+        """Get the body decoded as UTF-8."""
+        return self.content.decode('utf-8', errors='replace')
+    
+    def json(self) -> Any:
+        """
+        Decode the JSON body.
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        return loads(self.content)
+
+
+class Transport:
+    """
+    Blocking transport sending single requests.
+    
+    Transports only move bytes: retries, rate limiting, deadlines and error
+    mapping are done once by the client core for every transport.
+    Implementations raise TransportTimeout, TransportConnectionError or
+    TransportError when a request fails before a response arrives.
+    """
+    
+    headers: MutableMapping[str, str]
+    
+    def send(self, request: Request) -> Response:
+        """
+        Send a request and read the whole response.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        raise NotImplementedError
+    
+    @property
+    def connection_stats(self) -> Optional[ConnectionStats]:
+        """Get the connection reuse counters, or None if the transport does not collect them."""
+        return None
+    
+    def close(self) -> None:
+        """Release the connections held by the transport."""
+
+
+class AsyncTransport:
+    """Asyncio counterpart of Transport."""
+    
+    headers: MutableMapping[str, str]
+    
+    async def send(self, request: Request) -> Response:
+        """
+        Send a request and read the whole response.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        raise NotImplementedError
+    
+    async def close(self) -> None:
+        """Release the connections held by the transport."""
+
+
+class InMemoryTransport(Transport):
+    """
+    Transport answering requests from a function, without any network I/O.
+    
+    Useful for tests and for benchmarking the client core on its own. The
+    handler may raise TransportError to simulate network failures.
+    
+    Args:
+        handler: Called with every request, returns its response
+        
+    Example:
+        >>> transport = InMemoryTransport(lambda request: Response.from_json({"id": 1}))
+        >>> client = HttpClient("https://api.test", "key", transport=transport)
+    """
+    
+    def __init__(self, handler: Callable[[Request], Response]):
+        self.handler = handler
+        self.headers: Dict[str, str] = {}
+        self.requests: List[Request] = []
+    
+    def send(self, request: Request) -> Response:
+        """Record the request and answer it with the handler."""
+        self.requests.append(request)
+        return self.handler(request)
+
+
+class AsyncInMemoryTransport(AsyncTransport):
+    """
+    Asyncio transport answering requests from a function.
+    
+    Args:
+        handler: Called with every request, returns its response
+    """
+    
+    def __init__(self, handler: Callable[[Request], Response]):
+        self.handler = handler
+        self.headers: Dict[str, str] = {}
+        self.requests: List[Request] = []
+    
+    async def send(self, request: Request) -> Response:
+        """Record the request and answer it with the handler."""
+        self.requests.append(request)
+        return self.handler(request)
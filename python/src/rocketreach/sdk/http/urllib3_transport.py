@@ -0,0 +1,120 @@
+"""
+Urllib3 Transport
+
+Transport sending requests straight through a urllib3 PoolManager.
+"""
+
+import urllib3
+from urllib.parse import urlencode
+from typing import Any, Dict, Optional, Union
+from urllib3.exceptions import HTTPError, NewConnectionError, ProtocolError, SSLError, TimeoutError
+from .compression import CHUNK_SIZE, decode_body
+from .pool import ConnectionStats, PoolManagerStats, keepalive_socket_options
+from .transport import Request, Response, Transport, TransportConnectionError, TransportError, TransportTimeout
+
+
+def _encode_params(params: Dict[str, Any]) -> str:
+    """Encode query parameters the way requests does, dropping None values."""
+    return urlencode([(key, value) for key, value in params.items() if value is not None], doseq=True)
+
+
+def _urllib3_timeout(timeout: Union[float, tuple, None]) -> Union[urllib3.Timeout, float, None]:
+    """Translate a request timeout into a urllib3 timeout."""
+    if isinstance(timeout, tuple):
+        return urllib3.Timeout(connect=timeout[0], read=timeout[1])
+    return timeout
+
+
+class Urllib3Transport(Transport):
+    """
+    Transport backed directly by a urllib3 PoolManager.
+    
+    Skips the session layer of requests (hooks, cookie jar, redirect
+    handling, header merging and response wrapping), which none of the
+    API calls need, so less time is spent per request. Redirects are not
+    followed and urllib3's own retries are off: retries, rate limiting
+    and error mapping are done by the client core exactly as with
+    RequestsTransport. Compressed bodies are decoded chunk by chunk.
+    
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Whether threads wait for a pooled connection instead of
+            opening a throwaway one when the pool is exhausted
+        tcp_keepalive: Idle seconds before TCP keep-alive probes are sent on
+            pooled connections, or None for the operating system default
+            
+    Example:
+        >>> client = RocketReachClient("your-api-key", transport=Urllib3Transport(pool_maxsize=32))
+    """
+    
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+    ):
+        pool_kwargs: Dict[str, Any] = {}
+        if tcp_keepalive is not None:
+            pool_kwargs['socket_options'] = keepalive_socket_options(tcp_keepalive)
+        self.headers: Dict[str, str] = {}
+        self.poolmanager = urllib3.PoolManager(
+            num_pools=pool_connections,
+            maxsize=pool_maxsize,
+            block=pool_block,
+            retries=False,
+            **pool_kwargs,
+        )
+        self._pool_stats = PoolManagerStats(self.poolmanager)
+    
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Get the number of requests sent and connections opened so far."""
+        return self._pool_stats.stats
+    
+    def send(self, request: Request) -> Response:
+        """
+        Send a request through the pool manager.
+        
+        Args:
+            request: The request to send
+            
+        Returns:
+            The response
+        """
+        url = request.url
+        if request.params:
+            query = _encode_params(request.params)
+            if query:
+                url = f"{url}{'&' if '?' in url else '?'}{query}"
+        
+        try:
+            response = self.poolmanager.request(
+                request.method,
+                url,
+                body=request.body,
+                headers=self.headers,
+                timeout=_urllib3_timeout(request.timeout),
+                redirect=False,
+                preload_content=False,
+                decode_content=False,
+            )
+            try:
+                chunks = response.stream(CHUNK_SIZE, decode_content=False)
+                content, wire_size = decode_body(chunks, response.headers.get('Content-Encoding'))
+            finally:
+                response.release_conn()
+        except (NewConnectionError, ProtocolError, SSLError) as e:
+            # NewConnectionError subclasses ConnectTimeoutError, so map it first
+            raise TransportConnectionError(str(e)) from e
+        except TimeoutError as e:
+            raise TransportTimeout(str(e)) from e
+        except HTTPError as e:
+            raise TransportError(str(e)) from e
+        
+        return Response(response.status, response.headers, content, wire_size)
+    
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.poolmanager.clear()
@@ -4,8 +4,86 @@ Query Models
 Data models for API request parameters.
 """
 
-from typing import List, Optional, Dict, Any, Union
-from dataclasses import dataclass, field
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any, Tuple, Union
+from dataclasses import dataclass, fields
+from urllib.parse import urlsplit
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _normalize_text(value: Any) -> Any:
+    """Trim, collapse whitespace and fold case."""
+    if not isinstance(value, str):
+        return value
+    return _WHITESPACE.sub(' ', value).strip().casefold()
+
+
+def _normalize_host(value: Any) -> Any:
+    """Reduce a URL or domain to its lower-case host and path, without scheme, ``www.``, query or trailing slash."""
+    if not isinstance(value, str):
+        return value
+    value = value.strip().lower()
+    parts = urlsplit(value if '//' in value else '//' + value)
+    host = parts.netloc.rsplit('@', 1)[-1]
+    if host.startswith('www.'):
+        host = host[4:]
+    return host + parts.path.rstrip('/')
+
+
+def _normalize_id(value: Any) -> Any:
+    """Turn numeric strings into integers."""
+    if isinstance(value, str) and value.strip().isdecimal():
+        return int(value)
+    return value
+
+
+_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    'id': _normalize_id,
+    'npi_number': _normalize_id,
+    'linkedin_url': _normalize_host,
+    'current_employer_domain': _normalize_host,
+}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Get the dataclass field names of a query class."""
+    return tuple(f.name for f in fields(cls))
+
+
+def _canonical_value(name: str, value: Any) -> Any:
+    """Normalize one parameter value; lists are deduplicated and sorted, at any depth."""
+    if isinstance(value, (list, tuple, set)):
+        # Items may be unhashable or of mixed types, so they are compared
+        # by their canonical JSON encoding
+        items = {}
+        for item in value:
+            item = _canonical_value(name, item)
+            items.setdefault(_encode(item), item)
+        return [items[key] for key in sorted(items)]
+    return _NORMALIZERS.get(name, _normalize_text)(value)
+
+
+def _encode(value: Any) -> str:
+    """Encode a canonical value as compact JSON with sorted keys."""
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def _canonicalize(query: Any) -> Dict[str, Any]:
+    """Get the normalized parameters of a query."""
+    return {
+        name: _canonical_value(name, value)
+        for name, value in query.to_dict().items()
+    }
+
+
+def _fingerprint(canonical: Dict[str, Any]) -> str:
+    """Hash canonical parameters into a short stable hex digest."""
+    return hashlib.blake2b(_encode(canonical).encode('utf-8'), digest_size=16).hexdigest()
 
 
 @dataclass
@@ -50,16 +128,37 @@ class SearchQuery:
             Dict containing the query parameters
         """
         data = {}
-        
-        # Add parameters that are not None
-        for field_name, value in self.__dict__.items():
+        for name in _field_names(type(self)):
+            value = getattr(self, name)
             if value is not None:
-                # Convert field names to API parameter names
-                api_name = field_name.replace('_', '_')
-                data[api_name] = value
-        
+                data[name] = value
         return data
     
+    def canonical(self) -> Dict[str, Any]:
+        """
+        Get the query parameters in canonical form.
+        
+        Whitespace, case and the order and duplicates of list values are
+        normalized, and LinkedIn URLs and domains are reduced to host and
+        path, so equivalent queries give equal results.
+        
+        Returns:
+            Dict containing the normalized query parameters
+        """
+        return _canonicalize(self)
+    
+    def fingerprint(self) -> str:
+        """
+        Get a stable hash of the canonical query.
+        
+        Equivalent queries share a fingerprint in every process, so caches
+        and request coalescing can key on it.
+        
+        Returns:
+            A 32 character hex digest
+        """
+        return _fingerprint(self.canonical())
+    
     def set_name(self, names: Union[str, List[str]]) -> 'SearchQuery':
         """Set the name parameter."""
         if isinstance(names, str):
@@ -200,16 +299,37 @@ class LookupQuery:
             Dict containing the query parameters
         """
         data = {}
-        
-        # Add parameters that are not None
-        for field_name, value in self.__dict__.items():
+        for name in _field_names(type(self)):
+            value = getattr(self, name)
             if value is not None:
-                # Convert field names to API parameter names
-                api_name = field_name.replace('_', '_')
-                data[api_name] = value
-        
+                data[name] = value
         return data
     
+    def canonical(self) -> Dict[str, Any]:
+        """
+        Get the query parameters in canonical form.
+        
+        Whitespace, case and the order and duplicates of list values are
+        normalized, and LinkedIn URLs and domains are reduced to host and
+        path, so equivalent queries give equal results.
+        
+        Returns:
+            Dict containing the normalized query parameters
+        """
+        return _canonicalize(self)
+    
+    def fingerprint(self) -> str:
+        """
+        Get a stable hash of the canonical query.
+        
+        Equivalent queries share a fingerprint in every process, so caches
+        and request coalescing can key on it.
+        
+        Returns:
+            A 32 character hex digest
+        """
+        return _fingerprint(self.canonical())
+    
     def set_id(self, person_id: int) -> 'LookupQuery':
         """Set the person ID."""
         self.id = person_id
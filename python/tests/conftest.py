@@ -4,6 +4,7 @@ Pytest Configuration
 Global pytest configuration and fixtures.
 """
 
+import json
 import pytest
 import sys
 import os
@@ -14,7 +15,30 @@ from typing import Dict, Any
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from rocketreach.sdk import RocketReachClient
-from rocketreach.sdk.http import HttpClient
+from rocketreach.sdk.http import HttpClient, SingleFlight
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_response(status_code=200, json_data=None, headers=None, text=""):
+    """Build a mock response for the requests or httpx session of a client."""
+    response = Mock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.is_success = 200 <= status_code < 300
+    response.headers = headers or {}
+    response.text = text
+    response.content = json.dumps(json_data if json_data is not None else {}).encode()
+    response.num_bytes_downloaded = len(response.content)
+    return response
 
 
 @pytest.fixture
@@ -25,6 +49,11 @@ def mock_http_client():
     client.post = Mock()
     client.put = Mock()
     client.delete = Mock()
+    client.single_flight = SingleFlight()
+    client.cache = None
+    client.negative_cache = None
+    client.deadline = None
+    client.negative_ttl = 3600.0
     return client
 
 
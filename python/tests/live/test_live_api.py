@@ -215,6 +215,7 @@ class TestLiveAPIWithMock:
                 "message": "Invalid parameters"
             }
             mock_response.text = '{"error": "Bad Request"}'
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = RocketReachClient("test-key")
@@ -0,0 +1,148 @@
+"""
+Unit tests for the asyncio client classes.
+"""
+
+import pytest
+import httpx
+from unittest.mock import AsyncMock, patch
+from rocketreach.sdk import AsyncRocketReachClient
+from rocketreach.sdk.http import AsyncHttpClient
+from rocketreach.sdk.exceptions import ApiException, RateLimitException, NetworkException, InvalidApiKeyException
+from conftest import make_response
+
+
+class TestAsyncHttpClient:
+    """Test cases for AsyncHttpClient."""
+    
+    def test_init(self, valid_api_key):
+        """Test async HTTP client initialization."""
+        client = AsyncHttpClient("https://api.example.com/", valid_api_key, timeout=10)
+        
+        assert client.base_url == "https://api.example.com"
+        assert client.timeout == 10
+        assert client.session.headers['Api-Key'] == valid_api_key
+        assert 'RocketReach-Python-SDK' in client.session.headers['User-Agent']
+    
+    @pytest.mark.asyncio
+    async def test_get_request_success(self, valid_api_key):
+        """Test successful GET request."""
+        with patch('httpx.AsyncClient.request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = make_response(json_data={"success": True})
+            
+            client = AsyncHttpClient("https://api.example.com", valid_api_key)
+            result = await client.get("/test", params={"id": 1})
+            
+            assert result == {"success": True}
+            mock_request.assert_called_once_with(
+                method='GET',
+                url='https://api.example.com/test',
+                params={"id": 1},
+                content=None,
+                timeout=30
+            )
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_with_retry(self, valid_api_key):
+        """Test rate limit waits with asyncio.sleep before retrying."""
+        with patch('httpx.AsyncClient.request', new_callable=AsyncMock) as mock_request, \
+             patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            mock_request.side_effect = [
+                make_response(429, headers={'Retry-After': '2'}, text="Rate limit exceeded"),
+                make_response(json_data={"success": True}),
+            ]
+            
+            client = AsyncHttpClient("https://api.example.com", valid_api_key, retry_attempts=1)
+            result = await client.get("/test")
+            
+            assert result == {"success": True}
+            mock_sleep.assert_awaited_once_with(2)
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_exception(self, valid_api_key):
+        """Test rate limit exception once retries are exhausted."""
+        with patch('httpx.AsyncClient.request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = make_response(429, headers={'Retry-After': '60'})
+            
+            client = AsyncHttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
+            
+            with pytest.raises(RateLimitException) as exc_info:
+                await client.get("/test")
+            
+            assert exc_info.value.retry_after == 60
+    
+    @pytest.mark.asyncio
+    async def test_api_exception(self, valid_api_key):
+        """Test API exception for error responses."""
+        with patch('httpx.AsyncClient.request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = make_response(
+                404, json_data={"message": "Not found", "details": {"id": 1}}
+            )
+            
+            client = AsyncHttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
+            
+            with pytest.raises(ApiException) as exc_info:
+                await client.get("/test")
+            
+            assert exc_info.value.status_code == 404
+            assert exc_info.value.message == "Not found"
+    
+    @pytest.mark.asyncio
+    async def test_network_error_retries_with_backoff(self, valid_api_key):
+        """Test network errors are retried with exponential backoff."""
+        with patch('httpx.AsyncClient.request', new_callable=AsyncMock) as mock_request, \
+             patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+             patch('random.uniform', side_effect=lambda low, high: high):
+            mock_request.side_effect = httpx.ConnectError("refused")
+            
+            client = AsyncHttpClient("https://api.example.com", valid_api_key, retry_attempts=2, retry_delay=0.1)
+            
+            with pytest.raises(NetworkException, match="Connection error"):
+                await client.get("/test")
+            
+            assert mock_request.await_count == 3
+            assert [call[0][0] for call in mock_sleep.await_args_list] == [0.1, 0.2]
+
+
+class TestAsyncRocketReachClient:
+    """Test cases for AsyncRocketReachClient."""
+    
+    def test_init_with_empty_api_key(self):
+        """Test client initialization with empty API key raises exception."""
+        with pytest.raises(InvalidApiKeyException, match="API key cannot be empty"):
+            AsyncRocketReachClient("  ")
+    
+    @pytest.mark.asyncio
+    async def test_person_lookup(self, valid_api_key, person_response_data):
+        """Test the lookup coroutine returns a PersonResponse."""
+        client = AsyncRocketReachClient(valid_api_key)
+        client._http_client.get = AsyncMock(return_value=person_response_data)
+        
+        person = await client.person_lookup().name("John Doe").lookup()
+        
+        assert person.id == 12345
+        client._http_client.get.assert_awaited_once_with('/person/lookup', params={"name": "John Doe"}, deadline=None)
+    
+    @pytest.mark.asyncio
+    async def test_people_search(self, valid_api_key, search_response_data):
+        """Test the search coroutine posts the search payload."""
+        client = AsyncRocketReachClient(valid_api_key)
+        client._http_client.post = AsyncMock(return_value=search_response_data)
+        
+        results = await client.people_search().name("John Doe").search()
+        
+        assert results.count == 1
+        client._http_client.post.assert_awaited_once_with('/person/search', data={
+            "query": {"name": ["John Doe"]},
+            "page": 1,
+            "page_size": 10,
+            "order_by": "relevance",
+        }, idempotent=True, deadline=None)
+    
+    @pytest.mark.asyncio
+    async def test_get_account_info(self, valid_api_key, account_response_data):
+        """Test get account info coroutine."""
+        async with AsyncRocketReachClient(valid_api_key) as client:
+            client._http_client.get = AsyncMock(return_value=account_response_data)
+            
+            assert await client.get_account_info() == account_response_data
+            client._http_client.get.assert_awaited_once_with("/account")
@@ -0,0 +1,229 @@
+"""
+Unit tests for the bulk executor.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from rocketreach.sdk import BulkExecutor
+from rocketreach.sdk.http import HttpClient, InMemoryTransport, Response, TokenBucket, defer_rate_limits
+from rocketreach.sdk.exceptions import RateLimitException, ApiException
+
+
+class TestBulkExecutor:
+    """Test cases for BulkExecutor."""
+    
+    def test_results_in_input_order(self):
+        """Test results are returned in input order."""
+        executor = BulkExecutor(max_workers=4)
+        
+        results = executor.map(lambda x: x * 2, range(10))
+        
+        assert [result.value for result in results] == [x * 2 for x in range(10)]
+        assert all(result.ok for result in results)
+    
+    def test_errors_are_captured(self):
+        """Test exceptions become the result of their item."""
+        def fetch(x):
+            if x == 2:
+                raise ApiException("Not found", 404)
+            return x
+        
+        results = BulkExecutor(max_workers=2).map(fetch, [1, 2, 3])
+        
+        assert results[1].ok is False
+        assert results[1].error.status_code == 404
+        assert [results[0].value, results[2].value] == [1, 3]
+    
+    def test_rate_limited_item_is_requeued(self):
+        """Test a 429 requeues the item instead of failing it."""
+        calls = {}
+        
+        def fetch(x):
+            calls[x] = calls.get(x, 0) + 1
+            if x == 1 and calls[x] == 1:
+                raise RateLimitException(retry_after=0)
+            return x
+        
+        results = BulkExecutor(max_workers=2).map(fetch, [0, 1, 2])
+        
+        assert [result.value for result in results] == [0, 1, 2]
+        assert results[1].requeues == 1
+        assert calls[1] == 2
+    
+    def test_worker_moves_on_while_item_is_deferred(self):
+        """Test a single worker processes other items while one is deferred."""
+        order = []
+        
+        def fetch(x):
+            order.append(x)
+            if x == 0 and order.count(0) == 1:
+                raise RateLimitException(retry_after=0.05)
+            return x
+        
+        results = BulkExecutor(max_workers=1).map(fetch, [0, 1, 2])
+        
+        assert order == [0, 1, 2, 0]
+        assert all(result.ok for result in results)
+    
+    def test_requeue_limit(self):
+        """Test items throttled too often report the RateLimitException."""
+        def fetch(x):
+            raise RateLimitException(retry_after=0)
+        
+        results = BulkExecutor(max_workers=1, max_requeues=2).map(fetch, ["a"])
+        
+        assert isinstance(results[0].error, RateLimitException)
+        assert results[0].requeues == 2
+    
+    def test_429_pauses_every_worker(self):
+        """Test no worker starts a call during the Retry-After of a 429."""
+        starts = []
+        throttled_at = []
+        
+        def fetch(x):
+            starts.append(time.monotonic())
+            if x == 0 and not throttled_at:
+                time.sleep(0.05)
+                throttled_at.append(time.monotonic())
+                raise RateLimitException(retry_after=0.2)
+            time.sleep(0.1)
+            return x
+        
+        results = BulkExecutor(max_workers=4).map(fetch, range(8))
+        
+        assert all(result.ok for result in results)
+        window_start = throttled_at[0]
+        assert not [start for start in starts if window_start < start < window_start + 0.19]
+    
+    def test_client_side_deferrals_are_not_requeues(self):
+        """Test client-side limiter waits are retried without using up the requeue limit."""
+        calls = []
+        
+        def fetch(x):
+            calls.append(x)
+            if len(calls) <= 3:
+                raise RateLimitException("Client-side rate limit reached", None, None, 0)
+            return x
+        
+        results = BulkExecutor(max_workers=1, max_requeues=1).map(fetch, ["a"])
+        
+        assert results[0].ok
+        assert results[0].value == "a"
+        assert results[0].requeues == 0
+    
+    def test_token_bucket_does_not_fail_items(self):
+        """Test every item succeeds behind a real token bucket."""
+        transport = InMemoryTransport(lambda request: Response.from_json({"id": 1}))
+        client = HttpClient(
+            "https://api.example.com",
+            "key",
+            transport=transport,
+            rate_limiter=TokenBucket(200, burst=1),
+        )
+        
+        results = BulkExecutor(max_workers=8).map(lambda x: client.get("/test"), range(40))
+        
+        assert all(result.ok for result in results)
+        assert all(result.requeues == 0 for result in results)
+        assert len(transport.requests) == 40
+    
+    def test_base_exception_does_not_hang(self):
+        """Test an exception outside Exception becomes the result and the run finishes."""
+        def fetch(x):
+            if x == 1:
+                raise SystemExit(1)
+            return x
+        
+        results = BulkExecutor(max_workers=2).map(fetch, [0, 1, 2])
+        
+        assert isinstance(results[1].error, SystemExit)
+        assert [results[0].value, results[2].value] == [0, 2]
+    
+    def test_empty_input(self):
+        """Test an empty input returns no results."""
+        assert BulkExecutor().map(lambda x: x, []) == []
+    
+    def test_invalid_workers(self):
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError):
+            BulkExecutor(max_workers=0)
+
+
+class TestDeferRateLimits:
+    """Test cases for deferring rate limit waits in HttpClient."""
+    
+    def test_429_raises_instead_of_sleeping(self, valid_api_key):
+        """Test a deferred 429 raises immediately with its Retry-After."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_response = Mock()
+            mock_response.status_code = 429
+            mock_response.ok = False
+            mock_response.headers = {'Retry-After': '30'}
+            mock_response.text = "Rate limit exceeded"
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=3)
+            
+            with defer_rate_limits():
+                with pytest.raises(RateLimitException) as exc_info:
+                    client.get("/test")
+            
+            assert exc_info.value.retry_after == 30
+            assert mock_request.call_count == 1
+            mock_sleep.assert_not_called()
+    
+    def test_limiter_wait_raises_instead_of_sleeping(self, valid_api_key):
+        """Test a deferred client-side limiter wait raises and gives the token back."""
+        limiter = Mock()
+        limiter.reserve.return_value = 2.5
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            client = HttpClient("https://api.example.com", valid_api_key, rate_limiter=limiter)
+            
+            with defer_rate_limits():
+                with pytest.raises(RateLimitException) as exc_info:
+                    client.get("/test")
+            
+            assert exc_info.value.retry_after == 2.5
+            limiter.release.assert_called_once_with()
+            mock_request.assert_not_called()
+            mock_sleep.assert_not_called()
+    
+    def test_short_limiter_wait_still_sleeps(self, valid_api_key):
+        """Test limiter waits under the threshold are slept through when deferring."""
+        limiter = Mock()
+        limiter.reserve.return_value = 0.01
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.ok = True
+            mock_response.content = b"{}"
+            mock_response.headers = {}
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key, rate_limiter=limiter)
+            
+            with defer_rate_limits():
+                client.get("/test")
+            
+            mock_sleep.assert_called_once_with(0.01)
+    
+    def test_deferral_is_per_thread(self):
+        """Test deferral only applies to the thread that enabled it."""
+        from rocketreach.sdk.http.client import rate_limits_deferred
+        seen = []
+        
+        with defer_rate_limits():
+            thread = threading.Thread(target=lambda: seen.append(rate_limits_deferred()))
+            thread.start()
+            thread.join()
+            assert rate_limits_deferred() is True
+        
+        assert seen == [False]
+        assert rate_limits_deferred() is False
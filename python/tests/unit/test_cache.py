@@ -0,0 +1,463 @@
+"""
+Unit tests for the response cache.
+"""
+
+import asyncio
+import threading
+import sqlite3
+import pytest
+from unittest.mock import Mock
+from rocketreach.sdk import RocketReachClient, AsyncRocketReachClient
+from rocketreach.sdk.http import MemoryCache, SqliteCache, TieredCache
+from rocketreach.sdk.http.cache import is_final
+from rocketreach.sdk.exceptions import ApiException
+from conftest import FakeClock
+
+
+class TestIsFinal:
+    """Test cases for is_final."""
+    
+    def test_complete_response(self, person_response_data):
+        """Test a complete lookup is final."""
+        assert is_final(person_response_data)
+    
+    def test_searching_response(self, person_response_data):
+        """Test a lookup still being searched is not final."""
+        assert not is_final(dict(person_response_data, status="searching"))
+    
+    def test_searching_person_in_enrichment(self, enrich_response_data):
+        """Test an enrichment whose person is still being searched is not final."""
+        data = dict(enrich_response_data, person={"id": 1, "status": "searching"})
+        
+        assert is_final(enrich_response_data)
+        assert not is_final(data)
+
+
+class TestMemoryCache:
+    """Test cases for MemoryCache."""
+    
+    def test_hit_and_miss(self):
+        """Test reads are counted as hits and misses."""
+        cache = MemoryCache()
+        cache.set("a", {"id": 1})
+        
+        assert cache.get("a") == {"id": 1}
+        assert cache.get("b") is None
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+    
+    def test_reads_are_copies(self):
+        """Test modifying a read response does not change the cached one."""
+        cache = MemoryCache()
+        cache.set("a", {"emails": []})
+        
+        cache.get("a")["emails"].append("john@example.com")
+        
+        assert cache.get("a") == {"emails": []}
+    
+    def test_ttl(self):
+        """Test entries expire after their TTL."""
+        clock = FakeClock()
+        cache = MemoryCache(ttl=10, clock=clock)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2}, ttl=30)
+        clock.now = 10
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == {"id": 2}
+        assert cache.stats.expirations == 1
+    
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2})
+        cache.get("a")
+        cache.set("c", {"id": 3})
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": 1}
+        assert cache.stats.evictions == 1
+        assert cache.stats.entries == 2
+    
+    def test_max_bytes(self):
+        """Test entries are evicted to keep the encoded size within max_bytes."""
+        cache = MemoryCache(max_bytes=30)
+        cache.set("a", {"name": "x" * 10})
+        cache.set("b", {"name": "y" * 10})
+        
+        assert cache.get("a") is None
+        assert cache.stats.size_bytes <= 30
+    
+    def test_oversized_response_is_not_cached(self):
+        """Test a response larger than max_bytes is not cached at all."""
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", {"name": "x" * 20})
+        
+        assert cache.stats.entries == 0
+    
+    def test_overwrite_keeps_size(self):
+        """Test setting an existing key replaces its size."""
+        cache = MemoryCache()
+        cache.set("a", {"id": 1})
+        size = cache.stats.size_bytes
+        cache.set("a", {"id": 2})
+        
+        assert cache.stats.size_bytes == size
+        assert cache.get("a") == {"id": 2}
+    
+    def test_stale_ok(self):
+        """Test stale_ok reads return expired entries."""
+        clock = FakeClock()
+        cache = MemoryCache(ttl=10, clock=clock)
+        cache.set("a", {"id": 1})
+        clock.now = 20
+        
+        assert cache.get("a", stale_ok=True) == {"id": 1}
+        assert cache.get("a") is None
+
+
+class TestSqliteCache:
+    """Test cases for SqliteCache."""
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test responses survive closing and reopening the file."""
+        path = str(tmp_path / "cache.sqlite")
+        cache = SqliteCache(path)
+        cache.set("a", {"id": 1})
+        cache.close()
+        
+        reopened = SqliteCache(path)
+        
+        assert reopened.get("a") == {"id": 1}
+        assert reopened.stats.hits == 1
+    
+    def test_expands_home_directory(self, tmp_path, monkeypatch):
+        """Test a path starting with ~ is created under the home directory."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        cache = SqliteCache("~/cache.sqlite")
+        
+        assert cache.path == str(tmp_path / "cache.sqlite")
+        assert (tmp_path / "cache.sqlite").exists()
+        cache.close()
+    
+    def test_shared_between_connections(self, tmp_path):
+        """Test two open caches on one file see each other's writes."""
+        path = str(tmp_path / "cache.sqlite")
+        first = SqliteCache(path)
+        second = SqliteCache(path)
+        
+        first.set("a", {"id": 1})
+        
+        assert second.get("a") == {"id": 1}
+    
+    def test_ttl_and_stale_ok(self, tmp_path):
+        """Test expired entries are only returned to stale_ok reads."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path / "cache.sqlite"), ttl=10, clock=clock)
+        cache.set("a", {"id": 1})
+        clock.now = 20
+        
+        assert cache.get("a") is None
+        assert cache.get("a", stale_ok=True) == {"id": 1}
+    
+    def test_eviction_prefers_expired_then_least_recently_read(self, tmp_path):
+        """Test expired entries are evicted before the least recently read ones."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path / "cache.sqlite"), ttl=100, max_entries=2, clock=clock)
+        cache.set("a", {"id": 1}, ttl=5)
+        clock.now = 1
+        cache.set("b", {"id": 2})
+        clock.now = 10
+        cache.set("c", {"id": 3})
+        clock.now = 11
+        cache.get("b")
+        clock.now = 12
+        cache.set("d", {"id": 4})
+        
+        assert cache.get("a", stale_ok=True) is None
+        assert cache.get("c") is None
+        assert cache.get("b") == {"id": 2}
+        assert (cache.stats.expirations, cache.stats.evictions) == (1, 1)
+    
+    def test_recent_reads_do_not_write(self, tmp_path):
+        """Test a hit only records its read time once the stored one is a tenth of the TTL old."""
+        clock = FakeClock()
+        path = str(tmp_path / "cache.sqlite")
+        cache = SqliteCache(path, ttl=100, clock=clock)
+        cache.set("a", {"id": 1})
+        probe = sqlite3.connect(path)
+        
+        clock.now = 5
+        cache.get("a")
+        assert probe.execute("SELECT accessed_at FROM response_cache").fetchone() == (0.0,)
+        
+        clock.now = 10
+        cache.get("a")
+        assert probe.execute("SELECT accessed_at FROM response_cache").fetchone() == (10.0,)
+        probe.close()
+    
+    def test_max_bytes(self, tmp_path):
+        """Test the encoded size stays within max_bytes."""
+        cache = SqliteCache(str(tmp_path / "cache.sqlite"), max_bytes=30)
+        cache.set("a", {"name": "x" * 10})
+        cache.set("b", {"name": "y" * 10})
+        
+        assert cache.get("a") is None
+        assert cache.stats.size_bytes <= 30
+    
+    def test_compact(self, tmp_path):
+        """Test compact drops entries past their TTL plus stale_for."""
+        clock = FakeClock()
+        cache = SqliteCache(str(tmp_path / "cache.sqlite"), ttl=10, clock=clock)
+        cache.set("a", {"id": 1})
+        cache.set("b", {"id": 2}, ttl=100)
+        clock.now = 20
+        
+        assert cache.compact(stale_for=30) == 0
+        assert cache.compact() == 1
+        assert cache.stats.entries == 1
+
+
+def make_tiered_cache(tmp_path, clock):
+    """Build a tiered cache revalidating after 10 and expiring after 100 seconds."""
+    return TieredCache(
+        MemoryCache(),
+        SqliteCache(str(tmp_path / "cache.sqlite"), clock=clock),
+        soft_ttl=10,
+        hard_ttl=100,
+        clock=clock,
+    )
+
+
+class TestTieredCache:
+    """Test cases for TieredCache."""
+    
+    def test_l2_hit_fills_l1(self, tmp_path):
+        """Test an entry found in the persistent tier is copied into memory."""
+        clock = FakeClock()
+        cache = make_tiered_cache(tmp_path, clock)
+        cache.l2.set("a", {"fetched_at": 0.0, "response": {"id": 1}})
+        
+        assert cache.get("a") == {"id": 1}
+        assert cache.get("a") == {"id": 1}
+        assert (cache.l1_hits, cache.l2_hits) == (1, 1)
+    
+    def test_soft_ttl(self, tmp_path):
+        """Test entries past the soft TTL are returned and marked for revalidation."""
+        clock = FakeClock()
+        cache = make_tiered_cache(tmp_path, clock)
+        cache.set("a", {"id": 1})
+        
+        assert cache.read("a") == ({"id": 1}, False)
+        clock.now = 10
+        assert cache.read("a") == ({"id": 1}, True)
+        assert cache.stale_hits == 1
+    
+    def test_one_refresh_per_key(self, tmp_path):
+        """Test a key is not refreshed again while its refresh runs."""
+        cache = make_tiered_cache(tmp_path, FakeClock())
+        release = threading.Event()
+        refresh = Mock(side_effect=lambda: release.wait(5))
+        
+        cache.revalidate("a", refresh)
+        cache.revalidate("a", refresh)
+        release.set()
+        cache.close()
+        
+        assert refresh.call_count == 1
+        assert cache.revalidations == 1
+    
+    def test_invalid_ttls(self, tmp_path):
+        """Test a soft TTL beyond the hard TTL is rejected."""
+        with pytest.raises(ValueError):
+            TieredCache(MemoryCache(), MemoryCache(), soft_ttl=10, hard_ttl=5)
+
+
+class TestClientCache:
+    """Test cases for the cache in the endpoints."""
+    
+    def test_repeated_lookup_is_cached(self, valid_api_key, person_response_data):
+        """Test a second lookup of the same person is answered from the cache."""
+        client = RocketReachClient(valid_api_key, cache=MemoryCache())
+        client._http_client.get = Mock(return_value=person_response_data)
+        
+        first = client.person_lookup().id(12345).lookup()
+        second = client.person_lookup().id(12345).lookup()
+        
+        assert first.id == second.id == 12345
+        assert client._http_client.get.call_count == 1
+        assert (client.cache_stats.hits, client.cache_stats.misses) == (1, 1)
+    
+    def test_searching_lookup_is_not_cached(self, valid_api_key, person_response_data):
+        """Test a lookup still being searched is fetched again."""
+        client = RocketReachClient(valid_api_key, cache=MemoryCache())
+        client._http_client.get = Mock(side_effect=[
+            dict(person_response_data, status="searching"),
+            person_response_data,
+        ])
+        
+        assert client.person_lookup().id(12345).lookup().is_searching
+        assert client.person_lookup().id(12345).lookup().is_complete
+        assert client._http_client.get.call_count == 2
+    
+    def test_equivalent_lookup_is_cached(self, valid_api_key, person_response_data):
+        """Test a lookup differing only in case and whitespace is answered from the cache."""
+        client = RocketReachClient(valid_api_key, cache=MemoryCache())
+        client._http_client.get = Mock(return_value=person_response_data)
+        
+        client.person_lookup().name("John Doe").current_employer("Google").lookup()
+        client.person_lookup().name(" john  doe").current_employer("GOOGLE").lookup()
+        
+        assert client._http_client.get.call_count == 1
+    
+    def test_lookup_is_cached_under_person_id(self, valid_api_key, person_response_data):
+        """Test a lookup by email also answers a later lookup of the same person by id."""
+        client = RocketReachClient(valid_api_key, cache=MemoryCache())
+        client._http_client.get = Mock(return_value=person_response_data)
+        
+        client.person_lookup().email("john@example.com").lookup()
+        person = client.person_lookup().id(12345).lookup()
+        
+        assert person.name == "John Doe"
+        assert client._http_client.get.call_count == 1
+    
+    def test_stale_lookup_is_revalidated_in_background(self, valid_api_key, person_response_data, tmp_path):
+        """Test a stale lookup is answered from the cache and refreshed in the background."""
+        clock = FakeClock()
+        cache = make_tiered_cache(tmp_path, clock)
+        client = RocketReachClient(valid_api_key, cache=cache)
+        client._http_client.get = Mock(side_effect=[
+            person_response_data,
+            dict(person_response_data, current_title="CTO"),
+        ])
+        client.person_lookup().id(12345).lookup()
+        clock.now = 50
+        
+        stale = client.person_lookup().id(12345).lookup()
+        cache._executor.shutdown(wait=True)
+        
+        assert stale.current_title == "Software Engineer"
+        assert client.person_lookup().id(12345).lookup().current_title == "CTO"
+        assert client._http_client.get.call_count == 2
+    
+    def test_refresh_does_not_inherit_caller_deadline(self, valid_api_key, person_response_data, tmp_path):
+        """Test a background refresh runs under the client deadline, not the caller's."""
+        clock = FakeClock()
+        cache = make_tiered_cache(tmp_path, clock)
+        client = RocketReachClient(valid_api_key, cache=cache)
+        client._http_client.get = Mock(return_value=person_response_data)
+        client.person_lookup().id(12345).lookup()
+        clock.now = 50
+        
+        client.person_lookup().id(12345).lookup(deadline=0.5)
+        cache._executor.shutdown(wait=True)
+        
+        assert client._http_client.get.call_count == 2
+        assert client._http_client.get.call_args.kwargs['deadline'] is None
+        assert cache.revalidation_failures == 0
+    
+    @pytest.mark.asyncio
+    async def test_stale_async_lookup_is_revalidated_in_background(self, valid_api_key, person_response_data, tmp_path):
+        """Test a stale async lookup is refreshed in a background task."""
+        clock = FakeClock()
+        cache = make_tiered_cache(tmp_path, clock)
+        client = AsyncRocketReachClient(valid_api_key, cache=cache)
+        responses = [person_response_data, dict(person_response_data, current_title="CTO")]
+        
+        async def get(endpoint, params, deadline):
+            return responses.pop(0)
+        
+        client._http_client.get = Mock(side_effect=get)
+        await client.person_lookup().id(12345).lookup()
+        clock.now = 50
+        
+        stale = await client.person_lookup().id(12345).lookup()
+        await asyncio.gather(*cache._tasks)
+        
+        assert stale.current_title == "Software Engineer"
+        assert (await client.person_lookup().id(12345).lookup()).current_title == "CTO"
+        await client.close()
+    
+    def test_not_found_lookup_is_remembered(self, valid_api_key):
+        """Test a lookup that found no match fails again without an API call."""
+        clock = FakeClock()
+        client = RocketReachClient(valid_api_key, negative_cache=MemoryCache(ttl=86400, clock=clock), negative_ttl=60)
+        client._http_client.get = Mock(side_effect=ApiException("No match", 404, '{"message": "No match"}'))
+        
+        for _ in range(2):
+            with pytest.raises(ApiException) as exc_info:
+                client.person_lookup().email("nobody@example.com").lookup()
+            assert exc_info.value.status_code == 404
+            assert exc_info.value.message == "No match"
+        assert client._http_client.get.call_count == 1
+        
+        clock.now = 60
+        with pytest.raises(ApiException):
+            client.person_lookup().email("nobody@example.com").lookup()
+        assert client._http_client.get.call_count == 2
+    
+    def test_not_found_default_ttl(self, valid_api_key):
+        """Test a miss is remembered for an hour whatever the TTL of the negative cache."""
+        clock = FakeClock()
+        client = RocketReachClient(valid_api_key, negative_cache=MemoryCache(ttl=7 * 86400, clock=clock))
+        client._http_client.get = Mock(side_effect=ApiException("No match", 404))
+        
+        for now in (0, 3599, 3600):
+            clock.now = now
+            with pytest.raises(ApiException):
+                client.person_lookup().email("nobody@example.com").lookup()
+        assert client._http_client.get.call_count == 2
+    
+    def test_other_errors_are_not_remembered(self, valid_api_key):
+        """Test errors other than 404 are not cached."""
+        client = RocketReachClient(valid_api_key, negative_cache=MemoryCache())
+        client._http_client.get = Mock(side_effect=ApiException("Bad request", 400))
+        
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                client.person_lookup().email("nobody@example.com").lookup()
+        assert client._http_client.get.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_not_found_async_enrichment_is_remembered(self, valid_api_key):
+        """Test an enrichment that found no match fails again without an API call."""
+        client = AsyncRocketReachClient(valid_api_key, negative_cache=MemoryCache())
+        
+        async def get(endpoint, params, deadline):
+            raise ApiException("No match", 404)
+        
+        client._http_client.get = Mock(side_effect=get)
+        
+        for _ in range(2):
+            with pytest.raises(ApiException):
+                await client.person_enrich().email("nobody@example.com").enrich()
+        assert client._http_client.get.call_count == 1
+        await client.close()
+    
+    def test_no_cache_by_default(self, valid_api_key, person_response_data):
+        """Test lookups are not cached unless a cache is set."""
+        client = RocketReachClient(valid_api_key)
+        client._http_client.get = Mock(return_value=person_response_data)
+        
+        client.person_lookup().id(12345).lookup()
+        client.person_lookup().id(12345).lookup()
+        
+        assert client._http_client.get.call_count == 2
+        assert client.cache_stats is None
+    
+    @pytest.mark.asyncio
+    async def test_repeated_async_enrichment_is_cached(self, valid_api_key, enrich_response_data):
+        """Test a second enrichment of the same person is answered from the cache."""
+        client = AsyncRocketReachClient(valid_api_key, cache=MemoryCache())
+        
+        async def get(endpoint, params, deadline):
+            return enrich_response_data
+        
+        client._http_client.get = Mock(side_effect=get)
+        
+        await client.person_enrich().email("john@example.com").enrich()
+        await client.person_enrich().email("john@example.com").enrich()
+        
+        assert client._http_client.get.call_count == 1
+        assert client.cache_stats.hits == 1
+        await client.close()
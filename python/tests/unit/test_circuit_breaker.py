@@ -0,0 +1,227 @@
+"""
+Unit tests for the circuit breaker.
+"""
+
+import asyncio
+import json
+import pytest
+import requests
+from unittest.mock import AsyncMock, Mock, patch
+from rocketreach.sdk.http import HttpClient, AsyncHttpClient, CircuitBreaker
+from rocketreach.sdk.exceptions import CircuitOpenException, NetworkException, ApiException
+from conftest import FakeClock, make_response
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+    
+    def test_opens_after_consecutive_failures(self):
+        """Test the breaker opens at the failure threshold."""
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+    
+    def test_success_resets_failure_count(self):
+        """Test failures must be consecutive."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_open_breaker_fails_fast(self):
+        """Test an open breaker rejects requests with the remaining wait."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 10.0
+        
+        with pytest.raises(CircuitOpenException) as exc_info:
+            breaker.before_request()
+        
+        assert exc_info.value.retry_after == pytest.approx(20.0)
+    
+    def test_half_open_allows_single_trial(self):
+        """Test only one trial request passes a half-open breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30.0
+        
+        assert breaker.before_request() is True
+        with pytest.raises(CircuitOpenException):
+            breaker.before_request()
+        
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.before_request() is False
+    
+    def test_failed_trial_reopens(self):
+        """Test a failed half-open trial reopens the breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 30.0
+        breaker.before_request()
+        
+        breaker.record_failure()
+        
+        assert breaker.state == CircuitBreaker.OPEN
+    
+    def test_state_change_callback(self):
+        """Test every transition is reported."""
+        clock = FakeClock()
+        transitions = []
+        breaker = CircuitBreaker(
+            name="api",
+            failure_threshold=1,
+            reset_timeout=5,
+            on_state_change=lambda *args: transitions.append(args),
+            clock=clock,
+        )
+        
+        breaker.record_failure()
+        clock.now = 5.0
+        breaker.before_request()
+        breaker.record_success()
+        
+        assert transitions == [
+            ("api", "closed", "open"),
+            ("api", "open", "half_open"),
+            ("api", "half_open", "closed"),
+        ]
+
+
+class TestHttpClientCircuitBreaker:
+    """Test cases for circuit breaking inside HttpClient."""
+    
+    def test_disabled_by_default(self, valid_api_key):
+        """Test circuit breaking is opt-in."""
+        client = HttpClient("https://api.example.com", valid_api_key)
+        
+        assert client._circuit_breaker("https://api.example.com/test") is None
+    
+    def test_open_circuit_stops_retries(self, valid_api_key):
+        """Test an outage opens the circuit and later calls fail fast."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep'):
+            mock_request.side_effect = requests.exceptions.ConnectionError()
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=5,
+                                circuit_breaker_threshold=2)
+            
+            with pytest.raises(CircuitOpenException):
+                client.get("/person/lookup")
+            assert mock_request.call_count == 2
+            
+            with pytest.raises(CircuitOpenException):
+                client.get("/person/lookup")
+            assert mock_request.call_count == 2
+    
+    def test_circuits_are_per_endpoint(self, valid_api_key):
+        """Test failures on one endpoint do not open another."""
+        with patch('requests.Session.request') as mock_request:
+            mock_response = Mock()
+            mock_response.status_code = 503
+            mock_response.ok = False
+            mock_response.content = json.dumps({"message": "Unavailable"}).encode()
+            mock_response.text = "Unavailable"
+            mock_response.headers = {}
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0,
+                                circuit_breaker_threshold=1)
+            
+            with pytest.raises(ApiException):
+                client.get("/person/lookup")
+            
+            breakers = client.circuit_breakers
+            assert breakers["https://api.example.com/person/lookup"].state == CircuitBreaker.OPEN
+            assert client._circuit_breaker("https://api.example.com/account").state == CircuitBreaker.CLOSED
+    
+    def test_half_open_probe(self, valid_api_key):
+        """Test the half-open trial probes the health endpoint first."""
+        with patch('requests.Session.request') as mock_request:
+            health = Mock(status_code=200, ok=True)
+            success = Mock(status_code=200, ok=True)
+            success.content = json.dumps({"id": 1}).encode()
+            mock_request.side_effect = [health, success]
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0,
+                                circuit_breaker_threshold=1, circuit_breaker_timeout=0,
+                                circuit_breaker_probe="/health")
+            breaker = client._circuit_breaker("https://api.example.com/person/lookup")
+            breaker.record_failure()
+            
+            assert client.get("/person/lookup") == {"id": 1}
+            assert mock_request.call_args_list[0][1]['url'] == "https://api.example.com/health"
+            assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_failed_probe_fails_fast(self, valid_api_key):
+        """Test a failed probe reopens the circuit without sending the request."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = Mock(status_code=502, ok=False)
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0,
+                                circuit_breaker_threshold=1, circuit_breaker_timeout=0,
+                                circuit_breaker_probe="/health")
+            client._circuit_breaker("https://api.example.com/person/lookup").record_failure()
+            
+            with pytest.raises(CircuitOpenException, match="Health probe failed"):
+                client.get("/person/lookup")
+            assert mock_request.call_count == 1
+    
+    def test_open_circuit_does_not_take_rate_limit_token(self, valid_api_key):
+        """Test an open circuit fails before waiting for the rate limiter."""
+        limiter = Mock()
+        limiter.reserve.return_value = 5.0
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            client = HttpClient("https://api.example.com", valid_api_key, rate_limiter=limiter,
+                                circuit_breaker_threshold=1)
+            client._circuit_breaker("https://api.example.com/person/lookup").record_failure()
+            
+            with pytest.raises(CircuitOpenException):
+                client.get("/person/lookup")
+        
+        limiter.reserve.assert_not_called()
+        mock_sleep.assert_not_called()
+        mock_request.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_is_abandoned(self, valid_api_key):
+        """Test cancelling the half-open trial lets the next request take it."""
+        client = AsyncHttpClient("https://api.example.com", valid_api_key, retry_attempts=0,
+                                 circuit_breaker_threshold=1, circuit_breaker_timeout=0)
+        breaker = client._circuit_breaker("https://api.example.com/person/lookup")
+        breaker.record_failure()
+        started = asyncio.Event()
+        
+        async def hang(*args, **kwargs):
+            started.set()
+            await asyncio.Event().wait()
+        
+        with patch.object(client.session, 'request', AsyncMock(side_effect=hang)):
+            trial = asyncio.ensure_future(client.get("/person/lookup"))
+            await started.wait()
+            trial.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await trial
+        
+        with patch.object(client.session, 'request', AsyncMock(return_value=make_response(200, {"id": 1}))):
+            assert await client.get("/person/lookup") == {"id": 1}
+        assert breaker.state == CircuitBreaker.CLOSED
+        await client.close()
+    
+    def test_circuit_open_is_network_exception(self):
+        """Test callers catching NetworkException also catch open circuits."""
+        assert issubclass(CircuitOpenException, NetworkException)
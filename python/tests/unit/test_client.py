@@ -3,6 +3,7 @@ Unit tests for the RocketReachClient class.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from rocketreach.sdk.client import RocketReachClient
 from rocketreach.sdk.exceptions import InvalidApiKeyException
@@ -191,3 +192,16 @@ class TestRocketReachClient:
         
         # New instance should not have the name set
         assert search2._query.name is None
+    
+    def test_concurrent_lookups_do_not_share_queries(self, rocketreach_client):
+        """Test threads sharing one client each send their own query."""
+        rocketreach_client._http_client.get = Mock(side_effect=lambda endpoint, params, deadline: {"name": params["name"]})
+        names = [f"Person {number}" for number in range(50)]
+        
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(
+                lambda name: rocketreach_client.person_lookup().name(name).lookup(),
+                names,
+            ))
+        
+        assert [result.data["name"] for result in results] == names
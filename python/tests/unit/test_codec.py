@@ -0,0 +1,38 @@
+"""
+Unit tests for the JSON codec.
+"""
+
+import pytest
+from unittest.mock import patch
+from rocketreach.sdk.http import codec
+
+
+class TestCodec:
+    """Test cases for the JSON codec."""
+    
+    def test_round_trip(self):
+        """Test encoded bodies decode to the same data."""
+        data = {"query": {"name": ["Zoë Müller"]}, "page": 1, "page_size": 100}
+        
+        encoded = codec.dumps(data)
+        
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == data
+    
+    def test_stdlib_fallback_matches(self):
+        """Test the stdlib fallback produces the same compact bytes."""
+        data = {"query": {"name": ["Zoë Müller"]}, "page": 1}
+        fast = codec.dumps(data)
+        
+        with patch.object(codec, 'orjson', None):
+            assert codec.dumps(data) == fast
+            assert codec.loads(fast) == data
+    
+    @pytest.mark.parametrize("orjson_installed", [True, False])
+    def test_invalid_json_raises_value_error(self, orjson_installed):
+        """Test malformed bodies raise ValueError with either backend."""
+        backend = codec.orjson if orjson_installed else None
+        
+        with patch.object(codec, 'orjson', backend):
+            with pytest.raises(ValueError):
+                codec.loads(b'<html>Bad Gateway</html>')
@@ -0,0 +1,175 @@
+"""
+Unit tests for response compression.
+"""
+
+import gzip
+import json
+import threading
+import zlib
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from rocketreach.sdk.http import HttpClient, Response, TransportError, Urllib3Transport
+from rocketreach.sdk.http import compression
+from rocketreach.sdk.http.compression import (
+    CompressionMeter,
+    StreamDecoder,
+    accept_encoding_header,
+    decode_body,
+    negotiate_encodings,
+)
+
+
+PROFILES = json.dumps({"profiles": [{"id": i, "name": "John Doe", "status": "complete"} for i in range(200)]}).encode()
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Local handler answering with a gzip body, chunked on /chunked."""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def do_GET(self):
+        self.server.accept_encoding = self.headers['Accept-Encoding']
+        body = gzip.compress(PROFILES)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Encoding', 'gzip')
+        if self.path == '/chunked':
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for start in range(0, len(body), 100):
+                chunk = body[start:start + 100]
+                self.wfile.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            self.wfile.write(b'0\r\n\r\n')
+        else:
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gzip_server():
+    """Serve GzipHandler on a free local port."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def chunks(data, size=7):
+    """Split data into small chunks."""
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+class TestNegotiation:
+    """Test cases for Accept-Encoding negotiation."""
+    
+    def test_all_available_by_default(self):
+        """Test gzip and deflate are always offered, in preference order."""
+        encodings = negotiate_encodings(True)
+        
+        assert encodings[-2:] == ('gzip', 'deflate')
+        assert accept_encoding_header(encodings).endswith('gzip, deflate')
+    
+    def test_disabled(self):
+        """Test compression can be turned off."""
+        assert negotiate_encodings(False) == ()
+        assert accept_encoding_header(()) == 'identity'
+    
+    def test_explicit_order(self):
+        """Test an explicit list keeps the caller's order."""
+        assert negotiate_encodings(['Deflate', 'gzip']) == ('deflate', 'gzip')
+    
+    def test_unknown_encoding(self):
+        """Test unsupported encodings are rejected."""
+        with pytest.raises(ValueError):
+            negotiate_encodings(['lzma'])
+    
+    def test_missing_package_warns(self):
+        """Test encodings needing a missing package are dropped with a warning."""
+        with patch.object(compression, 'zstandard', None), pytest.warns(RuntimeWarning):
+            assert negotiate_encodings(['zstd', 'gzip']) == ('gzip',)
+    
+    def test_client_header(self):
+        """Test the client sends its Accept-Encoding preference."""
+        client = HttpClient("https://api.test.com", "key", accept_encoding=['gzip'])
+        
+        assert client.session.headers['Accept-Encoding'] == 'gzip'
+
+
+class TestStreamDecoder:
+    """Test cases for incremental body decoding."""
+    
+    def test_gzip(self):
+        """Test a gzip body decoded in small chunks."""
+        body = gzip.compress(PROFILES)
+        
+        assert decode_body(chunks(body), 'gzip') == (PROFILES, len(body))
+    
+    @pytest.mark.parametrize('wbits', [zlib.MAX_WBITS, -zlib.MAX_WBITS])
+    def test_deflate(self, wbits):
+        """Test zlib-wrapped and raw deflate bodies."""
+        encoder = zlib.compressobj(wbits=wbits)
+        body = encoder.compress(PROFILES) + encoder.flush()
+        
+        assert decode_body(chunks(body, 1), 'deflate')[0] == PROFILES
+    
+    def test_stacked_encodings(self):
+        """Test encodings are undone in reverse order."""
+        body = gzip.compress(zlib.compress(PROFILES))
+        
+        assert decode_body(chunks(body), 'deflate, gzip')[0] == PROFILES
+    
+    def test_identity(self):
+        """Test uncompressed bodies pass through."""
+        assert decode_body([b'{"id":', b'1}'], None) == (b'{"id":1}', 8)
+        assert decode_body([b'{}'], 'identity') == (b'{}', 2)
+    
+    def test_invalid_body(self):
+        """Test corrupt bodies raise TransportError."""
+        decoder = StreamDecoder('gzip')
+        
+        with pytest.raises(TransportError):
+            decoder.feed(b'not gzip at all')
+    
+    def test_unsupported_encoding(self):
+        """Test bodies in an unknown encoding raise TransportError."""
+        with pytest.raises(TransportError):
+            StreamDecoder('compress')
+
+
+class TestCompressionStats:
+    """Test cases for wire size measurement."""
+    
+    def test_meter(self):
+        """Test the meter adds up measured responses only."""
+        meter = CompressionMeter()
+        meter.record(Response(200, {'Content-Encoding': 'gzip'}, b'x' * 1000, 100))
+        meter.record(Response(200, {}, b'x' * 100, 100))
+        meter.record(Response(200, {}, b'x' * 100))
+        
+        stats = meter.stats
+        assert (stats.responses, stats.compressed_responses) == (2, 1)
+        assert (stats.wire_bytes, stats.decoded_bytes) == (200, 1100)
+        assert stats.saved_bytes == 900
+        assert stats.compression_ratio == pytest.approx(5.5)
+    
+    @pytest.mark.parametrize('path', ['/plain', '/chunked'])
+    @pytest.mark.parametrize('transport', [None, Urllib3Transport])
+    def test_transports_decode_and_measure(self, gzip_server, path, transport):
+        """Test gzip bodies are decoded and measured by the transports."""
+        url = f"http://127.0.0.1:{gzip_server.server_address[1]}"
+        client = HttpClient(url, "key", transport=transport() if transport else None)
+        
+        assert client.get(path) == json.loads(PROFILES)
+        
+        stats = client.compression_stats
+        assert gzip_server.accept_encoding == accept_encoding_header(client.accept_encoding)
+        assert stats.wire_bytes == len(gzip.compress(PROFILES))
+        assert stats.decoded_bytes == len(PROFILES)
+        assert stats.compressed_responses == 1
@@ -0,0 +1,171 @@
+"""
+Unit tests for the adaptive concurrency limiter.
+"""
+
+import json
+import asyncio
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from rocketreach.sdk.http import HttpClient, AdaptiveConcurrencyLimiter
+from rocketreach.sdk.exceptions import NetworkException
+from conftest import FakeClock
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+    
+    def test_slots_are_bounded_by_limit(self):
+        """Test no more than limit slots can be held."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+        
+        assert limiter.try_acquire() is not None
+        assert limiter.try_acquire() is not None
+        assert limiter.try_acquire() is None
+        assert limiter.in_flight == 2
+    
+    def test_additive_increase(self):
+        """Test a full window of successes raises the limit by one."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_tolerance=None)
+        
+        for _ in range(4):
+            limiter.release(limiter.acquire(), limiter.SUCCESS)
+        
+        assert limiter.limit == 4
+        limiter.release(limiter.acquire(), limiter.SUCCESS)
+        assert limiter.limit == 5
+    
+    def test_multiplicative_decrease_on_throttle(self):
+        """Test a 429 halves the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+        
+        limiter.release(limiter.acquire(), limiter.THROTTLED)
+        
+        assert limiter.limit == 5
+    
+    def test_decrease_counts_once_per_window(self):
+        """Test requests started before a cut do not cut again."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, clock=clock)
+        started = [limiter.acquire() for _ in range(3)]
+        clock.now = 1.0
+        
+        for started_at in started:
+            limiter.release(started_at, limiter.THROTTLED)
+        
+        assert limiter.limit == 8
+    
+    def test_limit_bounds(self):
+        """Test the limit stays within min_limit and max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3, latency_tolerance=None)
+        
+        limiter.release(limiter.acquire(), limiter.DROPPED)
+        assert limiter.limit == 2
+        
+        for _ in range(20):
+            limiter.release(limiter.acquire(), limiter.SUCCESS)
+        assert limiter.limit == 3
+    
+    def test_rising_latency_decreases_limit(self):
+        """Test a response far slower than the smoothed latency cuts the limit."""
+        clock = FakeClock()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2.0, clock=clock)
+        
+        started_at = limiter.acquire()
+        clock.now += 0.1
+        limiter.release(started_at, limiter.SUCCESS)
+        
+        started_at = limiter.acquire()
+        clock.now += 1.0
+        limiter.release(started_at, limiter.SUCCESS)
+        
+        assert limiter.limit == 5
+    
+    def test_invalid_limits(self):
+        """Test inconsistent limits are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=5, max_limit=2)
+    
+    @pytest.mark.asyncio
+    async def test_acquire_async(self):
+        """Test async acquisition takes a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        
+        started_at = await limiter.acquire_async()
+        
+        assert limiter.in_flight == 1
+        limiter.release(started_at, limiter.SUCCESS)
+        assert limiter.in_flight == 0
+
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_are_woken_in_order(self):
+        """Test coroutines waiting for a slot get one from release() in arrival order."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        started_at = await limiter.acquire_async()
+        order = []
+        
+        async def wait(number):
+            slot = await limiter.acquire_async()
+            order.append(number)
+            limiter.release(slot, limiter.SUCCESS)
+        
+        waiters = [asyncio.ensure_future(wait(number)) for number in range(3)]
+        await asyncio.sleep(0)
+        assert order == []
+        
+        limiter.release(started_at, limiter.SUCCESS)
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+        
+        assert order == [0, 1, 2]
+        assert limiter.in_flight == 0
+    
+    @pytest.mark.asyncio
+    async def test_acquire_async_timeout(self):
+        """Test a timed out coroutine leaves the queue without holding a slot."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        started_at = await limiter.acquire_async()
+        
+        assert await limiter.acquire_async(timeout=0.01) is None
+        
+        limiter.release(started_at, limiter.SUCCESS)
+        assert limiter.in_flight == 0
+        assert await limiter.acquire_async(timeout=0.01) is not None
+
+
+class TestHttpClientConcurrency:
+    """Test cases for concurrency limiting inside HttpClient."""
+    
+    def test_slot_released_with_outcome(self, valid_api_key):
+        """Test responses are reported to the limiter."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep'):
+            throttled = Mock(status_code=429, ok=False, headers={'Retry-After': '1'}, text="")
+            success = Mock(status_code=200, ok=True)
+            success.content = json.dumps({"success": True}).encode()
+            mock_request.side_effect = [throttled, success]
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=1,
+                                concurrency_limiter=limiter)
+            client.get("/test")
+        
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
+    
+    def test_slot_released_on_network_error(self, valid_api_key):
+        """Test network errors free the slot and cut the limit."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        
+        with patch('requests.Session.request') as mock_request:
+            mock_request.side_effect = requests.exceptions.Timeout()
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0,
+                                concurrency_limiter=limiter)
+            
+            with pytest.raises(NetworkException):
+                client.get("/test")
+        
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
@@ -0,0 +1,161 @@
+"""
+Unit tests for call deadlines.
+"""
+
+import pytest
+import requests
+from unittest.mock import AsyncMock, Mock, patch
+from rocketreach.sdk.http import HttpClient, AsyncHttpClient, Deadline
+from rocketreach.sdk.exceptions import ApiException, DeadlineExceededException, NetworkException, RateLimitException
+from conftest import FakeClock, make_response
+
+
+class TestDeadline:
+    """Test cases for Deadline."""
+    
+    def test_no_budget_never_expires(self):
+        """Test a deadline without a budget allows any wait."""
+        deadline = Deadline()
+        
+        deadline.ensure(10 ** 6)
+        assert deadline.remaining() is None
+        assert deadline.clamp(30) == 30
+    
+    def test_clamps_to_time_left(self):
+        """Test timeouts are cut to the time left."""
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        clock.now = 7.0
+        
+        assert deadline.remaining() == pytest.approx(3.0)
+        assert deadline.clamp(30) == pytest.approx(3.0)
+        assert deadline.clamp(1) == 1
+    
+    def test_rejects_wait_past_deadline(self):
+        """Test a wait that would outlast the deadline raises with its cause."""
+        clock = FakeClock()
+        deadline = Deadline(5.0, clock=clock)
+        cause = NetworkException("Connection error")
+        
+        deadline.ensure(4.9)
+        with pytest.raises(DeadlineExceededException) as exc_info:
+            deadline.ensure(5.0, cause)
+        
+        assert exc_info.value.deadline == 5.0
+        assert exc_info.value.__cause__ is cause
+    
+    def test_invalid_budget(self):
+        """Test a non-positive budget is rejected."""
+        with pytest.raises(ValueError):
+            Deadline(0)
+
+
+class TestHttpClientDeadline:
+    """Test cases for deadlines in HttpClient."""
+    
+    def test_separate_connect_and_read_timeouts(self):
+        """Test connect and read timeouts are sent as a pair."""
+        client = HttpClient("https://api.test.com", "key", connect_timeout=3.05, read_timeout=27)
+        
+        with patch('requests.Session.request', return_value=make_response(200)) as mock_request:
+            client.get("/test")
+        
+        assert mock_request.call_args.kwargs['timeout'] == (3.05, 27)
+    
+    def test_attempt_timeout_clamped_to_deadline(self):
+        """Test the attempt timeout never exceeds the time left."""
+        client = HttpClient("https://api.test.com", "key")
+        
+        with patch('requests.Session.request', return_value=make_response(200)) as mock_request:
+            client.get("/test", deadline=5)
+        
+        assert 4 < mock_request.call_args.kwargs['timeout'] <= 5
+    
+    def test_retry_after_past_deadline_fails_fast(self):
+        """Test a Retry-After longer than the time left raises without sleeping."""
+        client = HttpClient("https://api.test.com", "key", deadline=5)
+        
+        with patch('requests.Session.request', return_value=make_response(429, headers={'Retry-After': '60'})), \
+             patch('time.sleep') as mock_sleep:
+            with pytest.raises(DeadlineExceededException) as exc_info:
+                client.get("/test")
+        
+        mock_sleep.assert_not_called()
+        assert isinstance(exc_info.value.__cause__, RateLimitException)
+    
+    def test_backoff_past_deadline_fails_fast(self):
+        """Test retries stop once the backoff would outlast the deadline."""
+        client = HttpClient("https://api.test.com", "key", retry_attempts=5)
+        
+        with patch('requests.Session.request', side_effect=requests.exceptions.ConnectionError()) as mock_request, \
+             patch('random.uniform', return_value=10.0), \
+             patch('time.sleep') as mock_sleep:
+            with pytest.raises(DeadlineExceededException) as exc_info:
+                client.get("/test", deadline=2)
+        
+        assert mock_request.call_count == 1
+        mock_sleep.assert_not_called()
+        assert isinstance(exc_info.value.__cause__, NetworkException)
+    
+    def test_backoff_after_5xx_past_deadline_keeps_response(self):
+        """Test the 5xx response that led to the backoff is chained to the deadline error."""
+        client = HttpClient("https://api.test.com", "key", retry_attempts=3)
+        
+        with patch('requests.Session.request', return_value=make_response(503, text="Unavailable")), \
+             patch('random.uniform', return_value=10.0), \
+             patch('time.sleep') as mock_sleep:
+            with pytest.raises(DeadlineExceededException) as exc_info:
+                client.get("/test", deadline=2)
+        
+        mock_sleep.assert_not_called()
+        assert isinstance(exc_info.value.__cause__, ApiException)
+        assert exc_info.value.__cause__.status_code == 503
+    
+    def test_rate_limit_wait_past_deadline_gives_token_back(self):
+        """Test a rate limiter wait longer than the time left releases its reservation."""
+        limiter = Mock()
+        limiter.reserve.return_value = 10.0
+        client = HttpClient("https://api.test.com", "key", rate_limiter=limiter)
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            with pytest.raises(DeadlineExceededException):
+                client.get("/test", deadline=2)
+        
+        limiter.release.assert_called_once_with()
+        mock_request.assert_not_called()
+        mock_sleep.assert_not_called()
+    
+    def test_deadline_is_a_network_exception(self):
+        """Test existing NetworkException handlers also catch deadlines."""
+        assert issubclass(DeadlineExceededException, NetworkException)
+
+
+class TestAsyncHttpClientDeadline:
+    """Test cases for deadlines in AsyncHttpClient."""
+    
+    @pytest.mark.asyncio
+    async def test_retry_after_past_deadline_fails_fast(self):
+        """Test a Retry-After longer than the time left raises without sleeping."""
+        client = AsyncHttpClient("https://api.test.com", "key")
+        
+        with patch.object(client.session, 'request', AsyncMock(return_value=make_response(429, headers={'Retry-After': '60'}))), \
+             patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(DeadlineExceededException):
+                await client.get("/test", deadline=5)
+        
+        mock_sleep.assert_not_awaited()
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_separate_connect_and_read_timeouts(self):
+        """Test connect and read timeouts become an httpx.Timeout."""
+        client = AsyncHttpClient("https://api.test.com", "key", connect_timeout=2, read_timeout=20)
+        
+        with patch.object(client.session, 'request', AsyncMock(return_value=make_response(200))) as mock_request:
+            await client.get("/test")
+        
+        timeout = mock_request.call_args.kwargs['timeout']
+        assert timeout.connect == 2
+        assert timeout.read == 20
+        await client.close()
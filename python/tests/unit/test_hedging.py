@@ -0,0 +1,233 @@
+"""
+Unit tests for request hedging.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from rocketreach.sdk.http import (
+    AdaptiveConcurrencyLimiter,
+    AsyncHttpClient,
+    AsyncTransport,
+    HedgingPolicy,
+    HttpClient,
+    InMemoryTransport,
+    Response,
+    TransportConnectionError,
+)
+
+
+class SlowFirstTransport(InMemoryTransport):
+    """Transport whose first request is slow or fails, later ones answer at once."""
+    
+    def __init__(self, first_delay=0.5, first_error=None):
+        super().__init__(self.answer)
+        self.first_delay = first_delay
+        self.first_error = first_error
+        self.lock = threading.Lock()
+    
+    def answer(self, request):
+        with self.lock:
+            first = len(self.requests) == 1
+        if first:
+            time.sleep(self.first_delay)
+            if self.first_error is not None:
+                raise self.first_error
+            return Response.from_json({"copy": "primary"})
+        return Response.from_json({"copy": "hedge"})
+
+
+class AsyncSlowFirstTransport(AsyncTransport):
+    """Asyncio transport whose first request is slow."""
+    
+    def __init__(self, first_delay=0.5):
+        self.headers = {}
+        self.first_delay = first_delay
+        self.sent = 0
+        self.cancelled = 0
+    
+    async def send(self, request):
+        self.sent += 1
+        if self.sent == 1:
+            try:
+                await asyncio.sleep(self.first_delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+            return Response.from_json({"copy": "primary"})
+        return Response.from_json({"copy": "hedge"})
+
+
+def make_policy(**options):
+    """Build a policy that hedges after 20ms from the first request."""
+    options.setdefault('initial_delay', 0.02)
+    options.setdefault('max_extra_load', 1.0)
+    return HedgingPolicy(**options)
+
+
+class TestHedgingPolicy:
+    """Test cases for HedgingPolicy."""
+    
+    def test_initial_delay_until_enough_samples(self):
+        """Test the initial delay is used before the window fills."""
+        policy = HedgingPolicy(initial_delay=0.5, min_samples=3)
+        policy.record_latency(0.1)
+        policy.record_latency(0.2)
+        
+        assert policy.delay() == 0.5
+    
+    def test_percentile_delay(self):
+        """Test the delay follows the latency percentile."""
+        policy = HedgingPolicy(percentile=0.9, min_samples=10, min_delay=0)
+        for latency in range(1, 101):
+            policy.record_latency(latency / 1000)
+        
+        assert policy.delay() == pytest.approx(0.09)
+    
+    def test_min_delay(self):
+        """Test the delay never drops below min_delay."""
+        policy = HedgingPolicy(min_samples=1, min_delay=0.05)
+        policy.record_latency(0.001)
+        
+        assert policy.delay() == 0.05
+    
+    def test_extra_load_cap(self):
+        """Test hedges are capped at max_extra_load per request."""
+        policy = HedgingPolicy(max_extra_load=0.25)
+        for _ in range(8):
+            policy.record_request()
+        
+        assert [policy.try_hedge() for _ in range(3)] == [True, True, False]
+        assert (policy.hedges_sent, policy.hedges_denied) == (2, 1)
+    
+    def test_invalid_percentile(self):
+        """Test percentiles outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=95)
+
+
+class TestHedgedHttpClient:
+    """Test cases for hedging in HttpClient."""
+    
+    def test_slow_request_is_hedged(self):
+        """Test the hedge answers when the original request is slow."""
+        policy = make_policy()
+        transport = SlowFirstTransport()
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert client.get("/person/lookup", params={"id": 1}) == {"copy": "hedge"}
+        assert len(transport.requests) == 2
+        assert (policy.hedges_sent, policy.hedges_won) == (1, 1)
+        client.close()
+    
+    def test_fast_request_is_not_hedged(self):
+        """Test no hedge is sent when the answer comes in time."""
+        policy = make_policy(initial_delay=1.0)
+        transport = InMemoryTransport(lambda request: Response.from_json({"id": 1}))
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert client.get("/person/lookup") == {"id": 1}
+        assert len(transport.requests) == 1
+        assert policy.hedges_sent == 0
+    
+    def test_failed_original_waits_for_hedge(self):
+        """Test a failing original request does not fail the call while a hedge is in flight."""
+        policy = make_policy()
+        transport = SlowFirstTransport(first_delay=0.05, first_error=TransportConnectionError("reset"))
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert client.get("/person/lookup") == {"copy": "hedge"}
+    
+    def test_post_is_not_hedged(self):
+        """Test only GET requests are hedged by default."""
+        policy = make_policy()
+        transport = SlowFirstTransport(first_delay=0.05)
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert client.post("/person/search", {}) == {"copy": "primary"}
+        assert policy.requests == 0
+    
+    def test_budget_exhausted(self):
+        """Test the call waits for the original request when no hedge is allowed."""
+        policy = make_policy(max_extra_load=0.0)
+        transport = SlowFirstTransport(first_delay=0.05)
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert client.get("/person/lookup") == {"copy": "primary"}
+        assert policy.hedges_denied == 1
+    
+    def test_hedge_needs_rate_limit_token(self):
+        """Test no hedge is sent when the rate limiter asks it to wait."""
+        policy = make_policy()
+        limiter = Mock()
+        limiter.reserve.side_effect = [0.0, 0.5]
+        transport = SlowFirstTransport(first_delay=0.05)
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport, rate_limiter=limiter)
+        
+        assert client.get("/person/lookup") == {"copy": "primary"}
+        assert len(transport.requests) == 1
+        assert (policy.hedges_sent, policy.hedges_denied) == (0, 1)
+        limiter.release.assert_called_once_with()
+    
+    def test_hedge_needs_concurrency_slot(self):
+        """Test no hedge is sent when the concurrency limiter is full."""
+        policy = make_policy()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        transport = SlowFirstTransport(first_delay=0.05)
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=transport,
+                            concurrency_limiter=limiter)
+        
+        assert client.get("/person/lookup") == {"copy": "primary"}
+        assert (policy.hedges_sent, policy.hedges_denied) == (0, 1)
+        assert limiter.in_flight == 0
+    
+    def test_busy_pool_sends_on_calling_thread(self):
+        """Test requests do not queue behind busy hedge threads."""
+        policy = make_policy(max_workers=1)
+        threads = []
+        
+        def answer(request):
+            threads.append(threading.current_thread())
+            return Response.from_json({"id": 1})
+        
+        client = HttpClient("https://api.test.com", "key", hedging=policy, transport=InMemoryTransport(answer))
+        client._hedge_executor(policy)
+        client._hedge_threads.acquire()
+        
+        assert client.get("/person/lookup") == {"id": 1}
+        assert threads == [threading.current_thread()]
+        client.close()
+
+
+class TestHedgedAsyncHttpClient:
+    """Test cases for hedging in AsyncHttpClient."""
+    
+    @pytest.mark.asyncio
+    async def test_loser_is_cancelled(self):
+        """Test the slow original request is cancelled once the hedge answers."""
+        policy = make_policy()
+        transport = AsyncSlowFirstTransport()
+        client = AsyncHttpClient("https://api.test.com", "key", hedging=policy, transport=transport)
+        
+        assert await client.get("/person/lookup") == {"copy": "hedge"}
+        await asyncio.sleep(0)
+        
+        assert transport.sent == 2
+        assert transport.cancelled == 1
+        assert policy.hedges_won == 1
+    
+    @pytest.mark.asyncio
+    async def test_hedge_needs_concurrency_slot(self):
+        """Test the hedge holds a concurrency slot and is denied without one."""
+        policy = make_policy()
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        transport = AsyncSlowFirstTransport(first_delay=0.05)
+        client = AsyncHttpClient("https://api.test.com", "key", hedging=policy, transport=transport,
+                                 concurrency_limiter=limiter)
+        
+        assert await client.get("/person/lookup") == {"copy": "primary"}
+        assert transport.sent == 1
+        assert policy.hedges_denied == 1
+        assert limiter.in_flight == 0
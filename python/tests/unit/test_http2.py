@@ -0,0 +1,90 @@
+"""
+Unit tests for the HTTP/2 client.
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+from rocketreach.sdk import RocketReachClient, AsyncRocketReachClient
+from rocketreach.sdk.http import Http2Client
+from rocketreach.sdk.http.codec import dumps
+from rocketreach.sdk.exceptions import NetworkException
+from conftest import make_response
+
+
+@pytest.fixture
+def without_h2():
+    """Pretend the h2 package is not installed."""
+    with patch('rocketreach.sdk.http.httpx_transport.http2_available', return_value=False):
+        yield
+
+
+class TestHttp2Client:
+    """Test cases for Http2Client."""
+    
+    def test_falls_back_to_http1_without_h2(self, without_h2):
+        """Test a missing h2 package downgrades to HTTP/1.1 with a warning."""
+        with pytest.warns(RuntimeWarning, match="h2"):
+            client = Http2Client("https://api.test.com", "key")
+        
+        assert client.http2 is False
+        assert isinstance(client.session, httpx.Client)
+        client.close()
+    
+    def test_http2_enabled_with_h2(self):
+        """Test HTTP/2 is offered when h2 is installed."""
+        pytest.importorskip("h2")
+        client = Http2Client("https://api.test.com", "key")
+        
+        assert client.http2 is True
+        client.close()
+    
+    def test_request_success(self, without_h2):
+        """Test requests go through httpx with the encoded body."""
+        with pytest.warns(RuntimeWarning):
+            client = Http2Client("https://api.test.com", "key", connect_timeout=2, read_timeout=20)
+        
+        with patch.object(client.session, 'request', return_value=make_response(200, {"id": 1})) as mock_request:
+            result = client.post("/person/search", {"page": 1})
+        
+        assert result == {"id": 1}
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs['content'] == dumps({"page": 1})
+        assert kwargs['timeout'].connect == 2
+        assert kwargs['timeout'].read == 20
+    
+    def test_network_errors_are_mapped(self, without_h2):
+        """Test httpx errors are retried and raised as NetworkException."""
+        with pytest.warns(RuntimeWarning):
+            client = Http2Client("https://api.test.com", "key", retry_attempts=1)
+        
+        with patch.object(client.session, 'request', side_effect=httpx.ConnectError("refused")) as mock_request, \
+             patch('time.sleep'):
+            with pytest.raises(NetworkException, match="Connection error"):
+                client.get("/test")
+        
+        assert mock_request.call_count == 2
+
+
+class TestHttp2Selection:
+    """Test cases for selecting the HTTP/2 transport."""
+    
+    def test_rocketreach_client_selects_http2(self, without_h2):
+        """Test http2=True switches RocketReachClient to Http2Client."""
+        with pytest.warns(RuntimeWarning):
+            client = RocketReachClient("key", http2=True)
+        
+        assert isinstance(client._http_client, Http2Client)
+        assert client.connection_stats is None
+    
+    def test_pool_options_are_rejected(self, without_h2):
+        """Test urllib3 pool options raise instead of being silently dropped."""
+        with pytest.raises(TypeError, match="pool_maxsize, tcp_keepalive"):
+            RocketReachClient("key", http2=True, pool_maxsize=50, tcp_keepalive=30)
+    
+    def test_async_client_falls_back(self, without_h2):
+        """Test the asyncio client also falls back to HTTP/1.1."""
+        with pytest.warns(RuntimeWarning):
+            client = AsyncRocketReachClient("key", http2=True)
+        
+        assert client._http_client.http2 is False
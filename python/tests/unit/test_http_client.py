@@ -2,10 +2,12 @@
 Unit tests for the HttpClient class.
 """
 
+import json
 import pytest
 import requests
 from unittest.mock import Mock, patch, MagicMock
 from rocketreach.sdk.http.client import HttpClient
+from rocketreach.sdk.http.codec import dumps
 from rocketreach.sdk.exceptions import ApiException, RateLimitException, NetworkException
 
 
@@ -38,7 +40,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"success": True}
+            mock_response.content = json.dumps({"success": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key)
@@ -49,8 +52,9 @@ class TestHttpClient:
                 method='GET',
                 url='https://api.example.com/test',
                 params=None,
-                json=None,
-                timeout=30
+                data=None,
+                timeout=30,
+                stream=True
             )
     
     def test_post_request_success(self, valid_api_key):
@@ -59,7 +63,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"created": True}
+            mock_response.content = json.dumps({"created": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key)
@@ -71,8 +76,9 @@ class TestHttpClient:
                 method='POST',
                 url='https://api.example.com/test',
                 params=None,
-                json=data,
-                timeout=30
+                data=dumps(data),
+                timeout=30,
+                stream=True
             )
     
     def test_put_request_success(self, valid_api_key):
@@ -81,7 +87,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"updated": True}
+            mock_response.content = json.dumps({"updated": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key)
@@ -93,8 +100,9 @@ class TestHttpClient:
                 method='PUT',
                 url='https://api.example.com/test',
                 params=None,
-                json=data,
-                timeout=30
+                data=dumps(data),
+                timeout=30,
+                stream=True
             )
     
     def test_delete_request_success(self, valid_api_key):
@@ -103,7 +111,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"deleted": True}
+            mock_response.content = json.dumps({"deleted": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key)
@@ -114,8 +123,9 @@ class TestHttpClient:
                 method='DELETE',
                 url='https://api.example.com/test',
                 params=None,
-                json=None,
-                timeout=30
+                data=None,
+                timeout=30,
+                stream=True
             )
     
     def test_rate_limit_exception(self, valid_api_key):
@@ -152,7 +162,8 @@ class TestHttpClient:
             success_response = Mock()
             success_response.status_code = 200
             success_response.ok = True
-            success_response.json.return_value = {"success": True}
+            success_response.content = json.dumps({"success": True}).encode()
+            success_response.headers = {}
             
             mock_request.side_effect = [rate_limit_response, success_response]
             
@@ -169,12 +180,13 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 400
             mock_response.ok = False
-            mock_response.json.return_value = {
+            mock_response.content = json.dumps({
                 "error": "Bad Request",
                 "message": "Invalid parameters",
                 "details": {"field": "name"}
-            }
+            }).encode()
             mock_response.text = '{"error": "Bad Request"}'
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
@@ -193,11 +205,12 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 500
             mock_response.ok = False
-            mock_response.json.return_value = {
+            mock_response.content = json.dumps({
                 "error": "Internal Server Error",
                 "message": "Something went wrong"
-            }
+            }).encode()
             mock_response.text = '{"error": "Internal Server Error"}'
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
@@ -248,7 +261,8 @@ class TestHttpClient:
     def test_retry_with_exponential_backoff(self, valid_api_key):
         """Test retry with exponential backoff."""
         with patch('requests.Session.request') as mock_request, \
-             patch('time.sleep') as mock_sleep:
+             patch('time.sleep') as mock_sleep, \
+             patch('random.uniform', side_effect=lambda low, high: high):
             
             # All calls fail with network error
             mock_request.side_effect = requests.exceptions.RequestException("Network error")
@@ -261,7 +275,7 @@ class TestHttpClient:
             # Should have made 3 calls (initial + 2 retries)
             assert mock_request.call_count == 3
             
-            # Should have slept with exponential backoff: 0.1, 0.2
+            # Should have slept with exponential backoff (upper bound of the jitter): 0.1, 0.2
             expected_sleeps = [0.1, 0.2]
             actual_sleeps = [call[0][0] for call in mock_sleep.call_args_list]
             assert actual_sleeps == expected_sleeps
@@ -272,11 +286,12 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 400
             mock_response.ok = False
-            mock_response.json.return_value = {
+            mock_response.content = json.dumps({
                 "message": "Custom error message",
                 "details": {"field": "test"}
-            }
+            }).encode()
             mock_response.text = '{"message": "Custom error message"}'
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
@@ -293,8 +308,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 400
             mock_response.ok = False
-            mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_response.text = "Plain text error"
+            mock_response.content = b"Plain text error"
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=0)
@@ -333,7 +348,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"success": True}
+            mock_response.content = json.dumps({"success": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com/", valid_api_key)
@@ -350,7 +366,8 @@ class TestHttpClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.ok = True
-            mock_response.json.return_value = {"success": True}
+            mock_response.content = json.dumps({"success": True}).encode()
+            mock_response.headers = {}
             mock_request.return_value = mock_response
             
             client = HttpClient("https://api.example.com", valid_api_key)
@@ -211,6 +211,53 @@ class TestLookupQuery:
         assert query.email == "john@google.com"
 
 
+class TestQueryFingerprint:
+    """Test cases for query canonicalization and fingerprints."""
+    
+    def test_lookup_variants_share_fingerprint(self):
+        """Test case, whitespace and LinkedIn URL variants give one fingerprint."""
+        first = LookupQuery(name="  John   Doe ", linkedin_url="https://www.linkedin.com/in/JDoe/?trk=feed")
+        second = LookupQuery(name="john doe", linkedin_url="linkedin.com/in/jdoe")
+        
+        assert first.canonical() == {"name": "john doe", "linkedin_url": "linkedin.com/in/jdoe"}
+        assert first.fingerprint() == second.fingerprint()
+    
+    def test_numeric_id_strings(self):
+        """Test an id given as a string matches the integer id."""
+        assert LookupQuery(id="12345").fingerprint() == LookupQuery(id=12345).fingerprint()
+    
+    def test_search_lists_are_sorted_and_deduplicated(self):
+        """Test list order and duplicates do not change the fingerprint."""
+        first = SearchQuery(name=["Jane Doe", "John Doe", "john doe"])
+        second = SearchQuery(name=["John Doe", "Jane Doe"])
+        
+        assert first.canonical()["name"] == ["jane doe", "john doe"]
+        assert first.fingerprint() == second.fingerprint()
+    
+    def test_non_ascii_digits_are_not_ids(self):
+        """Test strings of non-ASCII digits are kept as text instead of failing int()."""
+        assert LookupQuery(id="²").canonical() == {"id": "²"}
+    
+    def test_nested_values(self):
+        """Test nested lists and dicts are canonicalized without failing."""
+        first = SearchQuery(name=[["John Doe", "Jane"], {"first": "John"}, ["jane", "john doe"]])
+        second = SearchQuery(name=[{"first": "John"}, ["jane", "John Doe"]])
+        
+        assert first.canonical()["name"] == [["jane", "john doe"], {"first": "John"}]
+        assert first.fingerprint() == second.fingerprint()
+    
+    def test_different_queries_differ(self):
+        """Test different values and pages give different fingerprints."""
+        assert LookupQuery(name="John Doe").fingerprint() != LookupQuery(name="Jane Doe").fingerprint()
+        assert SearchQuery(page=1).fingerprint() != SearchQuery(page=2).fingerprint()
+    
+    def test_to_dict_keeps_values(self):
+        """Test the request parameters are sent as given."""
+        query = LookupQuery(email=" John@Example.com ")
+        
+        assert query.to_dict() == {"email": " John@Example.com "}
+
+
 class TestSearchResponse:
     """Test cases for SearchResponse model."""
     
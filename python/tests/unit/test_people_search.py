@@ -0,0 +1,199 @@
+"""
+Unit tests for paginated people search.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from rocketreach.sdk import AsyncRocketReachClient
+from rocketreach.sdk.endpoints import PeopleSearch
+
+
+def make_pages(total, page_size):
+    """Build a fake /person/search handler serving total profiles."""
+    def post(endpoint, data, idempotent, deadline):
+        page = data["page"]
+        first = (page - 1) * page_size
+        ids = range(first, min(first + page_size, total))
+        last_page = first + page_size >= total
+        return {
+            "profiles": [{"id": profile_id} for profile_id in ids],
+            "pagination": {"start": page, "next": None if last_page else page + 1, "total": total},
+        }
+    return post
+
+
+class TestPeopleSearchPagination:
+    """Test cases for PeopleSearch.iter_pages and iter_profiles."""
+    
+    def test_iter_profiles_streams_all_pages(self, mock_http_client):
+        """Test profiles of every page are yielded in order."""
+        mock_http_client.post = Mock(side_effect=make_pages(total=25, page_size=10))
+        search = PeopleSearch(mock_http_client).name("John").page_size(10)
+        
+        profiles = list(search.iter_profiles())
+        
+        assert [profile["id"] for profile in profiles] == list(range(25))
+        assert [call.kwargs["data"]["page"] for call in mock_http_client.post.call_args_list] == [1, 2, 3]
+    
+    def test_pages_are_fetched_lazily(self, mock_http_client):
+        """Test the next page is only requested when the caller gets to it."""
+        mock_http_client.post = Mock(side_effect=make_pages(total=25, page_size=10))
+        pages = PeopleSearch(mock_http_client).iter_pages()
+        
+        first = next(pages)
+        
+        assert first.count == 10
+        assert mock_http_client.post.call_count == 1
+    
+    def test_max_results(self, mock_http_client):
+        """Test iteration stops at max_results without fetching further pages."""
+        mock_http_client.post = Mock(side_effect=make_pages(total=100, page_size=10))
+        search = PeopleSearch(mock_http_client)
+        
+        profiles = list(search.iter_profiles(max_results=15))
+        
+        assert len(profiles) == 15
+        assert mock_http_client.post.call_count == 2
+    
+    def test_query_is_not_changed(self, mock_http_client):
+        """Test paging leaves the query page untouched."""
+        mock_http_client.post = Mock(side_effect=make_pages(total=30, page_size=10))
+        search = PeopleSearch(mock_http_client).page(2)
+        
+        list(search.iter_pages())
+        
+        assert search._query.page == 2
+        assert [call.kwargs["data"]["page"] for call in mock_http_client.post.call_args_list] == [2, 3]
+    
+    def test_stops_on_pagination_not_moving_forward(self, mock_http_client):
+        """Test a next page that does not advance ends the iteration."""
+        mock_http_client.post = Mock(return_value={"profiles": [{"id": 1}], "pagination": {"next": 1}})
+        
+        assert len(list(PeopleSearch(mock_http_client).iter_pages())) == 1
+
+
+class TestPeopleSearchPrefetch:
+    """Test cases for prefetching pages in parallel."""
+    
+    def test_pages_are_yielded_in_order(self, mock_http_client):
+        """Test prefetched pages come back in page order whatever order they finish in."""
+        pages = make_pages(total=50, page_size=5)
+        
+        def post(endpoint, data, idempotent, deadline):
+            time.sleep(0.001 * (10 - data["page"]))
+            return pages(endpoint, data, idempotent, deadline)
+        
+        mock_http_client.post = Mock(side_effect=post)
+        search = PeopleSearch(mock_http_client).page_size(5)
+        
+        profiles = list(search.iter_profiles(prefetch=4))
+        
+        assert [profile["id"] for profile in profiles] == list(range(50))
+        assert mock_http_client.post.call_count == 10
+    
+    def test_window_bounds_requests_in_flight(self, mock_http_client):
+        """Test no more than prefetch pages are requested at once."""
+        pages = make_pages(total=100, page_size=10)
+        lock = threading.Lock()
+        in_flight = [0, 0]
+        
+        def post(endpoint, data, idempotent, deadline):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.005)
+            with lock:
+                in_flight[0] -= 1
+            return pages(endpoint, data, idempotent, deadline)
+        
+        mock_http_client.post = Mock(side_effect=post)
+        
+        assert len(list(PeopleSearch(mock_http_client).page_size(10).iter_pages(prefetch=3))) == 10
+        assert in_flight[1] <= 3
+    
+    def test_max_results_limits_prefetched_pages(self, mock_http_client):
+        """Test only the pages needed for max_results are requested."""
+        mock_http_client.post = Mock(side_effect=make_pages(total=1000, page_size=10))
+        search = PeopleSearch(mock_http_client).page_size(10)
+        
+        profiles = list(search.iter_profiles(max_results=35, prefetch=8))
+        
+        assert len(profiles) == 35
+        assert sorted(call.kwargs["data"]["page"] for call in mock_http_client.post.call_args_list) == [1, 2, 3, 4]
+    
+    def test_stopping_early_does_not_wait_for_requests_in_flight(self, mock_http_client):
+        """Test closing the iterator returns while prefetched pages are still loading."""
+        pages = make_pages(total=100, page_size=10)
+        release = threading.Event()
+        
+        def post(endpoint, data, idempotent, deadline):
+            if data["page"] > 1:
+                release.wait(5)
+            return pages(endpoint, data, idempotent, deadline)
+        
+        mock_http_client.post = Mock(side_effect=post)
+        iterator = PeopleSearch(mock_http_client).page_size(10).iter_pages(prefetch=3)
+        
+        next(iterator)
+        started = time.monotonic()
+        iterator.close()
+        elapsed = time.monotonic() - started
+        release.set()
+        
+        assert elapsed < 1
+    
+    def test_without_total_falls_back_to_sequential(self, mock_http_client):
+        """Test pages are fetched one by one when the response has no total."""
+        mock_http_client.post = Mock(side_effect=[
+            {"profiles": [{"id": 1}], "pagination": {"next": 2}},
+            {"profiles": [{"id": 2}], "pagination": {}},
+        ])
+        
+        profiles = list(PeopleSearch(mock_http_client).iter_profiles(prefetch=4))
+        
+        assert [profile["id"] for profile in profiles] == [1, 2]
+
+
+class TestAsyncPeopleSearchPagination:
+    """Test cases for AsyncPeopleSearch.iter_profiles."""
+    
+    @pytest.mark.asyncio
+    async def test_iter_profiles(self, valid_api_key):
+        """Test profiles of every page are yielded in order."""
+        client = AsyncRocketReachClient(valid_api_key)
+        pages = make_pages(total=12, page_size=5)
+        
+        async def post(endpoint, data, idempotent, deadline):
+            return pages(endpoint, data, idempotent, deadline)
+        
+        client._http_client.post = Mock(side_effect=post)
+        
+        profiles = [profile async for profile in client.people_search().page_size(5).iter_profiles(max_results=11)]
+        
+        assert [profile["id"] for profile in profiles] == list(range(11))
+        await client.close()
+    
+    @pytest.mark.asyncio
+    async def test_prefetch(self, valid_api_key):
+        """Test prefetched pages are fetched concurrently and yielded in order."""
+        client = AsyncRocketReachClient(valid_api_key)
+        pages = make_pages(total=40, page_size=10)
+        in_flight = [0, 0]
+        
+        async def post(endpoint, data, idempotent, deadline):
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+            await asyncio.sleep(0.01 * (5 - data["page"]))
+            in_flight[0] -= 1
+            return pages(endpoint, data, idempotent, deadline)
+        
+        client._http_client.post = Mock(side_effect=post)
+        
+        profiles = [profile async for profile in client.people_search().page_size(10).iter_profiles(prefetch=3)]
+        
+        assert [profile["id"] for profile in profiles] == list(range(40))
+        assert in_flight[1] == 3
+        await client.close()
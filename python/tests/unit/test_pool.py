@@ -0,0 +1,167 @@
+"""
+Unit tests for connection pooling.
+"""
+
+import socket
+import threading
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from rocketreach.sdk import RocketReachClient
+from rocketreach.sdk.http import HttpClient, ConnectionStats, Urllib3Transport
+from rocketreach.sdk.exceptions import ApiException, NetworkException
+from rocketreach.sdk.http.pool import keepalive_socket_options
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Local handler answering every GET with a small JSON body."""
+    
+    protocol_version = 'HTTP/1.1'
+    received = []
+    
+    def do_GET(self):
+        self.received.append((self.command, self.path, dict(self.headers), b''))
+        body = b'{"ok":true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self):
+        content = self.rfile.read(int(self.headers['Content-Length']))
+        self.received.append((self.command, self.path, dict(self.headers), content))
+        status = 404 if self.path == '/missing' else 200
+        body = content if status == 200 else b'{"message":"Not found"}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Serve KeepAliveHandler on a free local port."""
+    KeepAliveHandler.received = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionStats:
+    """Test cases for ConnectionStats."""
+    
+    def test_reuse_ratio(self):
+        """Test reused connections are the requests without a handshake."""
+        stats = ConnectionStats(requests=10, new_connections=2)
+        
+        assert stats.reused_connections == 8
+        assert stats.reuse_ratio == pytest.approx(0.8)
+    
+    def test_empty(self):
+        """Test the ratio of an unused client."""
+        assert ConnectionStats().reuse_ratio == 0.0
+
+
+class TestPooledHttpClient:
+    """Test cases for connection pooling in HttpClient."""
+    
+    def test_pool_settings_reach_adapter(self):
+        """Test pool sizing is applied to the mounted adapter."""
+        client = HttpClient("https://api.test.com", "key", pool_maxsize=32, pool_block=True)
+        
+        adapter = client.session.get_adapter("https://api.test.com/")
+        assert adapter is client.transport.adapter
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+        assert adapter.poolmanager.connection_pool_kw['block'] is True
+    
+    def test_keepalive_socket_options(self):
+        """Test TCP keep-alive is enabled on pooled connections."""
+        client = HttpClient("https://api.test.com", "key", tcp_keepalive=30)
+        
+        options = client.transport.adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert options == keepalive_socket_options(30)
+    
+    def test_connections_are_reused(self, local_server):
+        """Test sequential requests share one kept-alive connection."""
+        client = HttpClient(local_server, "key")
+        
+        for _ in range(5):
+            assert client.get("/ping") == {"ok": True}
+        
+        stats = client.connection_stats
+        assert stats.requests == 5
+        assert stats.new_connections == 1
+        
+        client.close()
+        assert client.connection_stats.requests == 5
+    
+    def test_exposed_on_rocketreach_client(self, local_server):
+        """Test pool options and stats are available on RocketReachClient."""
+        client = RocketReachClient("key", base_url=local_server, pool_maxsize=4)
+        
+        client._http_client.get("/ping")
+        
+        assert client._http_client.transport.adapter.poolmanager.connection_pool_kw['maxsize'] == 4
+        assert client.connection_stats.new_connections == 1
+
+
+class TestUrllib3Transport:
+    """Test cases for the raw urllib3 transport."""
+    
+    def test_get_with_params(self, local_server):
+        """Test query parameters and default headers reach the server."""
+        client = HttpClient(local_server, "key", transport=Urllib3Transport())
+        
+        assert client.get("/person/lookup", params={"name": "John Doe", "id": None, "tag": [1, 2]}) == {"ok": True}
+        
+        method, path, headers, _ = KeepAliveHandler.received[0]
+        assert (method, path) == ('GET', '/person/lookup?name=John+Doe&tag=1&tag=2')
+        assert headers['Api-Key'] == 'key'
+    
+    def test_post_body(self, local_server):
+        """Test the encoded JSON body is sent as is."""
+        client = HttpClient(local_server, "key", transport=Urllib3Transport())
+        
+        assert client.post("/person/search", {"query": {"name": ["John"]}}) == {"query": {"name": ["John"]}}
+        assert KeepAliveHandler.received[0][3] == b'{"query":{"name":["John"]}}'
+    
+    def test_error_responses_are_mapped(self, local_server):
+        """Test error statuses raise the same exceptions as with requests."""
+        client = HttpClient(local_server, "key", transport=Urllib3Transport())
+        
+        with pytest.raises(ApiException) as exc_info:
+            client.post("/missing", {})
+        assert exc_info.value.status_code == 404
+        assert "Not found" in str(exc_info.value)
+    
+    def test_connection_errors_are_mapped(self):
+        """Test a refused connection raises NetworkException after the retries."""
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        client = HttpClient(f"http://127.0.0.1:{port}", "key", retry_attempts=1, transport=Urllib3Transport())
+        
+        with pytest.raises(NetworkException) as exc_info:
+            client.get("/ping")
+        assert str(exc_info.value) == "Connection error"
+    
+    def test_connections_are_reused(self, local_server):
+        """Test sequential requests share one kept-alive connection."""
+        client = HttpClient(local_server, "key", transport=Urllib3Transport(pool_maxsize=2, tcp_keepalive=30))
+        
+        for _ in range(5):
+            client.get("/ping")
+        
+        assert client.connection_stats == ConnectionStats(requests=5, new_connections=1)
+        assert client.transport.poolmanager.connection_pool_kw['socket_options'] == keepalive_socket_options(30)
+        
+        client.close()
+        assert client.connection_stats.requests == 5
@@ -0,0 +1,369 @@
+"""
+Unit tests for the client-side rate limiters.
+"""
+
+import json
+import sqlite3
+import pytest
+from unittest.mock import Mock, patch
+from rocketreach.sdk import RocketReachClient
+from rocketreach.sdk.http import HttpClient, TokenBucket, SqliteRateLimiter, QuotaPacer, RateLimitState, defer_rate_limits
+from rocketreach.sdk.exceptions import RateLimitException
+from conftest import FakeClock
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    def test_burst_is_free(self):
+        """Test requests within the burst do not wait."""
+        bucket = TokenBucket(rate=2, burst=3, clock=FakeClock())
+        
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    
+    def test_reservations_queue_behind_each_other(self):
+        """Test requests beyond the burst are spaced at the configured rate."""
+        bucket = TokenBucket(rate=2, burst=1, clock=FakeClock())
+        
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+    
+    def test_refill_is_capped_at_burst(self):
+        """Test idle time does not accumulate more than the burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=5, clock=clock)
+        bucket.reserve(5)
+        
+        clock.now = 100.0
+        
+        assert bucket.available == 5
+    
+    def test_default_burst(self):
+        """Test the burst defaults to one second worth of tokens."""
+        assert TokenBucket(rate=5).burst == 5
+        assert TokenBucket(rate=0.5).burst == 1
+    
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+    
+    def test_release_returns_tokens(self):
+        """Test released tokens can be reserved again without waiting."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock)
+        
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(1.0)
+        bucket.release()
+        
+        assert bucket.reserve() == pytest.approx(1.0)
+    
+    def test_shared_bucket_per_key(self):
+        """Test clients with the same key share one bucket."""
+        first = TokenBucket.shared("shared-key-test", rate=5)
+        second = TokenBucket.shared("shared-key-test", rate=5)
+        other = TokenBucket.shared("other-key-test", rate=5)
+        
+        assert first is second
+        assert first is not other
+    
+    def test_shared_bucket_rejects_other_settings(self):
+        """Test asking for another rate or burst on a shared key is an error."""
+        TokenBucket.shared("mismatch-key-test", rate=5, burst=2)
+        
+        with pytest.raises(ValueError):
+            TokenBucket.shared("mismatch-key-test", rate=50, burst=2)
+        with pytest.raises(ValueError):
+            TokenBucket.shared("mismatch-key-test", rate=5, burst=3)
+    
+    def test_shared_registry_holds_no_plaintext_key(self):
+        """Test the registry is keyed by a digest and can be reset."""
+        TokenBucket.shared("secret-key-test", rate=5)
+        
+        assert "secret-key-test" not in TokenBucket._shared
+        TokenBucket.reset_shared()
+        assert TokenBucket.shared("secret-key-test", rate=7).rate == 7
+
+
+class TestHttpClientRateLimiting:
+    """Test cases for rate limiting inside HttpClient."""
+    
+    def test_no_rate_limiter_by_default(self, valid_api_key):
+        """Test rate limiting is opt-in."""
+        client = HttpClient("https://api.example.com", valid_api_key)
+        assert client.rate_limiter is None
+    
+    def test_clients_sharing_a_key_share_the_limiter(self):
+        """Test every RocketReachClient with the same key uses one bucket."""
+        first = RocketReachClient("rate-limit-client-key", rate_limit=10, rate_limit_burst=2)
+        second = RocketReachClient("rate-limit-client-key", rate_limit=10, rate_limit_burst=2)
+        
+        assert first._http_client.rate_limiter is second._http_client.rate_limiter
+        assert first._http_client.rate_limiter.burst == 2
+    
+    def test_waits_for_limiter_before_sending(self, valid_api_key):
+        """Test the request waits for the limiter before it is sent."""
+        limiter = Mock()
+        limiter.reserve.return_value = 0.25
+        
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.ok = True
+            mock_response.content = json.dumps({"success": True}).encode()
+            mock_response.headers = {}
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key, rate_limiter=limiter)
+            client.get("/test")
+            
+            limiter.reserve.assert_called_once_with()
+            mock_sleep.assert_called_once_with(0.25)
+
+
+class TestSqliteRateLimiter:
+    """Test cases for the cross-process SqliteRateLimiter."""
+    
+    def test_limiters_on_one_file_share_tokens(self, tmp_path):
+        """Test limiters opened separately on one file draw from one bucket."""
+        clock = FakeClock()
+        path = str(tmp_path / "limits.db")
+        first = SqliteRateLimiter(path, "worker-key", rate=2, burst=2, clock=clock)
+        second = SqliteRateLimiter(path, "worker-key", rate=2, burst=2, clock=clock)
+        
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+        assert first.reserve() == pytest.approx(0.5)
+        assert second.reserve() == pytest.approx(1.0)
+        
+        first.close()
+        second.close()
+    
+    def test_keys_are_independent(self, tmp_path):
+        """Test different API keys have separate buckets in one file."""
+        clock = FakeClock()
+        path = str(tmp_path / "limits.db")
+        first = SqliteRateLimiter(path, "key-a", rate=1, burst=1, clock=clock)
+        second = SqliteRateLimiter(path, "key-b", rate=1, burst=1, clock=clock)
+        
+        assert first.reserve() == 0.0
+        assert second.reserve() == 0.0
+    
+    def test_release_returns_tokens(self, tmp_path):
+        """Test a released token is shared back with every limiter on the file."""
+        clock = FakeClock()
+        path = str(tmp_path / "limits.db")
+        first = SqliteRateLimiter(path, "worker-key", rate=1, burst=1, clock=clock)
+        second = SqliteRateLimiter(path, "worker-key", rate=1, burst=1, clock=clock)
+        
+        assert first.reserve() == 0.0
+        first.release()
+        
+        assert second.reserve() == 0.0
+        first.close()
+        second.close()
+    
+    def test_refill_over_time(self, tmp_path):
+        """Test tokens refill with elapsed wall clock time."""
+        clock = FakeClock()
+        limiter = SqliteRateLimiter(str(tmp_path / "limits.db"), "key", rate=4, burst=1, clock=clock)
+        
+        limiter.reserve()
+        clock.now = 0.25
+        
+        assert limiter.reserve() == 0.0
+    
+    def test_api_key_not_stored(self, tmp_path):
+        """Test the raw API key is never written to disk."""
+        path = tmp_path / "limits.db"
+        limiter = SqliteRateLimiter(str(path), "secret-api-key", rate=1)
+        limiter.reserve()
+        limiter.close()
+        
+        assert b"secret-api-key" not in path.read_bytes()
+    
+    def test_http_client_uses_store(self, tmp_path, valid_api_key):
+        """Test rate_limit_store selects the cross-process limiter."""
+        client = HttpClient(
+            "https://api.example.com",
+            valid_api_key,
+            rate_limit=5,
+            rate_limit_store=str(tmp_path / "limits.db"),
+        )
+        
+        assert isinstance(client.rate_limiter, SqliteRateLimiter)
+        assert client.rate_limiter.rate == 5
+    
+    def test_http_client_closes_its_store(self, tmp_path, valid_api_key):
+        """Test closing the client closes the limiter it opened, but not a given one."""
+        client = HttpClient(
+            "https://api.example.com",
+            valid_api_key,
+            rate_limit=5,
+            rate_limit_store=str(tmp_path / "limits.db"),
+        )
+        given = SqliteRateLimiter(str(tmp_path / "given.db"), valid_api_key, rate=5)
+        other = HttpClient("https://api.example.com", valid_api_key, rate_limiter=given)
+        
+        client.close()
+        other.close()
+        
+        with pytest.raises(sqlite3.ProgrammingError):
+            client.rate_limiter.reserve()
+        assert given.reserve() == 0.0
+        given.close()
+
+
+class TestRateLimitState:
+    """Test cases for RateLimitState header parsing."""
+    
+    def test_from_x_ratelimit_headers(self):
+        """Test parsing the X-RateLimit header family."""
+        state = RateLimitState.from_headers(
+            {'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '42', 'X-RateLimit-Reset': '30'},
+            now=5.0,
+        )
+        
+        assert state == RateLimitState(limit=100, remaining=42, reset_after=30.0, observed_at=5.0)
+        assert state.reset_at == 35.0
+    
+    def test_malformed_header_falls_back_to_ietf(self):
+        """Test a malformed X-RateLimit value does not hide a valid RateLimit header."""
+        state = RateLimitState.from_headers(
+            {'X-RateLimit-Remaining': 'n/a', 'RateLimit-Remaining': '7'},
+            now=0.0,
+        )
+        
+        assert state.remaining == 7
+    
+    def test_non_finite_header_falls_back_to_ietf(self):
+        """Test nan and inf values are treated as malformed."""
+        state = RateLimitState.from_headers(
+            {'X-RateLimit-Limit': 'inf', 'X-RateLimit-Remaining': 'nan', 'RateLimit-Remaining': '7'},
+            now=0.0,
+        )
+        
+        assert state.limit is None
+        assert state.remaining == 7
+    
+    def test_from_ietf_headers_with_epoch_reset(self):
+        """Test parsing RateLimit headers with a Unix timestamp reset."""
+        state = RateLimitState.from_headers(
+            {'RateLimit-Remaining': '3', 'RateLimit-Reset': '1700000060'},
+            now=0.0,
+            wall_now=1700000000.0,
+        )
+        
+        assert state.remaining == 3
+        assert state.limit is None
+        assert state.reset_after == 60.0
+    
+    def test_no_headers(self):
+        """Test responses without quota headers yield no state."""
+        assert RateLimitState.from_headers({'Content-Type': 'application/json'}) is None
+    
+    def test_malformed_headers(self):
+        """Test malformed values are ignored."""
+        state = RateLimitState.from_headers({'X-RateLimit-Remaining': 'soon', 'X-RateLimit-Limit': '10'})
+        
+        assert state.remaining is None
+        assert state.limit == 10
+
+
+class TestQuotaPacer:
+    """Test cases for QuotaPacer."""
+    
+    def test_unpaced_above_threshold(self):
+        """Test plenty of quota does not slow requests down."""
+        clock = FakeClock()
+        pacer = QuotaPacer(threshold=0.2, clock=clock)
+        pacer.update({'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '10'})
+        
+        assert pacer.reserve() == 0.0
+    
+    def test_spreads_remaining_quota_over_window(self):
+        """Test low quota spaces requests over the rest of the window."""
+        clock = FakeClock()
+        pacer = QuotaPacer(threshold=0.2, clock=clock)
+        pacer.update({'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': '10'})
+        
+        assert pacer.reserve() == 0.0
+        assert pacer.reserve() == pytest.approx(2.0)
+        assert pacer.reserve() == pytest.approx(4.0)
+    
+    def test_released_slots_do_not_push_out_later_ones(self):
+        """Test giving back a paced slot lets the next request take it."""
+        clock = FakeClock()
+        pacer = QuotaPacer(threshold=0.2, clock=clock)
+        pacer.update({'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': '10'})
+        
+        assert pacer.reserve() == 0.0
+        for _ in range(3):
+            assert pacer.reserve() == pytest.approx(2.0)
+            pacer.release()
+        
+        assert pacer.reserve() == pytest.approx(2.0)
+        assert pacer.reserve() == pytest.approx(4.0)
+    
+    def test_deferred_calls_give_back_their_slot(self, valid_api_key):
+        """Test a deferred call returns its pacing slot to the client."""
+        client = HttpClient("https://api.example.com", valid_api_key)
+        client.quota_pacer.update({'X-RateLimit-Limit': '100', 'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': '10'})
+        client.quota_pacer.reserve()
+        
+        with patch('requests.Session.request') as mock_request:
+            for _ in range(3):
+                with defer_rate_limits():
+                    with pytest.raises(RateLimitException):
+                        client.get("/test")
+        
+        mock_request.assert_not_called()
+        assert client.quota_pacer.reserve() == pytest.approx(2.0, abs=0.1)
+    
+    def test_exhausted_quota_waits_for_reset(self):
+        """Test an exhausted quota waits until the window resets."""
+        clock = FakeClock()
+        pacer = QuotaPacer(clock=clock)
+        pacer.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '7'})
+        
+        assert pacer.reserve() == pytest.approx(7.0)
+        clock.now = 8.0
+        assert pacer.reserve() == 0.0
+    
+    def test_http_client_exposes_state(self, valid_api_key):
+        """Test HttpClient records the quota of every response."""
+        with patch('requests.Session.request') as mock_request:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.ok = True
+            mock_response.headers = {'X-RateLimit-Limit': '60', 'X-RateLimit-Remaining': '59'}
+            mock_response.content = json.dumps({}).encode()
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key)
+            assert client.rate_limit_state is None
+            
+            client.get("/test")
+            
+            assert client.rate_limit_state.limit == 60
+            assert client.rate_limit_state.remaining == 59
+    
+    def test_http_client_paces_before_sending(self, valid_api_key):
+        """Test HttpClient waits for the pacer before sending."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.ok = True
+            mock_response.content = json.dumps({}).encode()
+            mock_response.headers = {}
+            mock_request.return_value = mock_response
+            
+            client = HttpClient("https://api.example.com", valid_api_key)
+            client.quota_pacer.reserve = Mock(return_value=1.5)
+            client.get("/test")
+            
+            mock_sleep.assert_called_once_with(1.5)
@@ -0,0 +1,130 @@
+"""
+Unit tests for the retry policy.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from rocketreach.sdk.http import HttpClient, RetryBudget
+from rocketreach.sdk.http.retry import full_jitter_backoff
+from rocketreach.sdk.exceptions import ApiException
+from conftest import make_response
+
+
+class TestFullJitterBackoff:
+    """Test cases for full_jitter_backoff."""
+    
+    def test_bounds_grow_exponentially(self):
+        """Test the jitter range doubles with every attempt."""
+        upper = lambda low, high: high
+        
+        assert [full_jitter_backoff(0.5, attempt, 60, upper) for attempt in range(4)] == [0.5, 1.0, 2.0, 4.0]
+    
+    def test_capped_at_max_delay(self):
+        """Test the range never exceeds max_delay."""
+        assert full_jitter_backoff(1.0, 10, 5.0, lambda low, high: high) == 5.0
+    
+    def test_lower_bound_is_zero(self):
+        """Test the delay is drawn from zero."""
+        rand = Mock(return_value=0.3)
+        
+        full_jitter_backoff(1.0, 2, 30.0, rand)
+        
+        rand.assert_called_once_with(0, 4.0)
+
+
+class TestRetryBudget:
+    """Test cases for RetryBudget."""
+    
+    def test_reserve_allows_initial_retries(self):
+        """Test the reserve allows retries before any traffic."""
+        budget = RetryBudget(ratio=0.1, reserve=2)
+        
+        assert budget.try_spend() is True
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+        assert budget.retries_denied == 1
+    
+    def test_requests_deposit_ratio(self):
+        """Test ten requests at a 10% ratio earn one retry."""
+        budget = RetryBudget(ratio=0.1, reserve=0)
+        
+        for _ in range(10):
+            budget.record_request()
+        
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+    
+    def test_balance_is_capped(self):
+        """Test the balance does not grow past max_balance."""
+        budget = RetryBudget(ratio=1, reserve=0, max_balance=3)
+        
+        for _ in range(10):
+            budget.record_request()
+        
+        assert budget.balance == 3
+
+
+class TestHttpClientServerErrorRetries:
+    """Test cases for retrying 5xx responses inside HttpClient."""
+    
+    @pytest.mark.parametrize("status_code", [502, 503, 504])
+    def test_get_retries_transient_errors(self, valid_api_key, status_code):
+        """Test idempotent requests are retried on 502/503/504."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep') as mock_sleep:
+            mock_request.side_effect = [make_response(status_code), make_response(200, {"ok": True})]
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=2)
+            
+            assert client.get("/test") == {"ok": True}
+            assert mock_request.call_count == 2
+            assert mock_sleep.call_count == 1
+    
+    def test_post_is_not_retried_by_default(self, valid_api_key):
+        """Test non-idempotent requests fail on the first 5xx."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(503)
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=2)
+            
+            with pytest.raises(ApiException) as exc_info:
+                client.post("/test", {"a": 1})
+            
+            assert exc_info.value.status_code == 503
+            assert mock_request.call_count == 1
+    
+    def test_idempotent_post_is_retried(self, valid_api_key):
+        """Test POSTs flagged idempotent are retried."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep'):
+            mock_request.side_effect = [make_response(502), make_response(200, {"ok": True})]
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=1)
+            
+            assert client.post("/person/search", {"query": {}}, idempotent=True) == {"ok": True}
+    
+    def test_500_is_not_retried(self, valid_api_key):
+        """Test only gateway and availability errors are retried."""
+        with patch('requests.Session.request') as mock_request:
+            mock_request.return_value = make_response(500)
+            
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=2)
+            
+            with pytest.raises(ApiException):
+                client.get("/test")
+            assert mock_request.call_count == 1
+    
+    def test_exhausted_budget_stops_retries(self, valid_api_key):
+        """Test retries stop once the shared retry budget is spent."""
+        with patch('requests.Session.request') as mock_request, \
+             patch('time.sleep'):
+            mock_request.return_value = make_response(503)
+            
+            budget = RetryBudget(ratio=0, reserve=1)
+            client = HttpClient("https://api.example.com", valid_api_key, retry_attempts=5, retry_budget=budget)
+            
+            with pytest.raises(ApiException):
+                client.get("/test")
+            
+            assert mock_request.call_count == 2
+            assert budget.retries_denied == 1
@@ -0,0 +1,280 @@
+"""
+Unit tests for single-flight coalescing.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+from rocketreach.sdk import RocketReachClient, AsyncRocketReachClient
+from rocketreach.sdk.http import SingleFlight, AsyncSingleFlight, Deadline, request_key, query_key
+from rocketreach.sdk.models import LookupQuery
+from rocketreach.sdk.exceptions import ApiException, DeadlineExceededException
+
+
+def run_concurrently(group, key, call, callers=8):
+    """Start callers together and hold the call until all of them have joined."""
+    release = threading.Event()
+    
+    def blocking_call():
+        release.wait(5)
+        return call()
+    
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        futures = [executor.submit(group.do, key, blocking_call) for _ in range(callers)]
+        while group.calls + group.coalesced < callers:
+            time.sleep(0.001)
+        release.set()
+    return futures
+
+
+class TestRequestKey:
+    """Test cases for request_key."""
+    
+    def test_parameter_order_does_not_matter(self):
+        """Test identical parameters give the same key in any order."""
+        assert request_key('/person/lookup', {"name": "John", "id": 1}) == request_key('/person/lookup', {"id": 1, "name": "John"})
+    
+    def test_endpoint_is_part_of_key(self):
+        """Test the same parameters on other endpoints are not coalesced."""
+        assert request_key('/person/lookup', {"id": 1}) != request_key('/profile-company/lookup', {"id": 1})
+    
+    def test_query_key_uses_fingerprint(self):
+        """Test equivalent queries share a query key on one endpoint only."""
+        first = LookupQuery(email="John@Example.com")
+        second = LookupQuery(email="john@example.com ")
+        
+        assert query_key('/person/lookup', first) == query_key('/person/lookup', second)
+        assert query_key('/person/lookup', first) != query_key('/profile-company/lookup', first)
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+    
+    def test_identical_calls_share_one_call(self):
+        """Test concurrent callers of one key share the result."""
+        group = SingleFlight()
+        call = Mock(return_value={"id": 1})
+        
+        futures = run_concurrently(group, "key", call)
+        
+        assert [future.result() for future in futures] == [{"id": 1}] * 8
+        assert call.call_count == 1
+        assert (group.calls, group.coalesced) == (1, 7)
+    
+    def test_callers_get_their_own_copy(self):
+        """Test a caller changing its result does not change the others'."""
+        group = SingleFlight()
+        
+        results = [future.result() for future in run_concurrently(group, "key", lambda: {"emails": []}, callers=3)]
+        results[0]["emails"].append("john@example.com")
+        
+        assert results[1:] == [{"emails": []}] * 2
+    
+    def test_follower_deadline(self):
+        """Test a follower gives up waiting when its own deadline runs out."""
+        group = SingleFlight()
+        release = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(group.do, "key", lambda: release.wait(5))
+            while group.calls == 0:
+                time.sleep(0.001)
+            
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceededException):
+                group.do("key", Mock(), deadline=Deadline(0.05))
+            elapsed = time.monotonic() - started
+            release.set()
+        
+        assert elapsed < 1
+        assert leader.result() is True
+    
+    def test_exception_is_shared(self):
+        """Test every waiting caller receives the exception."""
+        group = SingleFlight()
+        call = Mock(side_effect=ApiException("Not found", 404))
+        
+        futures = run_concurrently(group, "key", call, callers=3)
+        
+        for future in futures:
+            with pytest.raises(ApiException):
+                future.result()
+        assert call.call_count == 1
+    
+    def test_timeout_of_the_call_is_shared(self):
+        """Test a TimeoutError raised by the call reaches followers unchanged."""
+        group = SingleFlight()
+        call = Mock(side_effect=TimeoutError("upstream timed out"))
+        release = threading.Event()
+        
+        def blocking_call():
+            release.wait(5)
+            return call()
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(group.do, "key", blocking_call)
+            while group.calls == 0:
+                time.sleep(0.001)
+            follower = executor.submit(group.do, "key", Mock(), Deadline(5))
+            while group.coalesced == 0:
+                time.sleep(0.001)
+            release.set()
+            
+            for future in (leader, follower):
+                with pytest.raises(TimeoutError) as exc_info:
+                    future.result()
+                assert not isinstance(exc_info.value, DeadlineExceededException)
+    
+    def test_completed_calls_are_forgotten(self):
+        """Test sequential calls are not coalesced."""
+        group = SingleFlight()
+        call = Mock(side_effect=[1, 2])
+        
+        assert (group.do("key", call), group.do("key", call)) == (1, 2)
+        assert group.coalesced == 0
+    
+    def test_disabled(self):
+        """Test a disabled group runs every call."""
+        group = SingleFlight(enabled=False)
+        call = Mock(return_value=1)
+        
+        futures = [group.do("key", call) for _ in range(3)]
+        
+        assert futures == [1, 1, 1]
+        assert call.call_count == 3
+
+
+class TestAsyncSingleFlight:
+    """Test cases for AsyncSingleFlight."""
+    
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_call(self):
+        """Test concurrent coroutines of one key share the result."""
+        group = AsyncSingleFlight()
+        calls = []
+        
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+        
+        results = await asyncio.gather(*(group.do("key", call) for _ in range(5)))
+        
+        assert results == [{"id": 1}] * 5
+        assert len(calls) == 1
+        assert group.coalesced == 4
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test the call survives the cancellation of the coroutine that started it."""
+        group = AsyncSingleFlight()
+        
+        async def call():
+            await asyncio.sleep(0.01)
+            return 1
+        
+        leader = asyncio.ensure_future(group.do("key", call))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("key", call))
+        await asyncio.sleep(0)
+        leader.cancel()
+        
+        assert await follower == 1
+    
+    @pytest.mark.asyncio
+    async def test_follower_deadline(self):
+        """Test a follower gives up waiting without cancelling the call."""
+        group = AsyncSingleFlight()
+        
+        async def call():
+            await asyncio.sleep(0.2)
+            return {"id": 1}
+        
+        leader = asyncio.ensure_future(group.do("key", call))
+        await asyncio.sleep(0)
+        
+        with pytest.raises(DeadlineExceededException):
+            await group.do("key", call, deadline=Deadline(0.01))
+        assert await leader == {"id": 1}
+
+
+    @pytest.mark.asyncio
+    async def test_timeout_of_the_call_is_shared(self):
+        """Test a TimeoutError raised by the call reaches followers without a deadline."""
+        group = AsyncSingleFlight()
+        
+        async def call():
+            await asyncio.sleep(0.01)
+            raise asyncio.TimeoutError("upstream timed out")
+        
+        results = await asyncio.gather(group.do("key", call), group.do("key", call), return_exceptions=True)
+        
+        assert [type(result) for result in results] == [asyncio.TimeoutError] * 2
+
+
+class TestClientCoalescing:
+    """Test cases for coalescing in the endpoints."""
+    
+    def test_identical_lookups_share_one_request(self, valid_api_key, person_response_data):
+        """Test threads looking up the same person send one request."""
+        client = RocketReachClient(valid_api_key)
+        release = threading.Event()
+        
+        def get(endpoint, params, deadline):
+            release.wait(5)
+            return person_response_data
+        
+        client._http_client.get = Mock(side_effect=get)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(lambda: client.person_lookup().id(12345).lookup()) for _ in range(4)]
+            while client._http_client.single_flight.calls + client.coalesced_requests < 4:
+                time.sleep(0.001)
+            release.set()
+        
+        assert [future.result().id for future in futures] == [12345] * 4
+        assert client._http_client.get.call_count == 1
+        assert client.coalesced_requests == 3
+    
+    def test_lookup_follower_keeps_its_deadline(self, valid_api_key, person_response_data):
+        """Test a lookup joining a slow call still fails at its own deadline."""
+        client = RocketReachClient(valid_api_key)
+        release = threading.Event()
+        
+        def get(endpoint, params, deadline):
+            release.wait(5)
+            return person_response_data
+        
+        client._http_client.get = Mock(side_effect=get)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(lambda: client.person_lookup().id(12345).lookup())
+            while client._http_client.single_flight.calls == 0:
+                time.sleep(0.001)
+            
+            with pytest.raises(DeadlineExceededException):
+                client.person_lookup().id(12345).lookup(deadline=0.05)
+            release.set()
+        
+        assert leader.result().id == 12345
+    
+    @pytest.mark.asyncio
+    async def test_identical_async_enrichments_share_one_request(self, valid_api_key, enrich_response_data):
+        """Test coroutines enriching the same person send one request."""
+        client = AsyncRocketReachClient(valid_api_key)
+        
+        async def get(endpoint, params, deadline):
+            await asyncio.sleep(0.01)
+            return enrich_response_data
+        
+        client._http_client.get = Mock(side_effect=get)
+        
+        results = await asyncio.gather(*(client.person_enrich().email("john@example.com").enrich() for _ in range(3)))
+        
+        assert len(results) == 3
+        assert client._http_client.get.call_count == 1
+        assert client.coalesced_requests == 2
+        await client.close()
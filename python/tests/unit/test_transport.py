@@ -0,0 +1,111 @@
+"""
+Unit tests for the sans-IO core and the transports.
+"""
+
+import pytest
+from unittest.mock import patch
+from rocketreach.sdk.http import (
+    HttpClient,
+    AsyncHttpClient,
+    InMemoryTransport,
+    AsyncInMemoryTransport,
+    Request,
+    Response,
+    TransportTimeout,
+)
+from rocketreach.sdk.http.base import Send, Sleep
+from rocketreach.sdk.exceptions import ApiException, NetworkException
+
+
+class TestResponse:
+    """Test cases for the transport Response."""
+    
+    def test_from_json(self):
+        """Test JSON responses round-trip."""
+        response = Response.from_json({"id": 1}, 201, {"X-Test": "yes"})
+        
+        assert response.status_code == 201
+        assert response.headers["X-Test"] == "yes"
+        assert response.json() == {"id": 1}
+        assert response.text == '{"id":1}'
+
+
+class TestRequestFlow:
+    """Test cases for the sans-IO request flow."""
+    
+    def test_flow_yields_actions_without_io(self):
+        """Test the flow can be driven by hand."""
+        client = HttpClient("https://api.test.com", "key", transport=InMemoryTransport(lambda request: None))
+        flow = client._request_flow('GET', '/person/lookup', params={"id": 1})
+        
+        action = next(flow)
+        assert isinstance(action, Send)
+        assert action.request == Request('GET', 'https://api.test.com/person/lookup', {"id": 1})
+        
+        action = flow.send(Response(429, {'Retry-After': '2'}))
+        assert action == Sleep(2)
+        
+        next(flow)
+        with pytest.raises(StopIteration) as stop:
+            flow.send(Response.from_json({"id": 1}))
+        assert stop.value.value == {"id": 1}
+    
+    def test_transport_errors_are_thrown_into_flow(self):
+        """Test the flow maps transport errors and backs off."""
+        client = HttpClient("https://api.test.com", "key", transport=InMemoryTransport(lambda request: None))
+        flow = client._request_flow('GET', '/test')
+        
+        next(flow)
+        with patch('random.uniform', return_value=0.5):
+            assert flow.throw(TransportTimeout("read timed out")) == Sleep(0.5)
+
+
+class TestInMemoryTransport:
+    """Test cases for clients on the in-memory transport."""
+    
+    def test_request_round_trip(self):
+        """Test the client sends encoded requests through the transport."""
+        transport = InMemoryTransport(lambda request: Response.from_json({"ok": True}))
+        client = HttpClient("https://api.test.com", "key", transport=transport)
+        
+        assert client.post("/person/search", {"page": 1}) == {"ok": True}
+        
+        request = transport.requests[0]
+        assert request.method == 'POST'
+        assert request.body == b'{"page":1}'
+        assert request.timeout == 30
+        assert transport.headers['Api-Key'] == 'key'
+    
+    def test_error_mapping(self):
+        """Test API errors and transport errors are mapped the same for every transport."""
+        responses = iter([Response.from_json({"message": "Bad name"}, 400)])
+        client = HttpClient("https://api.test.com", "key", transport=InMemoryTransport(lambda request: next(responses)))
+        
+        with pytest.raises(ApiException, match="Bad name"):
+            client.get("/test")
+        
+        def fail(request):
+            raise TransportTimeout("timed out")
+        
+        client = HttpClient("https://api.test.com", "key", retry_attempts=0, transport=InMemoryTransport(fail))
+        with pytest.raises(NetworkException, match="Request timeout"):
+            client.get("/test")
+    
+    def test_connection_stats_unsupported(self):
+        """Test transports without statistics report None."""
+        client = HttpClient("https://api.test.com", "key", transport=InMemoryTransport(lambda request: None))
+        
+        assert client.connection_stats is None
+    
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self):
+        """Test the asyncio client drives the same flow."""
+        responses = iter([Response(503), Response.from_json({"ok": True})])
+        transport = AsyncInMemoryTransport(lambda request: next(responses))
+        client = AsyncHttpClient("https://api.test.com", "key", transport=transport)
+        
+        with patch('asyncio.sleep') as mock_sleep:
+            assert await client.get("/test") == {"ok": True}
+        
+        assert len(transport.requests) == 2
+        mock_sleep.assert_called_once()